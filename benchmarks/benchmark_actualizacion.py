@@ -0,0 +1,138 @@
+"""
+Benchmark de la actualización de la ventana por rectángulos sucios.
+
+Para varias situaciones típicas (menús sin tocar, el ratón pasando por los
+botones, una partida con la cámara quieta o en movimiento y el modo
+infinito) mide, frame a frame, el tiempo de dibujar y presentar la pantalla
+y la parte de la ventana que se envía a la pantalla, de dos formas:
+
+- Ventana completa: la pantalla se dibuja entera y se presenta con
+  pygame.display.flip en cada frame, como hacía antes el bucle principal.
+- Rectángulos sucios: la pantalla solo dibuja lo que ha cambiado y se
+  presentan sus rectángulos con pygame.display.update, como Juego.ejecutar.
+
+Se usa el controlador de vídeo "dummy" de SDL, así que el tiempo no incluye
+el envío real a la pantalla; la columna de píxeles presentados indica cuánto
+trabajo se ahorra en ese paso.
+
+Uso:
+    python benchmarks/benchmark_actualizacion.py [frames]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from configuracion.config import (ANCHO_VENTANA, ALTO_VENTANA, FRAGMENTOS_EN_CACHE,
+                                  NIVELES_DIFICULTAD, TAMANO_CELDA, TAMANO_FRAGMENTO)
+from generador.laberinto import Laberinto
+from generador.mundo import MundoInfinito
+from jugador.personaje import Jugador
+from renderizador.pantalla import MenuPrincipal, PantallaInfinita, PantallaJuego
+
+
+def quieto(pantalla, frame: int) -> None:
+    """Frame sin entrada del usuario."""
+    pantalla.actualizar()
+
+
+def raton_en_botones(menu, frame: int) -> None:
+    """El ratón pasa a otro botón cada 30 frames."""
+    for i, boton in enumerate(menu.botones):
+        boton.hover = i == (frame // 30) % (len(menu.botones) + 1)
+
+
+def jugador_moviendose(pantalla, frame: int) -> None:
+    """El jugador avanza por el camino más corto hacia la meta."""
+    jugador = pantalla.jugador
+    distancias = pantalla.laberinto.distancias
+    fila, columna = getattr(jugador, "_destino", jugador.celda)
+    destino = (columna * TAMANO_CELDA + TAMANO_CELDA // 2, fila * TAMANO_CELDA + TAMANO_CELDA // 2)
+
+    # Al llegar al centro de la celda de destino, elegir la vecina más cercana a la meta
+    if jugador.posicion == destino and distancias[fila, columna] > 0:
+        vecinas = ((fila - 1, columna), (fila + 1, columna), (fila, columna - 1), (fila, columna + 1))
+        fila, columna = jugador._destino = min((v for v in vecinas if distancias[v] >= 0),
+                                               key=lambda v: distancias[v])
+        destino = (columna * TAMANO_CELDA + TAMANO_CELDA // 2, fila * TAMANO_CELDA + TAMANO_CELDA // 2)
+
+    x, y = jugador.posicion
+    jugador._moviendo_derecha = destino[0] > x
+    jugador._moviendo_izquierda = destino[0] < x
+    jugador._moviendo_abajo = destino[1] > y
+    jugador._moviendo_arriba = destino[1] < y
+    pantalla.actualizar()
+
+
+def medir(pantalla, escenario, ventana: pygame.Surface, frames: int, completa: bool) -> tuple:
+    """
+    Ejecuta frames frames de un escenario.
+
+    Returns:
+        Tupla (milisegundos por frame, fracción media de la ventana presentada).
+    """
+    area_ventana = ANCHO_VENTANA * ALTO_VENTANA
+    presentado = 0
+    pantalla.invalidar()
+    inicio = time.perf_counter()
+    for frame in range(frames):
+        escenario(pantalla, frame)
+        if completa:
+            pantalla.invalidar()
+            pantalla.dibujar(ventana)
+            pygame.display.flip()
+            presentado += area_ventana
+        else:
+            cambiados = pantalla.dibujar(ventana)
+            if cambiados:
+                pygame.display.update(cambiados)
+            presentado += sum(pygame.Rect(rect).clip(ventana.get_rect()).width *
+                              pygame.Rect(rect).clip(ventana.get_rect()).height for rect in cambiados)
+    return (time.perf_counter() - inicio) / frames * 1000, presentado / (frames * area_ventana)
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+
+    pygame.display.init()
+    pygame.font.init()
+    ventana = pygame.display.set_mode((ANCHO_VENTANA, ALTO_VENTANA))
+
+    def partida():
+        laberinto = Laberinto.desde_nivel(NIVELES_DIFICULTAD["extremo"], semilla=0)
+        pantalla = PantallaJuego(laberinto, Jugador(laberinto))
+        pantalla.temporizador.reiniciar(NIVELES_DIFICULTAD["extremo"]["tiempo_limite"])
+        return pantalla
+
+    def infinito():
+        mundo = MundoInfinito(0, TAMANO_FRAGMENTO, FRAGMENTOS_EN_CACHE)
+        return PantallaInfinita(mundo, Jugador(mundo))
+
+    escenarios = [
+        ("menú sin tocar", MenuPrincipal, quieto),
+        ("ratón en botones", MenuPrincipal, raton_en_botones),
+        ("partida, cámara quieta", partida, quieto),
+        ("partida, moviéndose", partida, jugador_moviendose),
+        ("infinito, cámara quieta", infinito, quieto),
+    ]
+
+    print(f"{'escenario':>24} {'completa (ms)':>14} {'sucios (ms)':>12} "
+          f"{'píxeles completa':>17} {'píxeles sucios':>15}")
+    for nombre, crear, escenario in escenarios:
+        tiempo_completa, area_completa = medir(crear(), escenario, ventana, frames, True)
+        tiempo_sucios, area_sucios = medir(crear(), escenario, ventana, frames, False)
+        print(f"{nombre:>24} {tiempo_completa:>14.3f} {tiempo_sucios:>12.3f} "
+              f"{area_completa:>17.1%} {area_sucios:>15.2%}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
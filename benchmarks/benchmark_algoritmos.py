@@ -0,0 +1,32 @@
+"""
+Benchmark de los algoritmos de generación registrados.
+
+Mide el tiempo de generación y el pico de memoria de cada algoritmo de
+generador.algoritmos para varios tamaños, para poder elegir el más rápido que
+dé la textura deseada en cada nivel.
+
+Uso:
+    python benchmarks/benchmark_algoritmos.py [tamano ...]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from generador.algoritmos import ALGORITMOS, medir_algoritmo
+
+
+def main() -> None:
+    tamanos = [int(arg) for arg in sys.argv[1:]] or [55, 501, 1001]
+
+    print(f"{'algoritmo':>14} {'tamano':>8} {'tiempo (s)':>12} {'memoria (MiB)':>14}")
+    for tamano in tamanos:
+        for nombre in ALGORITMOS:
+            resultado = medir_algoritmo(nombre, tamano, tamano)
+            print(f"{nombre:>14} {tamano:>8} {resultado['tiempo']:>12.3f} "
+                  f"{resultado['memoria_pico'] / 2 ** 20:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark del arranque en frío de la generación sin interfaz.
+
+Lanza varias veces procesos nuevos de Python y mide la mediana de su tiempo
+total para comparar lo que cuesta cargar el modelo del laberinto sin pygame
+con lo que costaba cuando generador.laberinto importaba pygame (y los trabajos
+por lotes acababan inicializando SDL). También mide una ejecución completa de
+python -m generador y comprueba que no carga pygame.
+
+Uso:
+    python benchmarks/benchmark_arranque_cli.py [repeticiones]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+
+def medir(argumentos: list, repeticiones: int, entorno: dict) -> float:
+    """
+    Mide la mediana del tiempo total de un proceso de Python.
+
+    Args:
+        argumentos: Argumentos del intérprete.
+        repeticiones: Número de ejecuciones.
+        entorno: Variables de entorno del proceso.
+
+    Returns:
+        Mediana del tiempo de ejecución en segundos.
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable] + argumentos, cwd=SRC, env=entorno, check=True,
+                       stdout=subprocess.DEVNULL)
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos)
+
+
+def main() -> None:
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    entorno = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+                   PYGAME_HIDE_SUPPORT_PROMPT="1")
+
+    with tempfile.TemporaryDirectory() as salida:
+        casos = [
+            ("modelo sin pygame", ["-c", "import generador.laberinto"]),
+            ("modelo + import pygame", ["-c", "import pygame; import generador.laberinto"]),
+            ("modelo + pygame.init()", ["-c", "import pygame; pygame.init(); import generador.laberinto"]),
+            ("python -m generador -n 1", ["-m", "generador", "-n", "1", "--salida", salida]),
+        ]
+
+        print(f"{'caso':>26} {'mediana (ms)':>13}")
+        tiempos = {}
+        for nombre, argumentos in casos:
+            tiempos[nombre] = medir(argumentos, repeticiones, entorno)
+            print(f"{nombre:>26} {tiempos[nombre] * 1000:>13.0f}")
+
+        ahorro = tiempos["modelo + pygame.init()"] - tiempos["modelo sin pygame"]
+        print(f"\nAhorro por proceso frente a importar e inicializar pygame: {ahorro * 1000:.0f} ms")
+
+        # La CLI no debe cargar pygame en ningún caso
+        comprobacion = subprocess.run(
+            [sys.executable, "-c",
+             "import sys; from generador.__main__ import main; "
+             f"main(['-n', '1', '--salida', {salida!r}]); "
+             "sys.exit('pygame' in sys.modules)"],
+            cwd=SRC, env=entorno, stdout=subprocess.DEVNULL)
+        print("pygame cargado por la CLI:", "sí" if comprobacion.returncode else "no")
+
+
+if __name__ == "__main__":
+    main()
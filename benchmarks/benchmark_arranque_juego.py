@@ -0,0 +1,128 @@
+"""
+Benchmark del arranque del juego.
+
+Mide dos cosas en procesos nuevos de Python:
+
+- El coste de importar el punto de entrada (src/main.py) con
+  python -X importtime, agrupado por paquete de nivel superior.
+- El tiempo hasta el primer fotograma: desde que se lanza el proceso hasta
+  que el juego llama por primera vez a pygame.display.flip o
+  pygame.display.update, usando los controladores de vídeo y audio "dummy"
+  de SDL para que no haga falta pantalla. Se muestra también la parte que
+  depende del juego: desde que pygame ya está importado hasta ese fotograma.
+
+Uso:
+    python benchmarks/benchmark_arranque_juego.py [repeticiones]
+"""
+
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# Proceso hijo: arranca el juego y termina en cuanto presenta el primer fotograma
+PRIMER_FOTOGRAMA = """
+import os, sys, time
+import pygame
+
+def _presentar(*args, **kwargs):
+    sys.stdout.write(f"{time.perf_counter() - inicio}\\n")
+    sys.stdout.flush()
+    os._exit(0)
+
+pygame.display.flip = _presentar
+pygame.display.update = _presentar
+
+inicio = time.perf_counter()
+from main import Juego
+Juego().ejecutar()
+"""
+
+
+def entorno() -> dict:
+    """
+    Variables de entorno de los procesos medidos.
+
+    Returns:
+        Copia del entorno con los controladores "dummy" de SDL.
+    """
+    return dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+                PYGAME_HIDE_SUPPORT_PROMPT="1")
+
+
+def medir_importacion() -> dict:
+    """
+    Importa main con -X importtime y agrupa el tiempo acumulado por paquete.
+
+    Returns:
+        Diccionario {paquete: microsegundos} con el tiempo acumulado de las
+        importaciones directas de main agrupadas por paquete de nivel
+        superior, más la clave "total" con el tiempo de importar main.
+    """
+    resultado = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                               cwd=SRC, env=entorno(), capture_output=True, text=True, check=True)
+
+    # Cada módulo aparece después de los que importa, sangrado según su profundidad
+    paquetes = defaultdict(int)
+    directas = []
+    for linea in resultado.stderr.splitlines():
+        coincidencia = re.match(r"import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)", linea)
+        if not coincidencia:
+            continue
+        acumulado, profundidad, modulo = (int(coincidencia.group(1)),
+                                          len(coincidencia.group(2)) // 2, coincidencia.group(3))
+        if profundidad == 1:
+            directas.append((modulo, acumulado))
+        elif profundidad == 0:
+            if modulo == "main":
+                for directa, tiempo in directas:
+                    paquetes[directa.split(".")[0]] += tiempo
+                paquetes["total"] = acumulado
+            directas = []
+    return paquetes
+
+
+def medir_primer_fotograma(repeticiones: int) -> tuple:
+    """
+    Mide la mediana del tiempo hasta el primer fotograma.
+
+    Args:
+        repeticiones: Número de ejecuciones.
+
+    Returns:
+        Tupla (total, juego) con las medianas en segundos desde el lanzamiento
+        del proceso y desde que pygame ya está importado.
+    """
+    totales = []
+    juego = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        proceso = subprocess.Popen([sys.executable, "-c", PRIMER_FOTOGRAMA], cwd=SRC,
+                                   env=entorno(), stdout=subprocess.PIPE, text=True)
+        juego.append(float(proceso.stdout.readline()))
+        totales.append(time.perf_counter() - inicio)
+        proceso.wait()
+    return statistics.median(totales), statistics.median(juego)
+
+
+def main() -> None:
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    paquetes = medir_importacion()
+    print(f"{'importación':>22} {'acumulado (ms)':>15}")
+    for paquete, microsegundos in sorted(paquetes.items(), key=lambda par: -par[1])[:12]:
+        print(f"{paquete:>22} {microsegundos / 1000:>15.1f}")
+
+    total, juego = medir_primer_fotograma(repeticiones)
+    print(f"\nTiempo hasta el primer fotograma (mediana de {repeticiones}):")
+    print(f"  desde el lanzamiento del proceso:  {total * 1000:.0f} ms")
+    print(f"  desde que pygame está importado:   {juego * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
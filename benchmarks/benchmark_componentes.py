@@ -0,0 +1,137 @@
+"""
+Benchmark de la reparación de laberintos sin solución.
+
+Genera laberintos de cada nivel de NIVELES_DIFICULTAD y de tamaños grandes
+(por defecto 1001 x 1001), cierra celdas de su camino más corto hasta que el
+inicio y la meta quedan desconectados, y compara las dos formas de volver a
+conectarlos que ha usado Laberinto._garantizar_solucion:
+
+- El pasillo en L de _crear_camino, que atraviesa todas las paredes en línea
+  recta del inicio a la meta.
+- La unión por componentes de generador.componentes, que abre el menor
+  número de paredes sueltas entre la componente del inicio y la de la meta.
+
+Para cada una muestra el tiempo de la reparación completa tal como la hace
+cada versión (detección del fallo con un BFS o con el etiquetado, reparación
+y campo de distancias final), las paredes abiertas y cuántos ciclos
+nuevos crea (el aumento del número ciclomático aristas - celdas +
+componentes), además del tiempo del etiquetado de componentes frente a un BFS.
+
+Uso:
+    python benchmarks/benchmark_componentes.py [tamano ...]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from configuracion.config import NIVELES_DIFICULTAD
+from generador.componentes import etiquetar_componentes, paredes_de_union
+from generador.distancias import calcular_distancias
+from generador.laberinto import Laberinto
+
+
+def desconectar(laberinto: Laberinto, rng: np.random.Generator) -> np.ndarray:
+    """
+    Cierra celdas del camino más corto hasta desconectar el inicio de la meta.
+
+    Returns:
+        Copia de la matriz del laberinto sin solución.
+    """
+    matriz = np.array(laberinto.matriz, dtype=np.uint8)
+    while True:
+        distancias = calcular_distancias(matriz, laberinto.meta)
+        if distancias[laberinto.inicio] < 0:
+            return matriz
+        # Bajar por el campo de distancias desde el inicio y cerrar una celda intermedia
+        celda = laberinto.inicio
+        pasos = int(rng.integers(1, distancias[laberinto.inicio]))
+        for _ in range(pasos):
+            fila, columna = celda
+            celda = min(((fila - 1, columna), (fila + 1, columna), (fila, columna - 1), (fila, columna + 1)),
+                        key=lambda v: distancias[v] if distancias[v] >= 0 else np.inf)
+        matriz[celda] = 1
+
+
+def numero_ciclomatico(matriz: np.ndarray) -> int:
+    """Número de ciclos independientes de las celdas de camino: aristas - celdas + componentes."""
+    libres = matriz == 0
+    aristas = np.count_nonzero(libres[:, :-1] & libres[:, 1:]) + np.count_nonzero(libres[:-1] & libres[1:])
+    return aristas - int(np.count_nonzero(libres)) + etiquetar_componentes(matriz)[1]
+
+
+def camino_en_l(matriz: np.ndarray, inicio: tuple, meta: tuple) -> None:
+    """Reparación anterior: BFS completo y, si falla, pasillo en L del inicio a la meta."""
+    if calcular_distancias(matriz, meta)[inicio] >= 0:
+        return
+    x, y = inicio
+    while y != meta[1]:
+        y += 1 if y < meta[1] else -1
+        matriz[x, y] = 0
+    while x != meta[0]:
+        x += 1 if x < meta[0] else -1
+        matriz[x, y] = 0
+
+
+def union_por_componentes(matriz: np.ndarray, inicio: tuple, meta: tuple) -> None:
+    """Reparación actual: etiquetar y abrir las paredes sueltas que unen las componentes."""
+    etiquetas, _ = etiquetar_componentes(matriz)
+    if etiquetas[inicio] == etiquetas[meta]:
+        return
+    paredes = paredes_de_union(matriz, inicio, meta, etiquetas)
+    matriz[paredes[:, 0], paredes[:, 1]] = 0
+
+
+def reparar(matriz: np.ndarray, inicio: tuple, meta: tuple, estrategia) -> tuple:
+    """
+    Repara una copia de la matriz igual que _garantizar_solucion.
+
+    Returns:
+        Tupla (tiempo en segundos, matriz reparada).
+    """
+    matriz = matriz.copy()
+    assert calcular_distancias(matriz, meta)[inicio] < 0
+    comienzo = time.perf_counter()
+    estrategia(matriz, inicio, meta)
+    distancias = calcular_distancias(matriz, meta)
+    tiempo = time.perf_counter() - comienzo
+    assert distancias[inicio] >= 0
+    return tiempo, matriz
+
+
+def main() -> None:
+    tamanos = [int(arg) for arg in sys.argv[1:]] or [1001]
+    rng = np.random.default_rng(0)
+
+    casos = [(nivel, Laberinto.desde_nivel(config, semilla=0))
+             for nivel, config in NIVELES_DIFICULTAD.items()]
+    casos += [(f"{tamano}x{tamano}", Laberinto(tamano, tamano, semilla=0)) for tamano in tamanos]
+
+    print(f"{'laberinto':>12} {'estrategia':>12} {'tiempo (ms)':>12} {'paredes abiertas':>17} "
+          f"{'ciclos nuevos':>14}")
+    for nombre, laberinto in casos:
+        roto = desconectar(laberinto, rng)
+        ciclos_rotos = numero_ciclomatico(roto)
+
+        for estrategia, funcion in (("en L", camino_en_l), ("componentes", union_por_componentes)):
+            tiempo, reparada = reparar(roto, laberinto.inicio, laberinto.meta, funcion)
+            abiertas = int(np.count_nonzero((roto == 1) & (reparada == 0)))
+            print(f"{nombre:>12} {estrategia:>12} {tiempo * 1000:>12.2f} {abiertas:>17} "
+                  f"{numero_ciclomatico(reparada) - ciclos_rotos:>14}")
+
+        comienzo = time.perf_counter()
+        etiquetar_componentes(roto)
+        tiempo_etiquetado = time.perf_counter() - comienzo
+        comienzo = time.perf_counter()
+        calcular_distancias(roto, laberinto.meta)
+        tiempo_bfs = time.perf_counter() - comienzo
+        print(f"{'':>12} {'etiquetado':>12} {tiempo_etiquetado * 1000:>12.2f} "
+              f"(BFS: {tiempo_bfs * 1000:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark del motor DFS de generación de laberintos.
+
+Compara la fase de excavación DFS original (conjunto de tuplas, random.shuffle
+por iteración y escrituras escalares en NumPy) con el motor basado en mapa de
+bits de generador.motor_dfs.
+
+Uso:
+    python benchmarks/benchmark_dfs.py [tamano ...]
+"""
+
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from generador.motor_dfs import generar_dfs, numero_celdas
+
+
+def dfs_original(filas: int, columnas: int) -> np.ndarray:
+    """Reproduce la fase DFS de Laberinto._generar antes del motor de mapa de bits."""
+    matriz = np.ones((filas, columnas), dtype=int)
+    direcciones = [(-2, 0), (0, 2), (2, 0), (0, -2)]
+    inicio_x = random.randrange(1, filas - 1, 2)
+    inicio_y = random.randrange(1, columnas - 1, 2)
+    matriz[inicio_x, inicio_y] = 0
+    pila = [(inicio_x, inicio_y)]
+    visitadas = set([(inicio_x, inicio_y)])
+    bifurcaciones = []
+
+    while pila:
+        x, y = pila[-1]
+        vecinos = []
+        random.shuffle(direcciones)
+        for dx, dy in direcciones:
+            nx, ny = x + dx, y + dy
+            if 1 <= nx < filas - 1 and 1 <= ny < columnas - 1:
+                if (nx, ny) not in visitadas:
+                    vecinos.append((nx, ny, dx // 2, dy // 2))
+        if vecinos:
+            if len(vecinos) > 1:
+                bifurcaciones.append((x, y, vecinos[1:]))
+            nx, ny, wx, wy = vecinos[0]
+            matriz[x + wx, y + wy] = 0
+            matriz[nx, ny] = 0
+            pila.append((nx, ny))
+            visitadas.add((nx, ny))
+        else:
+            pila.pop()
+
+    return matriz
+
+
+def dfs_motor(filas: int, columnas: int) -> np.ndarray:
+    """Ejecuta la fase DFS tal y como la hace ahora Laberinto._generar."""
+    matriz = np.zeros((filas, columnas), dtype=int)
+    rng = np.random.default_rng()
+    inicio = (2 * int(rng.integers((filas - 1) // 2)) + 1, 2 * int(rng.integers((columnas - 1) // 2)) + 1)
+    azar = rng.integers(0, 24, size=2 * numero_celdas(filas, columnas), dtype=np.uint8).tobytes()
+    celdas, _, _ = generar_dfs(filas, columnas, inicio, azar)
+    matriz[:] = np.frombuffer(celdas, dtype=np.uint8).reshape(filas, columnas)
+    return matriz
+
+
+def medir(funcion, filas: int, columnas: int) -> float:
+    """Devuelve el tiempo en segundos de una llamada a la función."""
+    inicio = time.perf_counter()
+    funcion(filas, columnas)
+    return time.perf_counter() - inicio
+
+
+def main() -> None:
+    tamanos = [int(arg) for arg in sys.argv[1:]] or [2001, 4001]
+
+    print(f"{'tamano':>10} {'original (s)':>14} {'motor (s)':>12} {'aceleracion':>12}")
+    for tamano in tamanos:
+        t_original = medir(dfs_original, tamano, tamano)
+        t_motor = medir(dfs_motor, tamano, tamano)
+        print(f"{tamano:>10} {t_original:>14.2f} {t_motor:>12.2f} {t_original / t_motor:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
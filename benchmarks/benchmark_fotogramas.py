@@ -0,0 +1,151 @@
+"""
+Benchmark del tiempo por frame de la pantalla de juego.
+
+Para cada nivel de NIVELES_DIFICULTAD y para laberintos grandes (por
+defecto 201 x 201 y 1001 x 1001) crea una PantallaJuego y mide el tiempo
+medio de dibujar un frame completo (laberinto, marcas, jugador e interfaz)
+mientras la cámara recorre el laberinto a la velocidad del jugador, de tres
+formas:
+
+- Sin capa: volviendo a dibujar todas las celdas con dibujar_laberinto en
+  cada frame sobre una superficie del tamaño del laberinto.
+- Capa completa: las celdas se dibujan una vez en una superficie del tamaño
+  del laberinto y en cada frame se copia la parte visible.
+- Capa recortada: PantallaJuego.dibujar, cuya capa solo cubre la cámara más
+  MARGEN_CAPA celdas y se desplaza con ella. Se invalida la pantalla en
+  cada frame para medir siempre el frame completo, aunque la cámara no se
+  mueva.
+
+Sin capa se mide con la vigésima parte de los frames, porque es mucho más
+lenta, y las dos primeras se omiten cuando la superficie del laberinto
+ocuparía más de LIMITE_SUPERFICIE bytes. Se muestra también la memoria de la capa. Se usa
+el controlador de vídeo "dummy" de SDL, así que no hace falta pantalla y el
+tiempo no incluye la presentación en el monitor.
+
+Uso:
+    python benchmarks/benchmark_fotogramas.py [frames] [tamano ...]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from configuracion.config import (ANCHO_VENTANA, ALTO_VENTANA, BLANCO, NIVELES_DIFICULTAD,
+                                  VELOCIDAD_JUGADOR)
+from generador.laberinto import Laberinto
+from jugador.personaje import Jugador
+from renderizador.dibujo import dibujar_celdas, dibujar_laberinto, dibujar_marcas
+from renderizador.pantalla import PantallaJuego
+
+# Mayor superficie del tamaño del laberinto que se llega a crear (512 MiB)
+LIMITE_SUPERFICIE = 512 * 1024 * 1024
+
+
+class DibujoSinCapa:
+    """Frame que vuelve a dibujar todas las celdas del laberinto."""
+
+    def __init__(self, pantalla: PantallaJuego):
+        self.superficie = pygame.Surface((pantalla.ancho_laberinto, pantalla.alto_laberinto))
+
+    def __call__(self, pantalla: PantallaJuego, superficie: pygame.Surface) -> None:
+        superficie.fill(BLANCO)
+        self.superficie.fill(BLANCO)
+        dibujar_laberinto(pantalla.laberinto, self.superficie)
+        pantalla.jugador.dibujar(self.superficie)
+        superficie.blit(self.superficie, (0, 0),
+                        (pantalla.camara_x, pantalla.camara_y, ANCHO_VENTANA, ALTO_VENTANA))
+        pantalla._dibujar_indicador_meta(superficie)
+        pantalla._dibujar_interfaz(superficie)
+
+
+class DibujoCapaCompleta(DibujoSinCapa):
+    """Frame que copia la parte visible de una capa del tamaño del laberinto."""
+
+    def __init__(self, pantalla: PantallaJuego):
+        super().__init__(pantalla)
+        self.superficie.fill(BLANCO)
+        dibujar_celdas(pantalla.laberinto, self.superficie)
+
+    def __call__(self, pantalla: PantallaJuego, superficie: pygame.Surface) -> None:
+        superficie.fill(BLANCO)
+        superficie.blit(self.superficie, (0, 0),
+                        (pantalla.camara_x, pantalla.camara_y, ANCHO_VENTANA, ALTO_VENTANA))
+        camara = (pantalla.camara_x, pantalla.camara_y)
+        dibujar_marcas(pantalla.laberinto, superficie, camara)
+        pantalla.jugador.dibujar(superficie, camara)
+        pantalla._dibujar_indicador_meta(superficie)
+        pantalla._dibujar_interfaz(superficie)
+
+
+def dibujar_capa_recortada(pantalla: PantallaJuego, superficie: pygame.Surface) -> None:
+    """Frame completo de PantallaJuego."""
+    pantalla.invalidar()
+    pantalla.dibujar(superficie)
+
+
+def medir(dibujar, pantalla: PantallaJuego, superficie: pygame.Surface, frames: int) -> float:
+    """
+    Mide el tiempo medio por frame con la cámara recorriendo el laberinto en
+    diagonal, rebotando en los bordes.
+
+    Returns:
+        Milisegundos por frame.
+    """
+    max_x = max(0, pantalla.ancho_laberinto - ANCHO_VENTANA)
+    max_y = max(0, pantalla.alto_laberinto - ALTO_VENTANA)
+    pantalla.camara_x = pantalla.camara_y = 0
+    dibujar(pantalla, superficie)
+
+    paso_x = paso_y = VELOCIDAD_JUGADOR
+    inicio = time.perf_counter()
+    for _ in range(frames):
+        if not 0 <= pantalla.camara_x + paso_x <= max_x:
+            paso_x = -paso_x
+        if not 0 <= pantalla.camara_y + paso_y <= max_y:
+            paso_y = -paso_y
+        pantalla.camara_x = max(0, min(max_x, pantalla.camara_x + paso_x))
+        pantalla.camara_y = max(0, min(max_y, pantalla.camara_y + paso_y))
+        dibujar(pantalla, superficie)
+    return (time.perf_counter() - inicio) / frames * 1000
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    tamanos = [int(arg) for arg in sys.argv[2:]] or [201, 1001]
+
+    pygame.display.init()
+    pygame.font.init()
+    ventana = pygame.display.set_mode((ANCHO_VENTANA, ALTO_VENTANA))
+
+    casos = [(nivel, Laberinto.desde_nivel(config, semilla=0))
+             for nivel, config in NIVELES_DIFICULTAD.items()]
+    casos += [(f"{tamano}x{tamano}", Laberinto(tamano, tamano, semilla=0)) for tamano in tamanos]
+
+    print(f"{'laberinto':>12} {'sin capa (ms)':>14} {'capa completa (ms)':>19} "
+          f"{'capa recortada (ms)':>20} {'MiB capa recortada (completa)':>30}")
+    for nombre, laberinto in casos:
+        pantalla = PantallaJuego(laberinto, Jugador(laberinto))
+        bytes_completa = pantalla.ancho_laberinto * pantalla.alto_laberinto * 4
+
+        if bytes_completa <= LIMITE_SUPERFICIE:
+            sin_capa = f"{medir(DibujoSinCapa(pantalla), pantalla, ventana, max(1, frames // 20)):.3f}"
+            completa = f"{medir(DibujoCapaCompleta(pantalla), pantalla, ventana, frames):.3f}"
+        else:
+            sin_capa = completa = "-"
+        recortada = medir(dibujar_capa_recortada, pantalla, ventana, frames)
+        memoria = pantalla.superficie_laberinto.get_width() * pantalla.superficie_laberinto.get_height() * 4
+        print(f"{nombre:>12} {sin_capa:>14} {completa:>19} {recortada:>20.3f} "
+              f"{f'{memoria / 2**20:.1f} ({bytes_completa / 2**20:.1f})':>30}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark de la compresión del laberinto en un grafo de pasillos.
+
+Para laberintos de cada nivel de NIVELES_DIFICULTAD y de tamaños grandes
+(por defecto 2001 x 2001) generados con cada algoritmo, muestra el número de
+celdas de camino frente a los nodos y aristas de GrafoPasillos, el tiempo de
+construir el grafo y el de resolver el laberinto con Dijkstra sobre el grafo
+ya construido frente al BFS celda a celda. Comprueba además que ambos
+caminos tienen la misma longitud.
+
+Uso:
+    python benchmarks/benchmark_grafo.py [tamano ...]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from configuracion.config import NIVELES_DIFICULTAD
+from generador.algoritmos import ALGORITMOS
+from generador.laberinto import Laberinto
+
+
+def main() -> None:
+    tamanos = [int(arg) for arg in sys.argv[1:]] or [2001]
+
+    casos = [(nivel, Laberinto.desde_nivel(config, semilla=0), 50)
+             for nivel, config in NIVELES_DIFICULTAD.items()]
+    casos += [(f"{tamano}x{tamano} {algoritmo}",
+               Laberinto(tamano, tamano, algoritmo=algoritmo, semilla=0), 1)
+              for tamano in tamanos for algoritmo in ALGORITMOS]
+
+    print(f"{'laberinto':>22} {'celdas':>9} {'nodos':>8} {'aristas':>8} {'reducción':>10} "
+          f"{'grafo (ms)':>11} {'Dijkstra (ms)':>14} {'BFS (ms)':>9}")
+    for nombre, laberinto, repeticiones in casos:
+        celdas = int(np.count_nonzero(np.asarray(laberinto.matriz) == 0))
+
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            grafo = laberinto.grafo_pasillos()
+        tiempo_grafo = (time.perf_counter() - inicio) / repeticiones
+
+        # La primera consulta convierte el CSR a listas; se mide aparte
+        grafo.resolver(laberinto.inicio, laberinto.meta)
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            camino_grafo, _ = grafo.resolver(laberinto.inicio, laberinto.meta)
+        tiempo_dijkstra = (time.perf_counter() - inicio) / repeticiones
+
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            camino_bfs, _ = laberinto.resolver("bfs")
+        tiempo_bfs = (time.perf_counter() - inicio) / repeticiones
+
+        assert len(camino_grafo) == len(camino_bfs), f"Caminos de distinta longitud en {nombre}"
+        print(f"{nombre:>22} {celdas:>9} {grafo.num_nodos:>8} {grafo.num_aristas:>8} "
+              f"{celdas / max(grafo.num_nodos, 1):>9.1f}x {tiempo_grafo * 1000:>11.2f} "
+              f"{tiempo_dijkstra * 1000:>14.2f} {tiempo_bfs * 1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark de la inundación por bits frente al BFS celda a celda.
+
+Para laberintos de cada nivel de NIVELES_DIFICULTAD y de tamaños grandes
+(por defecto 2001 x 2001) generados con cada algoritmo, compara el BFS de
+generador.distancias que usa Laberinto._garantizar_solucion para saber si la
+meta es alcanzable con las dos funciones de generador.inundacion: la región
+alcanzable completa (celdas_alcanzables) y la comprobación con parada
+temprana (es_alcanzable). Comprueba además que las tres dan el mismo
+resultado, también con las coordenadas como enteros de NumPy (tal como salen
+de np.argwhere) en laberintos de más de 64 columnas.
+
+Uso:
+    python benchmarks/benchmark_inundacion.py [tamano ...]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from configuracion.config import NIVELES_DIFICULTAD
+from generador.algoritmos import ALGORITMOS
+from generador.distancias import calcular_distancias
+from generador.inundacion import celdas_alcanzables, es_alcanzable
+from generador.laberinto import Laberinto
+
+
+def medir(funcion, repeticiones: int) -> tuple:
+    """
+    Mide el tiempo medio de una función sin argumentos.
+
+    Args:
+        funcion: Función a medir.
+        repeticiones: Número de ejecuciones.
+
+    Returns:
+        Tupla (tiempo medio en segundos, resultado de la última ejecución).
+    """
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return (time.perf_counter() - inicio) / repeticiones, resultado
+
+
+def main() -> None:
+    tamanos = [int(arg) for arg in sys.argv[1:]] or [2001]
+
+    casos = [(nivel, Laberinto.desde_nivel(config, semilla=0), 50)
+             for nivel, config in NIVELES_DIFICULTAD.items()]
+    casos += [(f"{tamano}x{tamano} {algoritmo}",
+               Laberinto(tamano, tamano, algoritmo=algoritmo, semilla=0), 1)
+              for tamano in tamanos for algoritmo in ALGORITMOS]
+
+    print(f"{'laberinto':>22} {'BFS (ms)':>10} {'región (ms)':>12} {'meta (ms)':>10} {'x región':>9} {'x meta':>7}")
+    for nombre, laberinto, repeticiones in casos:
+        matriz, inicio, meta = laberinto.matriz, laberinto.inicio, laberinto.meta
+
+        tiempo_bfs, distancias = medir(lambda: calcular_distancias(matriz, meta), repeticiones)
+        tiempo_region, region = medir(lambda: celdas_alcanzables(matriz, meta), repeticiones)
+        tiempo_meta, alcanzable = medir(lambda: es_alcanzable(matriz, inicio, meta), repeticiones)
+
+        assert (region == (distancias >= 0)).all(), f"Regiones distintas en {nombre}"
+        assert alcanzable == (distancias[inicio] >= 0), f"Alcanzabilidad distinta en {nombre}"
+
+        # Las mismas consultas con coordenadas np.int64
+        inicio_np, meta_np = tuple(np.array(inicio)), tuple(np.array(meta))
+        assert (celdas_alcanzables(matriz, meta_np) == region).all(), f"Región distinta con NumPy en {nombre}"
+        assert es_alcanzable(matriz, inicio_np, meta_np) == alcanzable, f"Alcanzabilidad distinta con NumPy en {nombre}"
+
+        print(f"{nombre:>22} {tiempo_bfs * 1000:>10.2f} {tiempo_region * 1000:>12.2f} "
+              f"{tiempo_meta * 1000:>10.2f} {tiempo_bfs / tiempo_region:>9.1f} "
+              f"{tiempo_bfs / tiempo_meta:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
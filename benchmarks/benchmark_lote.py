@@ -0,0 +1,45 @@
+"""
+Benchmark de la generación de laberintos por lotes.
+
+Mide cuántos laberintos por segundo genera generar_lote con distinto número
+de procesos, comparado con construir los laberintos uno tras otro en un solo
+proceso.
+
+Uso:
+    python benchmarks/benchmark_lote.py [n] [dificultad]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from configuracion.config import NIVELES_DIFICULTAD
+from generador.laberinto import Laberinto
+from generador.lote import generar_lote
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    dificultad = sys.argv[2] if len(sys.argv) > 2 else "extremo"
+    config = NIVELES_DIFICULTAD[dificultad]
+
+    inicio = time.perf_counter()
+    for _ in range(n):
+        Laberinto(*config["tamano"], config["complejidad"], config["densidad"],
+                  algoritmo=config.get("algoritmo", "dfs"))
+    base = n / (time.perf_counter() - inicio)
+    print(f"{'secuencial':>12} {base:>10.0f} laberintos/s")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        inicio = time.perf_counter()
+        generar_lote(n, dificultad, workers=workers)
+        ritmo = n / (time.perf_counter() - inicio)
+        print(f"{workers:>4} procesos {ritmo:>10.0f} laberintos/s ({ritmo / base:.2f}x)")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
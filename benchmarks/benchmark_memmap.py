@@ -0,0 +1,63 @@
+"""
+Benchmark de laberintos proyectados en disco (almacenamiento "memmap").
+
+Genera un laberinto muy grande (por defecto 50000 x 50000) con la matriz en un
+fichero np.memmap, consulta celdas al azar con es_pared y muestra el tiempo de
+cada fase y la memoria residente máxima del proceso. Para comprobar que cabe
+en una máquina con poca memoria, se puede limitar antes el espacio de
+direcciones (por ejemplo, ulimit -v 4194304 para 4 GiB).
+
+Uso:
+    python benchmarks/benchmark_memmap.py [tamano] [algoritmo] [fichero]
+"""
+
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+
+from generador.laberinto import Laberinto
+
+
+def main() -> None:
+    tamano = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    algoritmo = sys.argv[2] if len(sys.argv) > 2 else "sidewinder"
+    ruta = sys.argv[3] if len(sys.argv) > 3 else os.path.join(tempfile.gettempdir(),
+                                                              "laberinto.memmap")
+    consultas = 100000
+
+    try:
+        inicio = time.perf_counter()
+        laberinto = Laberinto(tamano, tamano, algoritmo=algoritmo, semilla=0,
+                              almacenamiento="memmap", ruta=ruta)
+        generacion = time.perf_counter() - inicio
+
+        rng = np.random.default_rng(0)
+        filas = rng.integers(tamano, size=consultas).tolist()
+        columnas = rng.integers(tamano, size=consultas).tolist()
+        inicio = time.perf_counter()
+        for fila, columna in zip(filas, columnas):
+            laberinto.es_pared(fila, columna)
+        consulta = (time.perf_counter() - inicio) / consultas
+
+        # ru_maxrss está en KiB en Linux
+        memoria = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+        print(f"tamano:              {tamano} x {tamano}")
+        print(f"fichero:             {os.path.getsize(ruta) / 2 ** 30:.2f} GiB")
+        print(f"generacion:          {generacion:.1f} s")
+        print(f"consulta es_pared:   {consulta * 1e9:.0f} ns")
+        print(f"inicio / meta:       {laberinto.inicio} / {laberinto.meta}")
+        print(f"memoria residente:   {memoria:.0f} MiB (incluye páginas del fichero)")
+    finally:
+        if os.path.exists(ruta):
+            os.unlink(ruta)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark de los formatos de almacenamiento de la matriz del laberinto.
+
+Tiene dos partes:
+
+- Matriz sola: genera un laberinto grande (por defecto 10000 x 10000) y mide,
+  para cada formato de generador.almacenamiento, la memoria que ocupa la
+  matriz, la reducción frente al formato "int" original y el tiempo medio de
+  una consulta celda a celda como la que hace Laberinto.es_pared.
+- Laberinto completo: construye un Laberinto sidewinder (por defecto 4001 x
+  4001) con cada formato en un proceso nuevo y mide la memoria que conserva
+  después de generarlo, la que conserva tras consultar su campo de
+  distancias (que se calcula entonces) y el pico de memoria residente del
+  proceso durante la generación.
+
+Uso:
+    python benchmarks/benchmark_memoria.py [tamano] [consultas] [tamano_laberinto]
+"""
+
+import multiprocessing
+import os
+import resource
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+
+from generador.algoritmos import obtener_algoritmo
+from generador.almacenamiento import ALMACENAMIENTOS, crear_almacenamiento
+from generador.laberinto import Laberinto
+
+
+def medir_laberinto(tamano: int, almacenamiento: str) -> tuple:
+    """
+    Construye un Laberinto y mide su memoria. Se ejecuta en un proceso nuevo
+    para que el pico de memoria residente sea solo el de esta generación.
+
+    Returns:
+        Tupla (segundos de generación, bytes retenidos tras generar, bytes
+        retenidos tras consultar las distancias, pico de memoria residente
+        por encima de la del proceso antes de generar, en bytes).
+    """
+    # ru_maxrss está en KiB en Linux y en bytes en macOS
+    escala = 1 if sys.platform == "darwin" else 1024
+    base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * escala
+
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    laberinto = Laberinto(tamano, tamano, algoritmo="sidewinder", semilla=0,
+                          almacenamiento=almacenamiento)
+    tiempo = time.perf_counter() - inicio
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * escala - base
+    retenida = tracemalloc.get_traced_memory()[0]
+    laberinto.distancias
+    con_distancias = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return tiempo, retenida, con_distancias, pico
+
+
+def main() -> None:
+    tamano = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    consultas = int(sys.argv[2]) if len(sys.argv) > 2 else 200000
+    tamano_laberinto = int(sys.argv[3]) if len(sys.argv) > 3 else 4001
+
+    rng = np.random.default_rng(0)
+    celdas, _ = obtener_algoritmo("sidewinder")(tamano, tamano, rng)
+    filas = rng.integers(tamano, size=consultas).tolist()
+    columnas = rng.integers(tamano, size=consultas).tolist()
+
+    print(f"{'formato':>8} {'memoria (MiB)':>14} {'reduccion':>10} {'consulta (ns)':>14}")
+    referencia = None
+    for almacenamiento in ALMACENAMIENTOS:
+        if almacenamiento == "memmap":
+            # Vive en disco, no en memoria
+            continue
+        matriz = crear_almacenamiento(celdas, almacenamiento)
+        if referencia is None:
+            referencia = matriz.nbytes
+
+        inicio = time.perf_counter()
+        for fila, columna in zip(filas, columnas):
+            matriz[fila, columna] == 1
+        consulta = (time.perf_counter() - inicio) / consultas
+
+        # Comprobar que el formato conserva el contenido
+        assert np.array_equal(np.asarray(matriz), celdas)
+
+        print(f"{almacenamiento:>8} {matriz.nbytes / 2 ** 20:>14.1f} "
+              f"{referencia / matriz.nbytes:>9.0f}x {consulta * 1e9:>14.0f}")
+        del matriz
+    del celdas
+
+    print(f"\nLaberinto completo de {tamano_laberinto} x {tamano_laberinto}")
+    print(f"{'formato':>8} {'generación (s)':>15} {'retenida (MiB)':>15} "
+          f"{'con distancias (MiB)':>21} {'pico generando (MiB)':>21}")
+    contexto = multiprocessing.get_context("spawn")
+    for almacenamiento in ALMACENAMIENTOS:
+        if almacenamiento == "memmap":
+            continue
+        with contexto.Pool(1) as proceso:
+            tiempo, retenida, con_distancias, pico = proceso.apply(
+                medir_laberinto, (tamano_laberinto, almacenamiento))
+        print(f"{almacenamiento:>8} {tiempo:>15.2f} {retenida / 2 ** 20:>15.1f} "
+              f"{con_distancias / 2 ** 20:>21.1f} {pico / 2 ** 20:>21.1f}")
+
+
+if __name__ == "__main__":
+    main()
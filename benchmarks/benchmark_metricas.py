@@ -0,0 +1,54 @@
+"""
+Benchmark del cálculo de métricas de laberintos por lotes.
+
+Genera n laberintos de cada nivel de NIVELES_DIFICULTAD (por defecto 1000)
+y mide cuántos laberintos por minuto puntúa generador.metricas, tanto
+reutilizando los campos de distancias de Laberinto como calculándolos desde
+cero. Muestra además la media de cada métrica por nivel.
+
+Uso:
+    python benchmarks/benchmark_metricas.py [n]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from configuracion.config import NIVELES_DIFICULTAD
+from generador.laberinto import Laberinto
+from generador.metricas import METRICAS, calcular_metricas, medir_laberintos
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    print(f"{'nivel':>12} {'con distancias (lab/min)':>25} {'sin distancias (lab/min)':>25}")
+    medias = {}
+    for nivel, config in NIVELES_DIFICULTAD.items():
+        laberintos = [Laberinto.desde_nivel(config, semilla=semilla) for semilla in range(n)]
+        matrices = np.stack([laberinto.matriz for laberinto in laberintos])
+        inicios = [laberinto.inicio for laberinto in laberintos]
+        metas = [laberinto.meta for laberinto in laberintos]
+
+        inicio = time.perf_counter()
+        metricas = medir_laberintos(laberintos)
+        con_distancias = n / (time.perf_counter() - inicio) * 60
+
+        inicio = time.perf_counter()
+        calcular_metricas(matrices, inicios, metas)
+        sin_distancias = n / (time.perf_counter() - inicio) * 60
+
+        medias[nivel] = {nombre: metricas[nombre].mean() for nombre in METRICAS}
+        print(f"{nivel:>12} {con_distancias:>25.0f} {sin_distancias:>25.0f}")
+
+    print(f"\n{'nivel':>12}" + "".join(f" {nombre:>17}" for nombre in METRICAS))
+    for nivel, valores in medias.items():
+        print(f"{nivel:>12}" + "".join(f" {valores[nombre]:>17.2f}" for nombre in METRICAS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark del rasterizado de las celdas del laberinto.
+
+Compara el dibujo original de las celdas, con una o dos llamadas a
+pygame.draw.rect por celda desde un bucle de Python, con dibujar_celdas, que
+escribe los píxeles con NumPy a través de pygame.surfarray
+(renderizador.dibujo.rasterizar_celdas). Para cada nivel de NIVELES_DIFICULTAD y para
+laberintos grandes (por defecto 1001 x 1001) dibuja el laberinto entero por
+bandas de FILAS_POR_BANDA filas sobre una superficie del tamaño de una banda,
+para que la imagen completa no tenga que caber en memoria (a 1001 x 1001
+ocuparía más de 3 GiB), y comprueba que ambas versiones dan exactamente los
+mismos píxeles.
+
+Uso:
+    python benchmarks/benchmark_rasterizado.py [tamano ...]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+import pygame
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from configuracion.config import BLANCO, GROSOR_PARED, NEGRO, NIVELES_DIFICULTAD, TAMANO_CELDA
+from generador.laberinto import Laberinto
+from renderizador.dibujo import dibujar_celdas
+
+# Filas del laberinto que se dibujan en cada banda
+FILAS_POR_BANDA = 16
+
+
+def dibujar_celdas_original(laberinto: Laberinto, superficie: pygame.Surface,
+                            filas: tuple, columnas: tuple, origen: tuple) -> None:
+    """Reproduce dibujar_celdas antes del rasterizado con NumPy: un rect por celda."""
+    laberinto.matriz[laberinto.inicio] = 0
+    laberinto.matriz[laberinto.meta] = 0
+
+    region = laberinto.matriz[filas[0]:filas[1], columnas[0]:columnas[1]]
+    for i, fila in enumerate(np.asarray(region).tolist(), filas[0] - origen[0]):
+        for j, celda in enumerate(fila, columnas[0] - origen[1]):
+            x = j * TAMANO_CELDA
+            y = i * TAMANO_CELDA
+            if celda == 1:
+                pygame.draw.rect(superficie, NEGRO, (x, y, TAMANO_CELDA, TAMANO_CELDA))
+            else:
+                pygame.draw.rect(superficie, BLANCO, (x, y, TAMANO_CELDA, TAMANO_CELDA))
+                pygame.draw.rect(superficie, NEGRO, (x, y, TAMANO_CELDA, TAMANO_CELDA), GROSOR_PARED)
+
+
+def rasterizar_por_bandas(laberinto: Laberinto) -> tuple:
+    """
+    Dibuja el laberinto entero banda a banda con las dos versiones.
+
+    Returns:
+        Tupla (segundos de la versión original, segundos de dibujar_celdas,
+        si todas las bandas han dado los mismos píxeles).
+    """
+    banda = pygame.Surface((laberinto.columnas * TAMANO_CELDA,
+                            min(FILAS_POR_BANDA, laberinto.filas) * TAMANO_CELDA))
+    tiempos = {dibujar_celdas_original: 0.0, dibujar_celdas: 0.0}
+    iguales = True
+    for primera in range(0, laberinto.filas, FILAS_POR_BANDA):
+        filas = (primera, min(primera + FILAS_POR_BANDA, laberinto.filas))
+        imagenes = []
+        for dibujar in tiempos:
+            # Fondo gris para detectar píxeles que una versión no dibuje
+            banda.fill((128, 128, 128))
+            inicio = time.perf_counter()
+            dibujar(laberinto, banda, filas, (0, laberinto.columnas), (primera, 0))
+            tiempos[dibujar] += time.perf_counter() - inicio
+            imagenes.append(pygame.surfarray.array3d(banda))
+        iguales &= np.array_equal(*imagenes)
+    return tiempos[dibujar_celdas_original], tiempos[dibujar_celdas], iguales
+
+
+def main() -> None:
+    tamanos = [int(arg) for arg in sys.argv[1:]] or [1001]
+
+    pygame.display.init()
+
+    casos = [(nivel, Laberinto.desde_nivel(config, semilla=0))
+             for nivel, config in NIVELES_DIFICULTAD.items()]
+    casos += [(f"{tamano}x{tamano}", Laberinto(tamano, tamano, semilla=0)) for tamano in tamanos]
+
+    print(f"{'laberinto':>12} {'celdas':>9} {'por celda (ms)':>15} {'NumPy (ms)':>11} "
+          f"{'aceleración':>12} {'idénticos':>10}")
+    for nombre, laberinto in casos:
+        tiempo_original, tiempo_numpy, iguales = rasterizar_por_bandas(laberinto)
+        print(f"{nombre:>12} {laberinto.filas * laberinto.columnas:>9} {tiempo_original * 1000:>15.1f} "
+              f"{tiempo_numpy * 1000:>11.1f} {tiempo_original / tiempo_numpy:>11.1f}x "
+              f"{'sí' if iguales else 'NO':>10}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
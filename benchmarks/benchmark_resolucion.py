@@ -0,0 +1,47 @@
+"""
+Benchmark de los resolutores de laberintos.
+
+Resuelve laberintos de cada nivel de NIVELES_DIFICULTAD y de tamaños grandes
+(por defecto 4001 x 4001) con todos los resolutores de generador.resolucion,
+y muestra el tiempo medio, los nodos expandidos y la longitud del camino,
+para poder elegir el más rápido para pistas y validación. Comprueba además
+que todos encuentran caminos de la misma longitud.
+
+Uso:
+    python benchmarks/benchmark_resolucion.py [tamano ...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from configuracion.config import NIVELES_DIFICULTAD
+from generador.laberinto import Laberinto
+from generador.resolucion import RESOLUTORES, resolver
+
+
+def main() -> None:
+    tamanos = [int(arg) for arg in sys.argv[1:]] or [4001]
+
+    casos = [(nivel, Laberinto.desde_nivel(config, semilla=0), 50)
+             for nivel, config in NIVELES_DIFICULTAD.items()]
+    casos += [(f"{tamano}x{tamano}", Laberinto(tamano, tamano, semilla=0), 1) for tamano in tamanos]
+
+    print(f"{'laberinto':>12} {'resolutor':>18} {'tiempo (ms)':>12} {'expandidos':>11} {'camino':>8}")
+    for nombre, laberinto, repeticiones in casos:
+        longitudes = set()
+        for metodo in RESOLUTORES:
+            inicio = time.perf_counter()
+            for _ in range(repeticiones):
+                camino, expandidos = resolver(laberinto.matriz, laberinto.inicio,
+                                              laberinto.meta, metodo)
+            tiempo = (time.perf_counter() - inicio) / repeticiones
+            longitudes.add(len(camino))
+            print(f"{nombre:>12} {metodo:>18} {tiempo * 1000:>12.2f} {expandidos:>11} {len(camino):>8}")
+        assert len(longitudes) == 1, f"Caminos de distinta longitud en {nombre}: {longitudes}"
+
+
+if __name__ == "__main__":
+    main()
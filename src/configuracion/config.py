@@ -5,6 +5,8 @@ Este módulo contiene todas las constantes y configuraciones utilizadas en el ju
 incluyendo colores, tamaños, niveles de dificultad y otras configuraciones globales.
 """
 
+import os
+
 # Configuración de la ventana
 TITULO = "Generador de laberintos"
 ANCHO_VENTANA = 800
@@ -26,6 +28,7 @@ MORADO = (128, 0, 128)
 # Configuración del laberinto
 TAMANO_CELDA = 30
 GROSOR_PARED = 2
+MARGEN_CAPA = 4  # Celdas dibujadas de más alrededor de la cámara en cada lado
 
 # Configuración del jugador
 VELOCIDAD_JUGADOR = 5
@@ -41,34 +44,87 @@ NIVELES_DIFICULTAD = {
         "tamano": (15, 15),  # (filas, columnas)
         "complejidad": 0.5,  # Factor de complejidad (0-1)
         "densidad": 0.5,     # Densidad de paredes (0-1)
-        "tiempo_limite": 120  # Tiempo en segundos
+        "tiempo_limite": 120,  # Tiempo en segundos
+        "algoritmo": "dfs"   # Algoritmo de generación (ver generador.algoritmos)
     },
     "normal": {
         "tamano": (25, 25),
         "complejidad": 0.6,
         "densidad": 0.6,
-        "tiempo_limite": 180
+        "tiempo_limite": 180,
+        "algoritmo": "dfs"
     },
     "dificil": {
         "tamano": (35, 35),
         "complejidad": 0.7,
         "densidad": 0.7,
-        "tiempo_limite": 240
+        "tiempo_limite": 240,
+        "algoritmo": "dfs"
     },
     "muy dificil": {
         "tamano": (45, 45),
         "complejidad": 0.8,
         "densidad": 0.8,
-        "tiempo_limite": 300
+        "tiempo_limite": 300,
+        "algoritmo": "dfs"
     },
     "extremo": {
         "tamano": (55, 55),
         "complejidad": 0.9,
         "densidad": 0.9,
-        "tiempo_limite": 360
+        "tiempo_limite": 360,
+        "algoritmo": "dfs"
     }
 }
 
+# Rangos objetivo de la media de cada métrica (ver generador.metricas) que
+# busca la calibración automática de los niveles (python -m generador.calibracion)
+OBJETIVOS_DIFICULTAD = {
+    "facil": {"longitud_solucion": (20, 32), "proporcion_callejones": (0.05, 0.09)},
+    "normal": {"longitud_solucion": (50, 66), "proporcion_callejones": (0.045, 0.065)},
+    "dificil": {"longitud_solucion": (75, 95), "proporcion_callejones": (0.045, 0.06)},
+    "muy dificil": {"longitud_solucion": (95, 115), "proporcion_callejones": (0.045, 0.06)},
+    "extremo": {"longitud_solucion": (115, 140), "proporcion_callejones": (0.045, 0.06)},
+}
+
+# Fichero que escribe la calibración automática. Si existe, sus valores de
+# tamano, complejidad y densidad sustituyen a los de NIVELES_DIFICULTAD
+FICHERO_NIVELES_CALIBRADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                          "niveles_calibrados.json")
+
+
+def _cargar_niveles_calibrados() -> None:
+    """Aplica a NIVELES_DIFICULTAD los niveles calibrados, si los hay."""
+    if not os.path.exists(FICHERO_NIVELES_CALIBRADOS):
+        return
+    import json
+    with open(FICHERO_NIVELES_CALIBRADOS, encoding="utf-8") as fichero:
+        for nivel, valores in json.load(fichero).items():
+            if nivel in NIVELES_DIFICULTAD:
+                NIVELES_DIFICULTAD[nivel].update(tamano=tuple(valores["tamano"]),
+                                                 complejidad=valores["complejidad"],
+                                                 densidad=valores["densidad"])
+
+
+_cargar_niveles_calibrados()
+
+# Laberintos pregenerados en segundo plano por cada nivel de dificultad
+LABERINTOS_EN_RESERVA = 1
+
+# Caché de laberintos en disco
+DIRECTORIO_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "generador-laberintos")
+LIMITE_CACHE_BYTES = 64 * 1024 * 1024  # Tamaño máximo de la caché (64 MiB)
+
+# Laberintos proyectados en disco (almacenamiento "memmap"): bytes de la
+# matriz que se procesan a la vez en cada pasada por bandas de filas
+BYTES_POR_BANDA = 16 * 1024 * 1024
+
+# Configuración del modo infinito
+TAMANO_FRAGMENTO = 16            # Lado de cada fragmento en celdas (par)
+FRAGMENTOS_EN_CACHE = 64         # Fragmentos del mundo que se mantienen en memoria
+SUPERFICIES_EN_CACHE = 25        # Fragmentos dibujados que se mantienen en memoria
+MARGEN_PRECARGA = 1              # Fragmentos de margen alrededor de la cámara
+
 # Configuración de fuentes
 TAMANO_FUENTE_PEQUENA = 20
 TAMANO_FUENTE_MEDIANA = 30
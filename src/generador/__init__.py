@@ -6,3 +6,12 @@ y representación de laberintos.
 """
 
 from .laberinto import Laberinto
+from .almacenamiento import MatrizBits
+from .algoritmos import ALGORITMOS, obtener_algoritmo, medir_algoritmo
+from .eller import generar_filas_eller
+from .mundo import MundoInfinito
+from .resolucion import RESOLUTORES, resolver
+from .inundacion import celdas_alcanzables, es_alcanzable
+from .grafo import GrafoPasillos
+from .metricas import METRICAS, medir_laberinto, medir_laberintos
+from .componentes import etiquetar_componentes, paredes_de_union
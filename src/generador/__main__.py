@@ -0,0 +1,153 @@
+"""
+Línea de comandos para generar laberintos sin interfaz gráfica.
+
+Genera N laberintos con el tamaño, la semilla y el algoritmo indicados y los
+escribe en un directorio, uno por fichero. Solo usa el modelo (NumPy), nunca
+importa pygame, por lo que sirve para trabajos por lotes en máquinas sin
+pantalla.
+
+Uso:
+    python -m generador -n 10 --filas 41 --columnas 41 --semilla 1 --salida laberintos
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import List, Optional
+
+import numpy as np
+
+from configuracion.config import NIVELES_DIFICULTAD
+from generador.algoritmos import ALGORITMOS
+from generador.laberinto import Laberinto
+
+
+FORMATOS = ("npz", "txt")
+
+
+def analizar_argumentos(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Analiza los argumentos de la línea de comandos.
+
+    Args:
+        argv: Argumentos (por defecto, los del proceso).
+
+    Returns:
+        Espacio de nombres con las opciones. Si se indica un nivel de
+        dificultad, sus valores se usan para las opciones no indicadas.
+    """
+    analizador = argparse.ArgumentParser(
+        prog="python -m generador",
+        description="Genera laberintos sin interfaz gráfica y los guarda en disco.")
+    analizador.add_argument("-n", "--cantidad", type=int, default=1,
+                            help="número de laberintos a generar (por defecto 1)")
+    analizador.add_argument("--dificultad", choices=sorted(NIVELES_DIFICULTAD),
+                            help="nivel de dificultad del que tomar tamaño y parámetros")
+    analizador.add_argument("--filas", type=int, help="número de filas (por defecto 21)")
+    analizador.add_argument("--columnas", type=int, help="número de columnas (por defecto 21)")
+    analizador.add_argument("--algoritmo", choices=sorted(ALGORITMOS),
+                            help="algoritmo de generación (por defecto dfs)")
+    analizador.add_argument("--complejidad", type=float, help="factor de complejidad 0-1 (por defecto 0.5)")
+    analizador.add_argument("--densidad", type=float, help="factor de densidad 0-1 (por defecto 0.5)")
+    analizador.add_argument("--meta-lejana", action="store_true",
+                            help="colocar la meta en la celda más alejada del inicio")
+    analizador.add_argument("--semilla", type=int,
+                            help="semilla del lote; el mismo valor reproduce los mismos laberintos")
+    analizador.add_argument("--salida", default="laberintos",
+                            help="directorio de salida (por defecto ./laberintos)")
+    analizador.add_argument("--formato", choices=FORMATOS, default="npz",
+                            help="npz (matriz, inicio, meta y parámetros) o txt (texto)")
+    argumentos = analizador.parse_args(argv)
+
+    # Completar las opciones no indicadas con el nivel o con los valores por defecto
+    nivel = NIVELES_DIFICULTAD.get(argumentos.dificultad, {})
+    filas, columnas = nivel.get("tamano", (21, 21))
+    predeterminados = {
+        "filas": filas,
+        "columnas": columnas,
+        "algoritmo": nivel.get("algoritmo", "dfs"),
+        "complejidad": nivel.get("complejidad", 0.5),
+        "densidad": nivel.get("densidad", 0.5),
+    }
+    for opcion, valor in predeterminados.items():
+        if getattr(argumentos, opcion) is None:
+            setattr(argumentos, opcion, valor)
+
+    if argumentos.cantidad < 0:
+        analizador.error("la cantidad no puede ser negativa")
+    if argumentos.filas < 3 or argumentos.columnas < 3:
+        analizador.error("el laberinto debe tener al menos 3 filas y 3 columnas")
+
+    return argumentos
+
+
+def guardar_laberinto(laberinto: Laberinto, ruta: str, formato: str) -> None:
+    """
+    Escribe un laberinto en disco.
+
+    Args:
+        laberinto: Laberinto a guardar.
+        ruta: Ruta del fichero de destino.
+        formato: "npz" guarda la matriz (uint8), el inicio, la meta y los
+                 parámetros de generación en formato JSON; "txt" guarda una
+                 línea por fila con '#' para las paredes, ' ' para los
+                 caminos, 'I' para el inicio y 'M' para la meta.
+    """
+    if formato == "npz":
+        parametros = {
+            "semilla": int(laberinto.semilla),
+            "filas": laberinto.filas,
+            "columnas": laberinto.columnas,
+            "complejidad": laberinto.complejidad,
+            "densidad": laberinto.densidad,
+            "algoritmo": laberinto.algoritmo,
+            "meta_lejana": laberinto.meta_lejana,
+        }
+        np.savez_compressed(ruta,
+                            parametros=np.array(json.dumps(parametros)),
+                            matriz=np.asarray(laberinto.matriz, dtype=np.uint8),
+                            inicio=np.array(laberinto.inicio, dtype=np.int64),
+                            meta=np.array(laberinto.meta, dtype=np.int64))
+        return
+
+    caracteres = np.where(np.asarray(laberinto.matriz) == 1, "#", " ").astype("<U1")
+    caracteres[laberinto.inicio] = "I"
+    caracteres[laberinto.meta] = "M"
+    with open(ruta, "w", encoding="utf-8") as fichero:
+        for fila in caracteres:
+            fichero.write("".join(fila) + "\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de la línea de comandos.
+
+    Args:
+        argv: Argumentos (por defecto, los del proceso).
+
+    Returns:
+        Código de salida del proceso.
+    """
+    argumentos = analizar_argumentos(argv)
+    os.makedirs(argumentos.salida, exist_ok=True)
+
+    # Una semilla independiente por laberinto, derivada de la del lote
+    semillas = np.random.SeedSequence(argumentos.semilla).generate_state(
+        argumentos.cantidad, dtype=np.uint64).tolist()
+    digitos = len(str(max(argumentos.cantidad - 1, 0)))
+
+    for indice, semilla in enumerate(semillas):
+        laberinto = Laberinto(argumentos.filas, argumentos.columnas, argumentos.complejidad,
+                              argumentos.densidad, argumentos.meta_lejana,
+                              argumentos.algoritmo, semilla)
+        ruta = os.path.join(argumentos.salida,
+                            f"laberinto_{indice:0{digitos}d}.{argumentos.formato}")
+        guardar_laberinto(laberinto, ruta, argumentos.formato)
+        print(f"{ruta}\tsemilla={semilla}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
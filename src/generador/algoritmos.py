@@ -0,0 +1,479 @@
+"""
+Registro de algoritmos de generación de laberintos.
+
+Este módulo contiene los distintos algoritmos capaces de excavar un laberinto
+perfecto sobre la rejilla de celdas impares que usa Laberinto, junto con un
+registro que permite seleccionarlos por nombre desde Laberinto o desde los
+niveles de NIVELES_DIFICULTAD.
+
+Todos los algoritmos reciben (filas, columnas, rng), donde rng es el
+generador de NumPy (numpy.random.Generator) del que sacan todos sus números
+aleatorios, y devuelven una tupla (celdas, bifurcaciones), donde celdas es una matriz uint8 de forma
+(filas, columnas) con 0 = camino y 1 = pared, y bifurcaciones es una lista
+plana de pares [celda, vecino, ...] (solo la rellena el DFS). Con el mismo
+estado de rng, un algoritmo produce siempre la misma matriz.
+"""
+
+import random
+import time
+import tracemalloc
+from itertools import permutations
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any
+
+import numpy as np
+
+from generador.motor_dfs import generar_dfs, crear_mapa_visitadas, desplazamientos, numero_celdas
+from generador.eller import generar_filas_eller
+
+
+ResultadoAlgoritmo = Tuple[np.ndarray, List[int]]
+
+# Registro de algoritmos disponibles por nombre
+ALGORITMOS: Dict[str, Callable[[int, int, np.random.Generator], ResultadoAlgoritmo]] = {}
+
+# Algoritmos que producen el laberinto fila a fila, en orden y con memoria
+# proporcional solo al número de columnas (ver obtener_algoritmo_por_filas)
+ALGORITMOS_POR_FILAS: Dict[str, Callable[[int, int, np.random.Generator], Iterator[np.ndarray]]] = {}
+
+
+def registrar_algoritmo(nombre: str) -> Callable:
+    """
+    Decorador que registra un algoritmo de generación con el nombre indicado.
+
+    Args:
+        nombre: Nombre con el que se seleccionará el algoritmo.
+
+    Returns:
+        Decorador que añade la función al registro y la devuelve sin cambios.
+    """
+    def decorador(funcion: Callable[[int, int, np.random.Generator], ResultadoAlgoritmo]) -> Callable:
+        ALGORITMOS[nombre] = funcion
+        return funcion
+    return decorador
+
+
+def obtener_algoritmo(nombre: str) -> Callable[[int, int, np.random.Generator], ResultadoAlgoritmo]:
+    """
+    Obtiene un algoritmo de generación registrado.
+
+    Args:
+        nombre: Nombre del algoritmo.
+
+    Returns:
+        Función de generación asociada al nombre.
+
+    Raises:
+        ValueError: Si no existe ningún algoritmo con ese nombre.
+    """
+    if nombre not in ALGORITMOS:
+        disponibles = ", ".join(sorted(ALGORITMOS))
+        raise ValueError(f"Algoritmo desconocido: {nombre!r} (disponibles: {disponibles})")
+    return ALGORITMOS[nombre]
+
+
+def obtener_algoritmo_por_filas(nombre: str) -> Callable[[int, int, np.random.Generator],
+                                                           Iterator[np.ndarray]]:
+    """
+    Obtiene la versión fila a fila de un algoritmo de generación.
+
+    Args:
+        nombre: Nombre del algoritmo.
+
+    Returns:
+        Generador que recibe (filas, columnas, rng) y produce las filas del
+        laberinto en orden, como arrays uint8 de longitud columnas.
+
+    Raises:
+        ValueError: Si el algoritmo no tiene versión fila a fila.
+    """
+    if nombre not in ALGORITMOS_POR_FILAS:
+        disponibles = ", ".join(sorted(ALGORITMOS_POR_FILAS))
+        raise ValueError(f"El algoritmo {nombre!r} no puede generarse fila a fila "
+                         f"(disponibles: {disponibles})")
+    return ALGORITMOS_POR_FILAS[nombre]
+
+
+def medir_algoritmo(nombre: str, filas: int, columnas: int,
+                    semilla: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Ejecuta un algoritmo y mide su tiempo de generación y su pico de memoria.
+
+    El tiempo y la memoria se miden en dos ejecuciones distintas, porque el
+    seguimiento de tracemalloc ralentiza mucho las asignaciones de Python.
+
+    Args:
+        nombre: Nombre del algoritmo registrado.
+        filas: Número de filas del laberinto.
+        columnas: Número de columnas del laberinto.
+        semilla: Semilla del generador aleatorio (None = aleatoria).
+
+    Returns:
+        Diccionario con el nombre del algoritmo, el tiempo en segundos
+        ("tiempo") y el pico de memoria en bytes ("memoria_pico").
+    """
+    generar = obtener_algoritmo(nombre)
+
+    inicio = time.perf_counter()
+    generar(filas, columnas, np.random.default_rng(semilla))
+    tiempo = time.perf_counter() - inicio
+
+    tracemalloc.start()
+    generar(filas, columnas, np.random.default_rng(semilla))
+    _, memoria_pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"algoritmo": nombre, "tiempo": tiempo, "memoria_pico": memoria_pico}
+
+
+def _rejilla(filas: int, columnas: int) -> Tuple[np.ndarray, int, int]:
+    """
+    Crea una rejilla de paredes con todas las celdas impares abiertas.
+
+    Args:
+        filas: Número de filas del laberinto.
+        columnas: Número de columnas del laberinto.
+
+    Returns:
+        Tupla (celdas, R, K) con la matriz uint8 y el número de filas y
+        columnas de celdas impares.
+    """
+    celdas = np.ones((filas, columnas), dtype=np.uint8)
+    celdas[1:filas - 1:2, 1:columnas - 1:2] = 0
+    return celdas, len(range(1, filas - 1, 2)), len(range(1, columnas - 1, 2))
+
+
+def _celdas_red(filas: int, columnas: int) -> List[int]:
+    """
+    Obtiene los índices planos de todas las celdas impares del laberinto.
+
+    Args:
+        filas: Número de filas del laberinto.
+        columnas: Número de columnas del laberinto.
+
+    Returns:
+        Lista de índices planos en orden por filas.
+    """
+    indices = np.arange(filas * columnas).reshape(filas, columnas)
+    return indices[1:filas - 1:2, 1:columnas - 1:2].ravel().tolist()
+
+
+def _celda_aleatoria(filas: int, columnas: int, rng: np.random.Generator) -> int:
+    """Elige una celda impar aleatoria y devuelve su índice plano."""
+    fila = 2 * int(rng.integers(len(range(1, filas - 1, 2)))) + 1
+    columna = 2 * int(rng.integers(len(range(1, columnas - 1, 2)))) + 1
+    return fila * columnas + columna
+
+
+def _aleatorio_escalar(rng: np.random.Generator) -> random.Random:
+    """
+    Crea un generador de Python sembrado desde rng para sorteos sueltos.
+
+    Los algoritmos que sortean dentro de bucles de Python lo usan porque cada
+    llamada escalar a un Generator de NumPy es mucho más lenta.
+    """
+    return random.Random(int(rng.integers(2 ** 63)))
+
+
+def _desde_plano(celdas: bytearray, filas: int, columnas: int) -> np.ndarray:
+    """Convierte un búfer plano de celdas en una matriz uint8 (filas, columnas)."""
+    return np.frombuffer(celdas, dtype=np.uint8, count=filas * columnas).reshape(filas, columnas).copy()
+
+
+@registrar_algoritmo("dfs")
+def generar_dfs_aleatorio(filas: int, columnas: int, rng: np.random.Generator) -> ResultadoAlgoritmo:
+    """
+    Búsqueda en profundidad (backtracker recursivo) sobre el motor de mapa de bits.
+
+    Produce pasillos largos y sinuosos con pocas bifurcaciones.
+    """
+    inicio = divmod(_celda_aleatoria(filas, columnas, rng), columnas)
+
+    # Bloque de números aleatorios: un orden de direcciones por iteración del DFS
+    azar = rng.integers(0, 24, size=2 * numero_celdas(filas, columnas), dtype=np.uint8).tobytes()
+
+    celdas, _, bifurcaciones = generar_dfs(filas, columnas, inicio, azar)
+    return _desde_plano(celdas, filas, columnas), bifurcaciones
+
+
+@registrar_algoritmo("kruskal")
+def generar_kruskal(filas: int, columnas: int, rng: np.random.Generator) -> ResultadoAlgoritmo:
+    """
+    Kruskal aleatorio con unión-búsqueda sobre arrays.
+
+    Produce muchos callejones cortos y una textura uniforme.
+    """
+    celdas, R, K = _rejilla(filas, columnas)
+    if R == 0 or K == 0:
+        return celdas, []
+
+    # Identificadores de las celdas de la red y posición plana de cada pared
+    ids = np.arange(R * K).reshape(R, K)
+    posicion = (2 * np.arange(R) + 1)[:, None] * columnas + (2 * np.arange(K) + 1)[None, :]
+
+    # Aristas horizontales y verticales entre celdas vecinas
+    a = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+    b = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+    muros = np.concatenate([posicion[:, :-1].ravel() + 1, posicion[:-1, :].ravel() + columnas])
+
+    orden = rng.permutation(a.size)
+    padre = list(range(R * K))
+    derribados = []
+    derribar = derribados.append
+
+    for u, v, muro in zip(a[orden].tolist(), b[orden].tolist(), muros[orden].tolist()):
+        # Buscar raíces con compresión de caminos por división a la mitad
+        while padre[u] != u:
+            padre[u] = padre[padre[u]]
+            u = padre[u]
+        while padre[v] != v:
+            padre[v] = padre[padre[v]]
+            v = padre[v]
+        if u != v:
+            padre[u] = v
+            derribar(muro)
+
+    celdas.reshape(-1)[np.asarray(derribados, dtype=np.int64)] = 0
+    return celdas, []
+
+
+@registrar_algoritmo("prim")
+def generar_prim(filas: int, columnas: int, rng: np.random.Generator) -> ResultadoAlgoritmo:
+    """
+    Prim aleatorio con frontera de celdas.
+
+    Produce muchos callejones cortos que se ramifican desde el punto inicial.
+    """
+    pendientes = crear_mapa_visitadas(filas, columnas)
+    en_laberinto = bytearray(len(pendientes))
+    celdas = bytearray(b"\x01") * (filas * columnas)
+    direcciones = desplazamientos(columnas)
+    azar = _aleatorio_escalar(rng).random
+
+    origen = _celda_aleatoria(filas, columnas, rng)
+    pendientes[origen] = 1
+    en_laberinto[origen] = 1
+    celdas[origen] = 0
+
+    frontera = []
+    for d, _ in direcciones:
+        if not pendientes[origen + d]:
+            pendientes[origen + d] = 1
+            frontera.append(origen + d)
+
+    while frontera:
+        # Sacar una celda aleatoria de la frontera (intercambio con la última)
+        i = int(azar() * len(frontera))
+        frontera[i], frontera[-1] = frontera[-1], frontera[i]
+        p = frontera.pop()
+
+        # Conectarla con un vecino aleatorio que ya forme parte del laberinto
+        conectados = [m for d, m in direcciones if en_laberinto[p + d]]
+        m = conectados[int(azar() * len(conectados))]
+        celdas[p + m] = 0
+        celdas[p] = 0
+        en_laberinto[p] = 1
+
+        # Añadir a la frontera los vecinos aún pendientes
+        for d, _ in direcciones:
+            q = p + d
+            if not pendientes[q]:
+                pendientes[q] = 1
+                frontera.append(q)
+
+    return _desde_plano(celdas, filas, columnas), []
+
+
+@registrar_algoritmo("wilson")
+def generar_wilson(filas: int, columnas: int, rng: np.random.Generator) -> ResultadoAlgoritmo:
+    """
+    Wilson (paseos aleatorios con borrado de bucles).
+
+    Produce un árbol de expansión uniforme, sin sesgo de textura, a costa de
+    ser el más lento en laberintos grandes.
+    """
+    # Celdas por las que puede pasar el paseo (1 = celda impar del interior)
+    mapa = np.frombuffer(crear_mapa_visitadas(filas, columnas), dtype=np.uint8)
+    validas = bytearray((mapa ^ 1).tobytes())
+    en_arbol = bytearray(len(validas))
+    celdas = bytearray(b"\x01") * (filas * columnas)
+    direccion = [0] * len(validas)
+    pasos = tuple(d for d, _ in desplazamientos(columnas))
+    azar = _aleatorio_escalar(rng).random
+
+    raiz = _celda_aleatoria(filas, columnas, rng)
+    en_arbol[raiz] = 1
+    celdas[raiz] = 0
+
+    for inicio in _celdas_red(filas, columnas):
+        if en_arbol[inicio]:
+            continue
+
+        # Paseo aleatorio hasta tocar el árbol; sobrescribir la dirección
+        # de salida de cada celda borra implícitamente los bucles
+        p = inicio
+        while not en_arbol[p]:
+            d = pasos[int(azar() * 4)]
+            while not validas[p + d]:
+                d = pasos[int(azar() * 4)]
+            direccion[p] = d
+            p += d
+
+        # Recorrer el camino sin bucles y añadirlo al árbol
+        p = inicio
+        while not en_arbol[p]:
+            d = direccion[p]
+            en_arbol[p] = 1
+            celdas[p] = 0
+            celdas[p + d // 2] = 0
+            p += d
+
+    return _desde_plano(celdas, filas, columnas), []
+
+
+@registrar_algoritmo("sidewinder")
+def generar_sidewinder(filas: int, columnas: int, rng: np.random.Generator) -> ResultadoAlgoritmo:
+    """
+    Sidewinder por filas, materializado en una matriz completa.
+
+    Produce un pasillo continuo en la fila superior y un sesgo vertical. Se
+    construye con generar_filas_sidewinder para que consuma el rng en el
+    mismo orden que la versión fila a fila y una semilla dé el mismo
+    laberinto con cualquier almacenamiento.
+    """
+    return np.vstack(list(generar_filas_sidewinder(filas, columnas, rng))), []
+
+
+def generar_filas_sidewinder(filas: int, columnas: int,
+                             rng: np.random.Generator) -> Iterator[np.ndarray]:
+    """
+    Sidewinder fila a fila.
+
+    Cada fila de celdas solo depende de sus propios sorteos, así que basta con
+    sortear los tramos de una fila para emitir la fila de paredes que la
+    separa de la anterior y después la propia fila de celdas.
+
+    Yields:
+        Filas terminadas del laberinto, en orden, como arrays uint8 de
+        longitud columnas. En total se producen exactamente filas filas.
+    """
+    R = len(range(1, filas - 1, 2))
+    K = len(range(1, columnas - 1, 2))
+
+    # Primera fila: borde superior
+    yield np.ones(columnas, dtype=np.uint8)
+    emitidas = 1
+
+    for r in range(R if K else 0):
+        fila_celdas = np.ones(columnas, dtype=np.uint8)
+        fila_celdas[1:2 * K:2] = 0
+
+        if r == 0:
+            # La fila superior es un único pasillo
+            fila_celdas[2:2 * K - 1:2] = 0
+        else:
+            # Decidir dónde se cierra cada tramo (la última columna siempre cierra)
+            cerrar = rng.random(K) < 0.5
+            cerrar[-1] = True
+            fila_celdas[2:2 * K - 1:2][~cerrar[:-1]] = 0
+
+            # Abrir hacia el norte una celda aleatoria de cada tramo
+            finales = np.flatnonzero(cerrar)
+            inicios = np.concatenate(([0], finales[:-1] + 1))
+            elegidas = inicios + (rng.random(finales.size) * (finales - inicios + 1)).astype(np.int64)
+            fila_paredes = np.ones(columnas, dtype=np.uint8)
+            fila_paredes[2 * elegidas + 1] = 0
+            yield fila_paredes
+            emitidas += 1
+
+        yield fila_celdas
+        emitidas += 1
+
+    # Filas restantes: borde inferior
+    for _ in range(filas - emitidas):
+        yield np.ones(columnas, dtype=np.uint8)
+
+
+@registrar_algoritmo("arbol_binario")
+def generar_arbol_binario(filas: int, columnas: int, rng: np.random.Generator) -> ResultadoAlgoritmo:
+    """
+    Árbol binario vectorizado (cada celda abre al norte o al oeste).
+
+    Es el más rápido, pero produce una diagonal muy marcada hacia la
+    esquina superior izquierda.
+    """
+    celdas, R, K = _rejilla(filas, columnas)
+    if R == 0 or K == 0:
+        return celdas, []
+
+    este = celdas[1:2 * R:2, 2:2 * K:2]
+    norte = celdas[2:2 * R:2, 1:2 * K:2]
+
+    # True = abrir al norte, False = abrir al oeste
+    al_norte = rng.random((R, K)) < 0.5
+    al_norte[0, :] = False
+    al_norte[:, 0] = True
+
+    norte[al_norte[1:, :]] = 0
+    este[~al_norte[:, 1:]] = 0
+
+    return celdas, []
+
+
+@registrar_algoritmo("growing_tree")
+def generar_growing_tree(filas: int, columnas: int, rng: np.random.Generator,
+                         mezcla: float = 0.5) -> ResultadoAlgoritmo:
+    """
+    Growing tree que combina la celda más reciente y una celda aleatoria.
+
+    Args:
+        mezcla: Probabilidad de continuar desde la celda más reciente. Con 1
+                se comporta como el DFS y con 0 como Prim.
+    """
+    pendientes = crear_mapa_visitadas(filas, columnas)
+    celdas = bytearray(b"\x01") * (filas * columnas)
+    ordenes = tuple(permutations(desplazamientos(columnas)))
+    azar = _aleatorio_escalar(rng).random
+
+    origen = _celda_aleatoria(filas, columnas, rng)
+    pendientes[origen] = 1
+    celdas[origen] = 0
+    activas = [origen]
+
+    while activas:
+        # Elegir la celda más reciente o una aleatoria según la mezcla
+        if azar() < mezcla:
+            i = len(activas) - 1
+        else:
+            i = int(azar() * len(activas))
+        p = activas[i]
+
+        for d, m in ordenes[int(azar() * 24)]:
+            q = p + d
+            if not pendientes[q]:
+                pendientes[q] = 1
+                celdas[p + m] = 0
+                celdas[q] = 0
+                activas.append(q)
+                break
+        else:
+            # Sin vecinos pendientes: retirarla intercambiándola con la última
+            activas[i] = activas[-1]
+            activas.pop()
+
+    return _desde_plano(celdas, filas, columnas), []
+
+
+@registrar_algoritmo("eller")
+def generar_eller(filas: int, columnas: int, rng: np.random.Generator) -> ResultadoAlgoritmo:
+    """
+    Eller por filas, materializado en una matriz completa.
+
+    Produce una textura parecida a Kruskal. Para no construir la matriz
+    completa, usar directamente generador.eller.generar_filas_eller.
+    """
+    return np.vstack(list(generar_filas_eller(filas, columnas, rng))), []
+
+
+# Versiones fila a fila de los algoritmos que las admiten
+ALGORITMOS_POR_FILAS["sidewinder"] = generar_filas_sidewinder
+ALGORITMOS_POR_FILAS["eller"] = generar_filas_eller
@@ -0,0 +1,215 @@
+"""
+Formatos de almacenamiento de la matriz del laberinto.
+
+Este módulo contiene los distintos formatos con los que Laberinto puede
+guardar su matriz una vez generada:
+
+- "int": un entero de 64 bits por celda (el formato original).
+- "uint8": un byte por celda (8 veces menos memoria).
+- "bits": un bit por celda, empaquetado por filas (64 veces menos memoria).
+- "memmap": un byte por celda en un fichero proyectado en memoria
+  (np.memmap), para laberintos mayores que la RAM disponible.
+
+El formato "bits" se implementa con la clase MatrizBits, que admite los
+mismos accesos celda a celda (matriz[fila, columna]) que una matriz de NumPy.
+"""
+
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+
+ALMACENAMIENTOS = ("int", "uint8", "bits", "memmap")
+
+
+class MatrizBits:
+    """
+    Matriz de 0/1 empaquetada a un bit por celda.
+
+    Cada fila ocupa ceil(columnas / 8) bytes, con la columna 0 en el bit más
+    significativo del primer byte (el orden de np.packbits). Los datos viven
+    en un bytearray, de modo que la lectura y escritura de celdas sueltas no
+    pasa por NumPy; el atributo bits ofrece una vista de NumPy de forma
+    (filas, bytes_por_fila) para operar con filas completas.
+    """
+
+    def __init__(self, filas: int, columnas: int):
+        """
+        Inicializa una matriz empaquetada con todas las celdas a 0.
+
+        Args:
+            filas: Número de filas.
+            columnas: Número de columnas.
+        """
+        self.shape = (filas, columnas)
+        self.bytes_por_fila = (columnas + 7) // 8
+        self._datos = bytearray(filas * self.bytes_por_fila)
+        self.bits = np.frombuffer(self._datos, dtype=np.uint8).reshape(filas, self.bytes_por_fila)
+
+    @classmethod
+    def desde_matriz(cls, matriz: np.ndarray) -> "MatrizBits":
+        """
+        Empaqueta una matriz de 0/1.
+
+        Args:
+            matriz: Matriz bidimensional de 0/1.
+
+        Returns:
+            Nueva MatrizBits con el mismo contenido.
+        """
+        empaquetada = cls(*matriz.shape)
+        empaquetada.bits[:] = np.packbits(np.asarray(matriz, dtype=np.uint8), axis=1)
+        return empaquetada
+
+    @property
+    def nbytes(self) -> int:
+        """Memoria ocupada por las celdas, en bytes."""
+        return len(self._datos)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Tipo de los valores al desempaquetar."""
+        return np.dtype(np.uint8)
+
+    def desempaquetar(self) -> np.ndarray:
+        """
+        Desempaqueta la matriz completa.
+
+        Returns:
+            Matriz uint8 de forma shape.
+        """
+        return np.unpackbits(self.bits, axis=1, count=self.shape[1])
+
+    def astype(self, dtype: Any, copy: bool = True) -> np.ndarray:
+        """Desempaqueta la matriz y la convierte al tipo indicado."""
+        return self.desempaquetar().astype(dtype, copy=False)
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        matriz = self.desempaquetar()
+        return matriz if dtype is None else matriz.astype(dtype, copy=False)
+
+    def __eq__(self, otro: Any) -> np.ndarray:
+        return self.desempaquetar() == np.asarray(otro)
+
+    def __ne__(self, otro: Any) -> np.ndarray:
+        return self.desempaquetar() != np.asarray(otro)
+
+    def __getitem__(self, clave: Any) -> Any:
+        celda = self._celda(clave)
+        if celda is not None:
+            fila, columna = celda
+            byte = self._datos[fila * self.bytes_por_fila + (columna >> 3)]
+            return (byte >> (7 - (columna & 7))) & 1
+        filas, resto = (clave[0], clave[1:]) if type(clave) is tuple and clave else (clave, ())
+        if isinstance(filas, (int, np.integer)):
+            # Una fila (matriz[i] o matriz[i, a:b]): desempaquetar solo esa fila
+            return np.unpackbits(self.bits[filas], count=self.shape[1])[resto]
+        if isinstance(filas, slice):
+            # Rango de filas: desempaquetar solo esas filas
+            return np.unpackbits(self.bits[filas], axis=1, count=self.shape[1])[(slice(None),) + resto]
+        return self.desempaquetar()[clave]
+
+    def __setitem__(self, clave: Any, valor: Any) -> None:
+        celda = self._celda(clave)
+        if celda is not None:
+            fila, columna = celda
+            indice = fila * self.bytes_por_fila + (columna >> 3)
+            mascara = 0x80 >> (columna & 7)
+            if valor:
+                self._datos[indice] |= mascara
+            else:
+                self._datos[indice] &= ~mascara & 0xFF
+            return
+
+        # Cualquier otra forma de indexación: desempaquetar, modificar y volver a empaquetar
+        matriz = self.desempaquetar()
+        matriz[clave] = valor
+        self.bits[:] = np.packbits(matriz, axis=1)
+
+    def _celda(self, clave: Any) -> Optional[Tuple[int, int]]:
+        """
+        Comprueba si la clave indexa una única celda y la normaliza a positivos.
+
+        Args:
+            clave: Clave de indexación.
+
+        Returns:
+            Par (fila, columna) no negativo si la clave es un par de enteros,
+            None en caso contrario.
+
+        Raises:
+            IndexError: Si la clave es un par de enteros fuera de los límites.
+        """
+        if type(clave) is not tuple or len(clave) != 2:
+            return None
+        fila, columna = clave
+        if not (isinstance(fila, (int, np.integer)) and isinstance(columna, (int, np.integer))):
+            return None
+        filas, columnas = self.shape
+        if 0 <= fila < filas and 0 <= columna < columnas:
+            return fila, columna
+        if not (-filas <= fila < filas and -columnas <= columna < columnas):
+            raise IndexError(f"Celda fuera de la matriz: {clave}")
+        return int(fila) % filas, int(columna) % columnas
+
+
+def crear_almacenamiento(matriz: np.ndarray, almacenamiento: str,
+                         ruta: Optional[str] = None) -> Any:
+    """
+    Convierte una matriz de 0/1 al formato de almacenamiento indicado.
+
+    Args:
+        matriz: Matriz bidimensional de 0/1.
+        almacenamiento: Formato de destino ("int", "uint8", "bits" o "memmap").
+        ruta: Fichero donde se proyecta la matriz (solo para "memmap").
+
+    Returns:
+        Matriz en el formato indicado (ndarray, np.memmap o MatrizBits).
+
+    Raises:
+        ValueError: Si el formato no existe o falta la ruta de "memmap".
+    """
+    if almacenamiento == "int":
+        return np.asarray(matriz, dtype=int)
+    if almacenamiento == "uint8":
+        return np.asarray(matriz, dtype=np.uint8)
+    if almacenamiento == "bits":
+        return MatrizBits.desde_matriz(matriz)
+    if almacenamiento == "memmap":
+        mapeada = crear_matriz(matriz.shape[0], matriz.shape[1], "memmap", ruta)[0]
+        mapeada[:] = matriz
+        return mapeada
+    raise ValueError(f"Almacenamiento desconocido: {almacenamiento!r} "
+                     f"(disponibles: {', '.join(ALMACENAMIENTOS)})")
+
+
+def crear_matriz(filas: int, columnas: int, almacenamiento: str,
+                 ruta: Optional[str] = None) -> Tuple[np.ndarray, bool]:
+    """
+    Crea la matriz de trabajo, llena de ceros, usada mientras se genera.
+
+    Args:
+        filas: Número de filas.
+        columnas: Número de columnas.
+        almacenamiento: Formato de almacenamiento final.
+        ruta: Fichero donde se proyecta la matriz (solo para "memmap"). Si ya
+              existe, se sobrescribe.
+
+    Returns:
+        Tupla (matriz, compactar) donde compactar indica si al terminar la
+        generación hay que convertir la matriz al formato final.
+
+    Raises:
+        ValueError: Si el formato no existe o falta la ruta de "memmap".
+    """
+    if almacenamiento == "int":
+        return np.zeros((filas, columnas), dtype=int), False
+    if almacenamiento in ("uint8", "bits"):
+        return np.zeros((filas, columnas), dtype=np.uint8), almacenamiento == "bits"
+    if almacenamiento == "memmap":
+        if ruta is None:
+            raise ValueError('El almacenamiento "memmap" necesita una ruta de fichero')
+        # El fichero nuevo se crea disperso: las páginas se reservan al escribirlas
+        return np.memmap(ruta, dtype=np.uint8, mode="w+", shape=(filas, columnas)), False
+    raise ValueError(f"Almacenamiento desconocido: {almacenamiento!r} "
+                     f"(disponibles: {', '.join(ALMACENAMIENTOS)})")
@@ -0,0 +1,240 @@
+"""
+Caché persistente de laberintos en disco.
+
+Este módulo contiene la clase CacheLaberintos, que guarda los laberintos
+generados en un directorio para no tener que volver a generarlos. Cada
+laberinto se identifica por los parámetros que lo determinan por completo
+(semilla, filas, columnas, complejidad, densidad, algoritmo y meta_lejana) y
+su matriz se almacena empaquetada a un bit por celda con np.packbits, junto
+con el inicio y la meta. La caché tiene un tamaño máximo y, al superarlo,
+expulsa los laberintos usados hace más tiempo (LRU).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from configuracion.config import DIRECTORIO_CACHE, LIMITE_CACHE_BYTES
+from generador.laberinto import Laberinto
+
+
+class CacheLaberintos:
+    """
+    Caché de laberintos en disco con formato empaquetado y expulsión LRU.
+
+    La antigüedad de uso de cada entrada es la fecha de modificación de su
+    fichero, que se actualiza en cada acierto.
+    """
+
+    EXTENSION = ".npz"
+
+    def __init__(self, directorio: str = DIRECTORIO_CACHE,
+                 limite_bytes: int = LIMITE_CACHE_BYTES):
+        """
+        Inicializa la caché, creando el directorio si no existe.
+
+        Args:
+            directorio: Directorio donde se guardan los laberintos.
+            limite_bytes: Tamaño máximo de la caché en disco.
+        """
+        self.directorio = directorio
+        self.limite_bytes = limite_bytes
+        os.makedirs(directorio, exist_ok=True)
+
+    @staticmethod
+    def clave(semilla: int, filas: int, columnas: int, complejidad: float,
+              densidad: float, algoritmo: str = "dfs",
+              meta_lejana: bool = False) -> Tuple:
+        """
+        Construye la clave que identifica un laberinto en la caché.
+
+        Returns:
+            Tupla con todos los parámetros que determinan el laberinto.
+        """
+        return (int(semilla), int(filas), int(columnas), float(complejidad),
+                float(densidad), str(algoritmo), bool(meta_lejana))
+
+    def obtener(self, semilla: int, filas: int, columnas: int, complejidad: float,
+                densidad: float, algoritmo: str = "dfs",
+                meta_lejana: bool = False) -> Optional[Laberinto]:
+        """
+        Busca un laberinto en la caché.
+
+        Args:
+            semilla: Semilla con la que se generó.
+            filas: Número de filas del laberinto.
+            columnas: Número de columnas del laberinto.
+            complejidad: Factor de complejidad del laberinto.
+            densidad: Factor de densidad del laberinto.
+            algoritmo: Algoritmo de generación.
+            meta_lejana: Si la meta se colocó en la celda más alejada del inicio.
+
+        Returns:
+            Laberinto listo para usar (sin ejecutar _generar) o None si no está.
+        """
+        clave = self.clave(semilla, filas, columnas, complejidad, densidad,
+                           algoritmo, meta_lejana)
+        ruta = self._ruta(clave)
+
+        try:
+            with np.load(ruta) as datos:
+                parametros = json.loads(str(datos["parametros"]))
+                bits = datos["matriz"]
+                inicio = tuple(datos["inicio"].tolist())
+                meta = tuple(datos["meta"].tolist())
+        except (OSError, KeyError, ValueError):
+            # No existe o está dañado: se trata como un fallo de caché
+            return None
+
+        # Descartar colisiones de nombre comprobando los parámetros guardados
+        if self.clave(**parametros) != clave:
+            return None
+
+        # Marcar la entrada como usada recientemente
+        os.utime(ruta)
+
+        matriz = np.unpackbits(bits, count=filas * columnas).reshape(filas, columnas)
+        return Laberinto.desde_matriz(matriz, inicio, meta, complejidad, densidad,
+                                      meta_lejana, algoritmo, semilla)
+
+    def guardar(self, laberinto: Laberinto) -> None:
+        """
+        Guarda un laberinto en la caché y expulsa entradas si se supera el límite.
+
+        Args:
+            laberinto: Laberinto a guardar.
+        """
+        parametros = self._parametros(laberinto)
+        ruta = self._ruta(self.clave(**parametros))
+
+        # Escribir en un fichero temporal y renombrarlo para que la escritura sea atómica
+        descriptor, temporal = tempfile.mkstemp(dir=self.directorio, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as fichero:
+                np.savez(fichero,
+                         parametros=np.array(json.dumps(parametros)),
+                         matriz=np.packbits(laberinto.matriz.astype(np.uint8, copy=False)),
+                         inicio=np.array(laberinto.inicio, dtype=np.int64),
+                         meta=np.array(laberinto.meta, dtype=np.int64))
+            os.replace(temporal, ruta)
+        except BaseException:
+            os.unlink(temporal)
+            raise
+
+        self._expulsar()
+
+    def obtener_o_generar(self, filas: int, columnas: int, complejidad: float = 0.5,
+                          densidad: float = 0.5, algoritmo: str = "dfs",
+                          meta_lejana: bool = False,
+                          semilla: Optional[int] = None) -> Laberinto:
+        """
+        Devuelve el laberinto de la caché o lo genera y lo guarda si no está.
+
+        Args:
+            filas: Número de filas del laberinto.
+            columnas: Número de columnas del laberinto.
+            complejidad: Factor de complejidad del laberinto.
+            densidad: Factor de densidad del laberinto.
+            algoritmo: Algoritmo de generación.
+            meta_lejana: Si la meta se coloca en la celda más alejada del inicio.
+            semilla: Semilla del laberinto. Si es None se genera uno nuevo
+                     con una semilla aleatoria y se guarda con ella.
+
+        Returns:
+            Laberinto correspondiente a los parámetros.
+        """
+        if semilla is not None:
+            laberinto = self.obtener(semilla, filas, columnas, complejidad, densidad,
+                                     algoritmo, meta_lejana)
+            if laberinto is not None:
+                return laberinto
+
+        laberinto = Laberinto(filas, columnas, complejidad, densidad, meta_lejana,
+                              algoritmo, semilla)
+        self.guardar(laberinto)
+        return laberinto
+
+    def tamano(self) -> int:
+        """
+        Calcula el tamaño total de la caché en disco.
+
+        Returns:
+            Suma del tamaño en bytes de todas las entradas.
+        """
+        return sum(tamano for _, _, tamano in self._entradas())
+
+    def vaciar(self) -> None:
+        """
+        Elimina todas las entradas de la caché.
+        """
+        for ruta, _, _ in self._entradas():
+            os.unlink(ruta)
+
+    def _expulsar(self) -> None:
+        """
+        Elimina las entradas usadas hace más tiempo hasta respetar el límite.
+        """
+        entradas = sorted(self._entradas(), key=lambda entrada: entrada[1])
+        total = sum(tamano for _, _, tamano in entradas)
+
+        for ruta, _, tamano in entradas:
+            if total <= self.limite_bytes:
+                break
+            try:
+                os.unlink(ruta)
+            except FileNotFoundError:
+                pass
+            total -= tamano
+
+    def _entradas(self) -> list:
+        """
+        Lista las entradas de la caché.
+
+        Returns:
+            Lista de tuplas (ruta, fecha de último uso, tamaño en bytes).
+        """
+        entradas = []
+        with os.scandir(self.directorio) as iterador:
+            for entrada in iterador:
+                if entrada.is_file() and entrada.name.endswith(self.EXTENSION):
+                    estado = entrada.stat()
+                    entradas.append((entrada.path, estado.st_mtime_ns, estado.st_size))
+        return entradas
+
+    def _ruta(self, clave: Tuple) -> str:
+        """
+        Calcula la ruta del fichero de una clave.
+
+        Args:
+            clave: Clave del laberinto.
+
+        Returns:
+            Ruta del fichero dentro del directorio de la caché.
+        """
+        resumen = hashlib.sha1(repr(clave).encode("utf-8")).hexdigest()
+        return os.path.join(self.directorio, resumen + self.EXTENSION)
+
+    @staticmethod
+    def _parametros(laberinto: Laberinto) -> Dict[str, Any]:
+        """
+        Obtiene los parámetros que identifican un laberinto.
+
+        Args:
+            laberinto: Laberinto del que se extraen los parámetros.
+
+        Returns:
+            Diccionario con los argumentos de clave().
+        """
+        return {
+            "semilla": int(laberinto.semilla),
+            "filas": laberinto.filas,
+            "columnas": laberinto.columnas,
+            "complejidad": laberinto.complejidad,
+            "densidad": laberinto.densidad,
+            "algoritmo": laberinto.algoritmo,
+            "meta_lejana": laberinto.meta_lejana,
+        }
@@ -0,0 +1,234 @@
+"""
+Calibración automática de los niveles de dificultad.
+
+Para cada nivel de NIVELES_DIFICULTAD busca en el espacio (tamano,
+complejidad, densidad) la combinación más barata cuyos laberintos cumplen
+los rangos objetivo de OBJETIVOS_DIFICULTAD, medidos con generador.metricas
+sobre una muestra de laberintos. Los tamaños se prueban de menor a mayor y
+se elige el primero en el que alguna combinación cumple todos los rangos, de
+modo que un nivel se encoge siempre que un laberinto más pequeño (más rápido
+de generar y de dibujar) dé la misma dificultad. Los candidatos se generan
+en un grupo de procesos y el resultado se escribe en
+FICHERO_NIVELES_CALIBRADOS, que configuracion.config aplica al arrancar.
+
+Uso (desde src):
+    python -m generador.calibracion [--niveles facil normal] [--muestras 64] [--workers 8]
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from configuracion.config import FICHERO_NIVELES_CALIBRADOS, NIVELES_DIFICULTAD, OBJETIVOS_DIFICULTAD
+from generador.laberinto import Laberinto
+from generador.metricas import medir_laberintos
+
+
+# Valores de complejidad y densidad que se prueban en cada tamaño
+VALORES_PARAMETROS = (0.1, 0.3, 0.5, 0.7, 0.9)
+
+Rangos = Dict[str, Tuple[float, float]]
+
+
+def _evaluar(parametros: Dict[str, Any], semillas: List[int]) -> Dict[str, float]:
+    """
+    Genera una muestra de laberintos con unos parámetros y mide sus métricas.
+
+    Se ejecuta en los procesos trabajadores.
+
+    Args:
+        parametros: filas, columnas, complejidad, densidad y algoritmo.
+        semillas: Semilla de cada laberinto de la muestra.
+
+    Returns:
+        Diccionario {métrica: media en la muestra}.
+    """
+    laberintos = [Laberinto(parametros["filas"], parametros["columnas"], parametros["complejidad"],
+                            parametros["densidad"], algoritmo=parametros["algoritmo"], semilla=semilla)
+                  for semilla in semillas]
+    return {nombre: float(valores.mean()) for nombre, valores in medir_laberintos(laberintos).items()}
+
+
+def desviacion(medias: Dict[str, float], objetivos: Rangos) -> float:
+    """
+    Mide cuánto se salen unas métricas de sus rangos objetivo.
+
+    Args:
+        medias: Media de cada métrica.
+        objetivos: Rango (mínimo, máximo) de cada métrica.
+
+    Returns:
+        0 si todas están dentro de su rango; si no, la suma de lo que se sale
+        cada una, en anchuras de su rango.
+    """
+    total = 0.0
+    for nombre, (minimo, maximo) in objetivos.items():
+        valor = medias[nombre]
+        if valor < minimo:
+            total += (minimo - valor) / (maximo - minimo)
+        elif valor > maximo:
+            total += (valor - maximo) / (maximo - minimo)
+    return total
+
+
+def distancia_al_centro(medias: Dict[str, float], objetivos: Rangos) -> float:
+    """
+    Suma la distancia de cada métrica al centro de su rango, en anchuras del rango.
+
+    Sirve para desempatar entre candidatos que cumplen todos los rangos.
+    """
+    return sum(abs(medias[nombre] - (minimo + maximo) / 2) / (maximo - minimo)
+               for nombre, (minimo, maximo) in objetivos.items())
+
+
+def tamanos_candidatos(tamano: Tuple[int, int], minimo: int) -> List[Tuple[int, int]]:
+    """
+    Enumera los tamaños impares a probar, de menor a mayor.
+
+    Args:
+        tamano: Tamaño (filas, columnas) actual del nivel, que es el mayor
+                que se prueba. Se conserva su proporción.
+        minimo: Número mínimo de filas.
+
+    Returns:
+        Lista de tamaños (filas, columnas), terminada en el tamaño actual.
+    """
+    filas, columnas = tamano
+    tamanos = [(f, max(minimo, round(f * columnas / filas)) | 1)
+               for f in range(minimo | 1, filas, 2)]
+    return tamanos + [tuple(tamano)]
+
+
+def calibrar_nivel(config: Dict[str, Any], objetivos: Rangos, grupo: Executor,
+                   semillas: List[int], tamano_minimo: int = 11,
+                   valores: Sequence[float] = VALORES_PARAMETROS) -> Dict[str, Any]:
+    """
+    Busca los parámetros más baratos que cumplen los objetivos de un nivel.
+
+    Args:
+        config: Configuración actual del nivel (de NIVELES_DIFICULTAD).
+        objetivos: Rango (mínimo, máximo) de la media de cada métrica.
+        grupo: Grupo de procesos en el que evaluar los candidatos.
+        semillas: Semillas de la muestra; todos los candidatos usan las
+                  mismas para que las diferencias se deban a los parámetros.
+        tamano_minimo: Menor número de filas que se prueba.
+        valores: Valores de complejidad y densidad que se prueban.
+
+    Returns:
+        Diccionario con tamano, complejidad, densidad, las métricas medias
+        del candidato elegido y cumple (si alcanza todos los rangos). Si
+        ningún candidato los cumple se devuelve el que menos se desvía.
+    """
+    mejor = None
+    for filas, columnas in tamanos_candidatos(config["tamano"], tamano_minimo):
+        candidatos = [{"filas": filas, "columnas": columnas, "complejidad": complejidad,
+                       "densidad": densidad, "algoritmo": config.get("algoritmo", "dfs")}
+                      for complejidad in valores for densidad in valores]
+        tareas = [grupo.submit(_evaluar, parametros, semillas) for parametros in candidatos]
+
+        for parametros, tarea in zip(candidatos, tareas):
+            medias = tarea.result()
+            puntuacion = (desviacion(medias, objetivos), distancia_al_centro(medias, objetivos))
+            if mejor is None or puntuacion < mejor[0]:
+                mejor = (puntuacion, parametros, medias)
+
+        # El primer tamaño con algún candidato que cumple es el más barato
+        if mejor[0][0] == 0:
+            break
+
+    (desvio, _), parametros, medias = mejor
+    return {
+        "tamano": [parametros["filas"], parametros["columnas"]],
+        "complejidad": parametros["complejidad"],
+        "densidad": parametros["densidad"],
+        "cumple": desvio == 0,
+        "metricas": medias,
+    }
+
+
+def analizar_argumentos(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Analiza los argumentos de la línea de comandos.
+
+    Args:
+        argv: Argumentos (por defecto, los del proceso).
+
+    Returns:
+        Espacio de nombres con las opciones.
+    """
+    analizador = argparse.ArgumentParser(
+        prog="python -m generador.calibracion",
+        description="Calibra el tamaño, la complejidad y la densidad de los niveles de dificultad.")
+    analizador.add_argument("--niveles", nargs="+", choices=list(OBJETIVOS_DIFICULTAD),
+                            default=list(OBJETIVOS_DIFICULTAD),
+                            help="niveles a calibrar (por defecto todos)")
+    analizador.add_argument("--muestras", type=int, default=64,
+                            help="laberintos generados por candidato (por defecto 64)")
+    analizador.add_argument("--workers", type=int,
+                            help="número de procesos (por defecto, el número de CPU)")
+    analizador.add_argument("--semilla", type=int, default=0,
+                            help="semilla de la muestra (por defecto 0)")
+    analizador.add_argument("--tamano-minimo", type=int, default=11,
+                            help="menor número de filas que se prueba (por defecto 11)")
+    analizador.add_argument("--salida", default=FICHERO_NIVELES_CALIBRADOS,
+                            help="fichero JSON de niveles calibrados")
+    argumentos = analizador.parse_args(argv)
+
+    if argumentos.muestras < 1:
+        analizador.error("hace falta al menos una muestra por candidato")
+    if argumentos.tamano_minimo < 5:
+        analizador.error("el tamaño mínimo debe ser al menos 5")
+
+    return argumentos
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de la línea de comandos.
+
+    Args:
+        argv: Argumentos (por defecto, los del proceso).
+
+    Returns:
+        Código de salida del proceso.
+    """
+    argumentos = analizar_argumentos(argv)
+    semillas = np.random.SeedSequence(argumentos.semilla).generate_state(
+        argumentos.muestras, dtype=np.uint64).tolist()
+
+    # Conservar los niveles ya calibrados que no se recalibran
+    calibrados = {}
+    if os.path.exists(argumentos.salida):
+        with open(argumentos.salida, encoding="utf-8") as fichero:
+            calibrados = json.load(fichero)
+
+    print(f"{'nivel':>12} {'tamaño':>9} {'->':>2} {'tamaño':>9} {'complejidad':>12} {'densidad':>9} "
+          f"{'solución':>9} {'callejones':>11} {'celdas':>7} {'cumple':>7}")
+    with ProcessPoolExecutor(max_workers=argumentos.workers) as grupo:
+        for nivel in argumentos.niveles:
+            config = NIVELES_DIFICULTAD[nivel]
+            resultado = calibrar_nivel(config, OBJETIVOS_DIFICULTAD[nivel], grupo, semillas,
+                                       argumentos.tamano_minimo)
+            calibrados[nivel] = resultado
+
+            antes, despues = config["tamano"], resultado["tamano"]
+            proporcion = despues[0] * despues[1] / (antes[0] * antes[1])
+            print(f"{nivel:>12} {antes[0]:>4}x{antes[1]:<4} {'->':>2} {despues[0]:>4}x{despues[1]:<4} "
+                  f"{resultado['complejidad']:>12.1f} {resultado['densidad']:>9.1f} "
+                  f"{resultado['metricas']['longitud_solucion']:>9.1f} "
+                  f"{resultado['metricas']['proporcion_callejones']:>11.3f} {proporcion:>6.0%} "
+                  f"{'sí' if resultado['cumple'] else 'no':>7}")
+
+    with open(argumentos.salida, "w", encoding="utf-8") as fichero:
+        json.dump(calibrados, fichero, indent=2, ensure_ascii=False)
+    print(f"\nNiveles calibrados escritos en {argumentos.salida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Módulo de componentes conexas de laberintos.
+
+Este módulo etiqueta las regiones de celdas de camino conectadas entre sí y
+calcula qué paredes hay que abrir para conectar dos celdas sin atravesar el
+laberinto en línea recta. El etiquetado es una unión-búsqueda sobre arrays:
+en cada ronda todas las parejas de celdas vecinas cuelgan a la vez la raíz
+mayor de la menor y después se comprimen todos los caminos saltando de padre
+en abuelo, de modo que no hay bucles de Python por celda y el número de
+rondas crece de forma logarítmica con el tamaño de las regiones.
+"""
+
+from collections import deque
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def etiquetar_componentes(matriz: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Etiqueta las componentes conexas de celdas de camino.
+
+    Args:
+        matriz: Matriz del laberinto (0 = camino, 1 = pared).
+
+    Returns:
+        Tupla (etiquetas, num_componentes): etiquetas es una matriz int32 con
+        la misma forma que matriz, con -1 en las paredes y la componente de
+        cada celda de camino, numeradas desde 0 en el orden de lectura de su
+        primera celda.
+    """
+    libres = np.asarray(matriz) == 0
+    filas, columnas = libres.shape
+    # Índices planos de 32 bits mientras quepan, para reducir a la mitad la memoria
+    tipo = np.int32 if filas * columnas <= np.iinfo(np.int32).max else np.int64
+    planos = np.arange(filas * columnas, dtype=tipo).reshape(filas, columnas)
+
+    # Parejas de celdas libres vecinas
+    horizontales = libres[:, :-1] & libres[:, 1:]
+    verticales = libres[:-1, :] & libres[1:, :]
+    a = np.concatenate((planos[:, :-1][horizontales], planos[:-1, :][verticales]))
+    b = np.concatenate((planos[:, 1:][horizontales], planos[1:, :][verticales]))
+
+    padres = planos.ravel().copy()
+    while a.size:
+        # Colgar la raíz mayor de cada pareja de la menor
+        raices_a, raices_b = padres[a], padres[b]
+        distintas = raices_a != raices_b
+        a, b, raices_a, raices_b = a[distintas], b[distintas], raices_a[distintas], raices_b[distintas]
+        np.minimum.at(padres, np.maximum(raices_a, raices_b), np.minimum(raices_a, raices_b))
+
+        # Comprimir hasta que cada celda apunte directamente a su raíz
+        while True:
+            abuelos = padres[padres]
+            if np.array_equal(abuelos, padres):
+                break
+            padres = abuelos
+
+    # La raíz de cada componente es su primera celda en orden de lectura, así
+    # que contar las raíces hasta cada una numera las componentes en ese orden
+    libres = libres.ravel()
+    raices = libres & (padres == planos.ravel())
+    numeros = np.cumsum(raices, dtype=np.int32) - 1
+    etiquetas = np.where(libres, numeros[padres], np.int32(-1))
+    return etiquetas.reshape(filas, columnas), int(numeros[-1]) + 1 if numeros.size else 0
+
+
+def paredes_de_union(matriz: np.ndarray, inicio: Tuple[int, int], meta: Tuple[int, int],
+                     etiquetas: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+    """
+    Busca el menor número de paredes sueltas que conectan el inicio con la meta.
+
+    Una pared suelta es una celda de pared interior con celdas de camino de
+    dos componentes distintas a ambos lados (izquierda y derecha, o arriba y
+    abajo): al abrirla, las dos componentes quedan unidas. Se busca en anchura
+    sobre el grafo de componentes unidas por paredes sueltas, así que el
+    laberinto solo cambia en esas paredes.
+
+    Args:
+        matriz: Matriz del laberinto (0 = camino, 1 = pared).
+        inicio: Celda (fila, columna) de inicio, que debe ser camino.
+        meta: Celda (fila, columna) de meta, que debe ser camino.
+        etiquetas: Resultado de etiquetar_componentes, si ya se ha calculado.
+
+    Returns:
+        Array int32 de forma (k, 2) con las paredes (fila, columna) que hay
+        que abrir (vacío si ya están conectadas), o None si no se pueden
+        conectar abriendo solo paredes sueltas.
+    """
+    if etiquetas is None:
+        etiquetas, _ = etiquetar_componentes(matriz)
+    origen, destino = int(etiquetas[inicio]), int(etiquetas[meta])
+    if origen < 0 or destino < 0:
+        return None
+    if origen == destino:
+        return np.empty((0, 2), dtype=np.int32)
+
+    # Paredes interiores entre dos componentes distintas, en horizontal y en vertical
+    pared = etiquetas[1:-1, 1:-1] < 0
+    uniones = []
+    for antes, despues in ((etiquetas[1:-1, :-2], etiquetas[1:-1, 2:]),
+                           (etiquetas[:-2, 1:-1], etiquetas[2:, 1:-1])):
+        validas = pared & (antes >= 0) & (despues >= 0) & (antes != despues)
+        paredes_f, paredes_c = np.nonzero(validas)
+        uniones.append(np.stack((antes[validas], despues[validas], paredes_f + 1, paredes_c + 1), axis=1))
+    uniones = np.concatenate(uniones)
+
+    # Grafo de componentes: una pared por cada pareja de componentes vecinas
+    vecinas = {}
+    for componente_a, componente_b, fila, columna in uniones.tolist():
+        vecinas.setdefault(componente_a, {}).setdefault(componente_b, (fila, columna))
+        vecinas.setdefault(componente_b, {}).setdefault(componente_a, (fila, columna))
+
+    # Búsqueda en anchura desde la componente del inicio
+    padres = {origen: None}
+    cola = deque([origen])
+    while cola and destino not in padres:
+        componente = cola.popleft()
+        for vecina, celda in vecinas.get(componente, {}).items():
+            if vecina not in padres:
+                padres[vecina] = (componente, celda)
+                cola.append(vecina)
+
+    if destino not in padres:
+        return None
+
+    paredes = []
+    componente = destino
+    while padres[componente] is not None:
+        componente, celda = padres[componente]
+        paredes.append(celda)
+    return np.array(paredes[::-1], dtype=np.int32)
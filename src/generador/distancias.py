@@ -0,0 +1,79 @@
+"""
+Módulo de campos de distancia sobre laberintos.
+
+Este módulo contiene un recorrido en anchura (BFS) iterativo que calcula, en
+una sola pasada, la distancia de cada celda de camino a una celda origen.
+Trabaja sobre índices planos y un búfer de celdas libres con borde de paredes,
+por lo que no depende del límite de recursión de Python y escala de forma
+lineal con el número de celdas.
+"""
+
+from array import array
+from typing import Tuple
+
+import numpy as np
+
+
+def rejilla_libres(matriz: np.ndarray) -> Tuple[bytearray, int]:
+    """
+    Crea el búfer plano de celdas libres con un borde de paredes.
+
+    Con el borde, los cuatro vecinos de cualquier celda del laberinto son
+    índices válidos del búfer, así que los recorridos no comprueban límites.
+
+    Args:
+        matriz: Matriz del laberinto (0 = camino, 1 = pared).
+
+    Returns:
+        Tupla (libres, ancho) con un bytearray de (filas + 2) * (columnas + 2)
+        posiciones (1 = camino) y el ancho de cada fila del búfer. La celda
+        (fila, columna) está en el índice (fila + 1) * ancho + columna + 1.
+    """
+    filas, columnas = matriz.shape
+    libres = np.zeros((filas + 2, columnas + 2), dtype=np.uint8)
+    libres[1:-1, 1:-1] = matriz == 0
+    return bytearray(libres.tobytes()), columnas + 2
+
+
+def calcular_distancias(matriz: np.ndarray, origen: Tuple[int, int]) -> np.ndarray:
+    """
+    Calcula la distancia en celdas desde el origen a todas las celdas de camino.
+
+    Args:
+        matriz: Matriz del laberinto (0 = camino, 1 = pared).
+        origen: Celda (fila, columna) desde la que se mide la distancia.
+
+    Returns:
+        Matriz int32 con la misma forma que matriz. Contiene la distancia
+        mínima al origen de cada celda alcanzable y -1 en paredes y celdas
+        inalcanzables.
+    """
+    filas, columnas = matriz.shape
+
+    # Celdas libres con un borde de paredes para no comprobar límites
+    libres, ancho = rejilla_libres(matriz)
+
+    distancias = array("i", [-1]) * len(libres)
+
+    inicio = (origen[0] + 1) * ancho + origen[1] + 1
+    if libres[inicio]:
+        libres[inicio] = 0
+        distancias[inicio] = 0
+        frontera = [inicio]
+        distancia = 0
+
+        # Expandir la frontera nivel a nivel
+        while frontera:
+            distancia += 1
+            siguiente = []
+            agregar = siguiente.append
+            for p in frontera:
+                for q in (p - ancho, p + 1, p + ancho, p - 1):
+                    if libres[q]:
+                        libres[q] = 0
+                        distancias[q] = distancia
+                        agregar(q)
+            frontera = siguiente
+
+    resultado = np.frombuffer(distancias, dtype=np.int32).reshape(filas + 2, ancho)
+    return resultado[1:-1, 1:-1].copy()
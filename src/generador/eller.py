@@ -0,0 +1,105 @@
+"""
+Generación de laberintos por filas mediante el algoritmo de Eller.
+
+Este módulo contiene un generador que produce el laberinto fila a fila, con la
+misma codificación 0/1 que Laberinto.matriz, manteniendo en memoria solo el
+estado de conjuntos de una fila de celdas. Permite crear laberintos de altura
+arbitraria y enviarlos directamente a disco o a un renderizador sin llegar a
+construir nunca la matriz completa.
+"""
+
+from typing import Iterator, Optional
+
+import numpy as np
+
+
+def generar_filas_eller(filas: int, columnas: int,
+                        rng: Optional[np.random.Generator] = None) -> Iterator[np.ndarray]:
+    """
+    Genera un laberinto perfecto fila a fila con el algoritmo de Eller.
+
+    Args:
+        filas: Número de filas del laberinto.
+        columnas: Número de columnas del laberinto.
+        rng: Generador aleatorio de NumPy. Si es None se crea uno nuevo.
+
+    Yields:
+        Filas terminadas del laberinto, en orden, como arrays uint8 de
+        longitud columnas (0 = camino, 1 = pared). En total se producen
+        exactamente filas filas.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    R = len(range(1, filas - 1, 2))
+    K = len(range(1, columnas - 1, 2))
+
+    # Primera fila: borde superior
+    yield np.ones(columnas, dtype=np.uint8)
+    emitidas = 1
+
+    # Conjunto al que pertenece cada celda de la fila actual
+    conjuntos = np.arange(K)
+
+    for r in range(R):
+        ultima = r == R - 1
+
+        # Renumerar los conjuntos a 0..K-1 para la unión-búsqueda de la fila
+        _, conjuntos = np.unique(conjuntos, return_inverse=True)
+        padre = list(range(K))
+
+        def buscar(x: int) -> int:
+            while padre[x] != x:
+                padre[x] = padre[padre[x]]
+                x = padre[x]
+            return x
+
+        # Unir celdas adyacentes de conjuntos distintos (en la última fila, todas)
+        if ultima:
+            unir = [True] * (K - 1)
+        else:
+            unir = (rng.random(K - 1) < 0.5).tolist()
+        este = np.zeros(max(K - 1, 0), dtype=bool)
+        etiquetas = conjuntos.tolist()
+        for k in range(K - 1):
+            if unir[k]:
+                a = buscar(etiquetas[k])
+                b = buscar(etiquetas[k + 1])
+                if a != b:
+                    padre[b] = a
+                    este[k] = True
+        raices = np.array([buscar(e) for e in etiquetas], dtype=np.int64)
+
+        # Fila de celdas con sus paredes este
+        fila_celdas = np.ones(columnas, dtype=np.uint8)
+        fila_celdas[1:2 * K:2] = 0
+        fila_celdas[2:2 * K - 1:2][este] = 0
+        yield fila_celdas
+        emitidas += 1
+
+        if ultima:
+            break
+
+        # Elegir conexiones hacia abajo, al menos una por conjunto
+        abajo = rng.random(K) < 0.5
+        con_salida = np.zeros(K, dtype=bool)
+        con_salida[raices[abajo]] = True
+        orden = rng.permutation(K)
+        etiquetas_orden, primeras = np.unique(raices[orden], return_index=True)
+        sin_salida = ~con_salida[etiquetas_orden]
+        abajo[orden[primeras[sin_salida]]] = True
+
+        # Fila de paredes entre esta fila de celdas y la siguiente
+        fila_paredes = np.ones(columnas, dtype=np.uint8)
+        fila_paredes[1:2 * K:2][abajo] = 0
+        yield fila_paredes
+        emitidas += 1
+
+        # Las celdas sin conexión hacia abajo empiezan un conjunto nuevo
+        conjuntos = raices.copy()
+        nuevas = ~abajo
+        conjuntos[nuevas] = K + np.arange(np.count_nonzero(nuevas))
+
+    # Filas restantes: borde inferior
+    for _ in range(filas - emitidas):
+        yield np.ones(columnas, dtype=np.uint8)
@@ -0,0 +1,389 @@
+"""
+Módulo de compresión del laberinto en un grafo de pasillos.
+
+La mayoría de las celdas de camino de un laberinto son pasillos: tienen
+exactamente dos vecinos libres. Este módulo convierte Laberinto.matriz en un
+grafo mucho más pequeño cuyos nodos son los cruces (3 o 4 vecinos libres),
+los callejones sin salida (1 vecino), las celdas aisladas y las celdas que se
+pidan de forma explícita (por ejemplo el inicio y la meta). Cada arista es un
+pasillo entre dos nodos, con un peso igual a su longitud en pasos.
+
+El grafo se guarda en formato CSR (indptr, indices, pesos) y conserva en orden
+las celdas de cada pasillo, de modo que cualquier camino del grafo se puede
+traducir de vuelta a celdas de la matriz.
+"""
+
+import heapq
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+class GrafoPasillos:
+    """
+    Grafo no dirigido de cruces, callejones y pasillos de un laberinto.
+
+    Los nodos se numeran en el orden de lectura de la matriz. Las celdas se
+    identifican por su índice plano fila * columnas + columna.
+
+    Atributos:
+        forma: Forma (filas, columnas) de la matriz original.
+        nodos: Índice plano de la celda de cada nodo (int64, ordenado).
+        extremos: Nodos (origen, destino) de cada arista, array int32 (E, 2).
+        longitudes: Número de pasos de cada arista (int32).
+        celdas_indptr, celdas: Celdas intermedias de cada arista, en orden
+            desde su origen hasta su destino; las de la arista e son
+            celdas[celdas_indptr[e]:celdas_indptr[e + 1]].
+        indptr, indices, pesos: Lista de adyacencia en formato CSR; los
+            vecinos del nodo n son indices[indptr[n]:indptr[n + 1]].
+        aristas: Arista de cada entrada de la lista de adyacencia.
+    """
+
+    def __init__(self, forma: Tuple[int, int], nodos: np.ndarray, extremos: np.ndarray,
+                 longitudes: np.ndarray, celdas_indptr: np.ndarray, celdas: np.ndarray):
+        """
+        Inicializa el grafo a partir de sus nodos y aristas.
+
+        Args:
+            forma: Forma (filas, columnas) de la matriz original.
+            nodos: Índice plano de la celda de cada nodo, ordenado.
+            extremos: Nodos (origen, destino) de cada arista.
+            longitudes: Número de pasos de cada arista.
+            celdas_indptr: Inicio de las celdas de cada arista en celdas.
+            celdas: Celdas intermedias de todas las aristas, concatenadas.
+        """
+        self.forma = forma
+        self.nodos = nodos
+        self.extremos = extremos
+        self.longitudes = longitudes
+        self.celdas_indptr = celdas_indptr
+        self.celdas = celdas
+
+        # Cada arista aparece dos veces en la lista de adyacencia, una por sentido
+        num_aristas = len(extremos)
+        origenes = np.concatenate((extremos[:, 0], extremos[:, 1]))
+        destinos = np.concatenate((extremos[:, 1], extremos[:, 0]))
+        orden = np.argsort(origenes, kind="stable")
+        self.indptr = np.zeros(len(nodos) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(origenes, minlength=len(nodos)), out=self.indptr[1:])
+        self.indices = destinos[orden].astype(np.int32)
+        self.aristas = (orden % max(num_aristas, 1)).astype(np.int32)
+        self.pesos = longitudes[self.aristas]
+
+        self._listas = None
+        self._celdas_ordenadas = None
+
+    @classmethod
+    def desde_matriz(cls, matriz: np.ndarray, extra: Iterable[Tuple[int, int]] = ()) -> "GrafoPasillos":
+        """
+        Comprime la matriz de un laberinto en un grafo de pasillos.
+
+        Todos los pasillos se recorren a la vez con NumPy: cada celda de
+        pasillo guarda la suma de los índices de sus dos vecinos libres, así
+        que el siguiente paso es esa suma menos la celda de la que se viene.
+
+        Args:
+            matriz: Matriz del laberinto (0 = camino, 1 = pared).
+            extra: Celdas (fila, columna) que deben ser nodos aunque sean
+                   pasillos, por ejemplo el inicio y la meta. Se ignoran las
+                   que son pared.
+
+        Returns:
+            Nuevo GrafoPasillos.
+        """
+        matriz = np.asarray(matriz)
+        filas, columnas = matriz.shape
+        ancho = columnas + 2
+
+        # Celdas libres con un borde de paredes para no comprobar límites
+        libres = np.zeros((filas + 2, ancho), dtype=bool)
+        libres[1:-1, 1:-1] = matriz == 0
+        tipo = np.int32 if libres.size < 2 ** 31 else np.int64
+        planos = np.arange(libres.size, dtype=tipo).reshape(libres.shape)
+
+        # Número de vecinos libres y suma de sus índices planos
+        grado = np.zeros(libres.shape, dtype=np.uint8)
+        suma = np.zeros(libres.shape, dtype=tipo)
+        for df, dc in ((-1, 0), (0, 1), (1, 0), (0, -1)):
+            vecinos = libres[1 + df:filas + 1 + df, 1 + dc:columnas + 1 + dc]
+            grado[1:-1, 1:-1] += vecinos
+            suma[1:-1, 1:-1] += vecinos * planos[1 + df:filas + 1 + df, 1 + dc:columnas + 1 + dc]
+
+        es_nodo = libres & (grado != 2)
+        for fila, columna in extra:
+            es_nodo[fila + 1, columna + 1] |= libres[fila + 1, columna + 1]
+
+        libres, es_nodo, suma = libres.ravel(), es_nodo.ravel(), suma.ravel()
+        direcciones = (-ancho, 1, ancho, -1)
+
+        def salidas(nodos: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            origenes = [nodos[libres[nodos + d]] for d in direcciones]
+            primeras = [o + d for o, d in zip(origenes, direcciones)]
+            return np.concatenate(origenes), np.concatenate(primeras)
+
+        recorridos = [_recorrer(*salidas(np.flatnonzero(es_nodo)), es_nodo, suma)]
+
+        # Los ciclos formados solo por pasillos no tocan ningún nodo: se
+        # convierte en nodo una celda de cada uno y se recorren desde ella
+        cubiertas = np.zeros(libres.size, dtype=bool)
+        cubiertas[recorridos[0][5]] = True
+        for p in np.flatnonzero(libres & ~es_nodo & ~cubiertas):
+            if not cubiertas[p]:
+                es_nodo[p] = True
+                recorridos.append(_recorrer(*salidas(np.array([p], dtype=tipo)), es_nodo, suma))
+                cubiertas[recorridos[-1][5]] = True
+
+        # Unir los recorridos, renumerando los caminantes de cada uno
+        desplazamiento = 0
+        for k, recorrido in enumerate(recorridos):
+            recorridos[k] = recorrido[:5] + (recorrido[5], recorrido[6] + desplazamiento)
+            desplazamiento += len(recorrido[0])
+        origenes, primeras, finales, penultimas, longitudes, celdas, caminantes = (
+            np.concatenate(columna) for columna in zip(*recorridos))
+
+        # Cada pasillo se recorre una vez desde cada extremo: se conserva el
+        # recorrido cuya pareja (primera celda, origen) es menor
+        conservar = (primeras < penultimas) | ((primeras == penultimas) & (origenes < finales))
+        elegidos = np.flatnonzero(conservar)
+        elegidos = elegidos[np.lexsort((primeras[elegidos], origenes[elegidos]))]
+
+        arista_de_caminante = np.full(len(origenes), -1, dtype=np.int64)
+        arista_de_caminante[elegidos] = np.arange(len(elegidos))
+        aristas_celdas = arista_de_caminante[caminantes]
+        validas = aristas_celdas >= 0
+        orden = np.argsort(aristas_celdas[validas], kind="stable")
+        celdas = celdas[validas][orden]
+
+        nodos = np.flatnonzero(es_nodo)
+        extremos = np.empty((len(elegidos), 2), dtype=np.int32)
+        extremos[:, 0] = np.searchsorted(nodos, origenes[elegidos])
+        extremos[:, 1] = np.searchsorted(nodos, finales[elegidos])
+        longitudes = longitudes[elegidos].astype(np.int32)
+        celdas_indptr = np.zeros(len(elegidos) + 1, dtype=np.int64)
+        np.cumsum(longitudes - 1, out=celdas_indptr[1:])
+
+        def sin_borde(planos: np.ndarray) -> np.ndarray:
+            planos = planos.astype(np.int64)
+            return (planos // ancho - 1) * columnas + planos % ancho - 1
+
+        return cls((filas, columnas), sin_borde(nodos), extremos, longitudes,
+                   celdas_indptr, sin_borde(celdas))
+
+    @property
+    def num_nodos(self) -> int:
+        """Número de nodos del grafo."""
+        return len(self.nodos)
+
+    @property
+    def num_aristas(self) -> int:
+        """Número de aristas (pasillos) del grafo."""
+        return len(self.extremos)
+
+    def nodo(self, fila: int, columna: int) -> int:
+        """
+        Busca el nodo de una celda.
+
+        Args:
+            fila: Fila de la celda.
+            columna: Columna de la celda.
+
+        Returns:
+            Índice del nodo, o -1 si la celda no es un nodo.
+        """
+        plano = fila * self.forma[1] + columna
+        indice = int(np.searchsorted(self.nodos, plano))
+        if indice < len(self.nodos) and self.nodos[indice] == plano:
+            return indice
+        return -1
+
+    def localizar(self, fila: int, columna: int) -> Tuple[int, int]:
+        """
+        Busca el pasillo que contiene una celda.
+
+        Args:
+            fila: Fila de la celda.
+            columna: Columna de la celda.
+
+        Returns:
+            Tupla (arista, posicion) con la arista y la posición de la celda
+            entre sus celdas intermedias (0 = la más cercana al origen), o
+            (-1, -1) si la celda es un nodo o una pared.
+        """
+        if self._celdas_ordenadas is None:
+            self._celdas_ordenadas = np.argsort(self.celdas, kind="stable")
+        plano = fila * self.forma[1] + columna
+        indice = int(np.searchsorted(self.celdas, plano, sorter=self._celdas_ordenadas))
+        if indice == len(self.celdas) or self.celdas[self._celdas_ordenadas[indice]] != plano:
+            return -1, -1
+        posicion = int(self._celdas_ordenadas[indice])
+        arista = int(np.searchsorted(self.celdas_indptr, posicion, side="right")) - 1
+        return arista, posicion - int(self.celdas_indptr[arista])
+
+    def celdas_arista(self, arista: int, desde: Optional[int] = None) -> np.ndarray:
+        """
+        Devuelve las celdas de un pasillo, con sus dos extremos.
+
+        Args:
+            arista: Índice de la arista.
+            desde: Nodo extremo por el que empezar. Si es None se empieza por
+                   el origen de la arista.
+
+        Returns:
+            Array int32 de forma (L, 2) con las celdas (fila, columna).
+        """
+        origen, destino = (int(n) for n in self.extremos[arista])
+        planos = np.concatenate(([self.nodos[origen]],
+                                 self.celdas[self.celdas_indptr[arista]:self.celdas_indptr[arista + 1]],
+                                 [self.nodos[destino]]))
+        if desde is not None and desde != origen:
+            planos = planos[::-1]
+        return self._a_coordenadas(planos)
+
+    def camino_mas_corto(self, origen: int, destino: int) -> Tuple[List[int], int]:
+        """
+        Busca el camino más corto entre dos nodos con el algoritmo de Dijkstra.
+
+        Args:
+            origen: Nodo de partida.
+            destino: Nodo de llegada.
+
+        Returns:
+            Tupla (aristas, expandidos) con las aristas del camino en orden
+            (vacía si no hay camino o si origen == destino) y el número de
+            nodos que se sacaron de la cola de prioridad.
+        """
+        if self._listas is None:
+            self._listas = (self.indptr.tolist(), self.indices.tolist(),
+                            self.pesos.tolist(), self.aristas.tolist())
+        indptr, indices, pesos, aristas = self._listas
+
+        infinito = float("inf")
+        distancias = [infinito] * len(self.nodos)
+        padres = [-1] * len(self.nodos)
+        distancias[origen] = 0
+        cola = [(0, origen)]
+        expandidos = 0
+        while cola:
+            distancia, nodo = heapq.heappop(cola)
+            if distancia > distancias[nodo]:
+                continue
+            expandidos += 1
+            if nodo == destino:
+                break
+            for h in range(indptr[nodo], indptr[nodo + 1]):
+                vecino = indices[h]
+                nueva = distancia + pesos[h]
+                if nueva < distancias[vecino]:
+                    distancias[vecino] = nueva
+                    padres[vecino] = aristas[h]
+                    heapq.heappush(cola, (nueva, vecino))
+        else:
+            return [], expandidos
+
+        # Reconstruir las aristas desde el destino
+        camino = []
+        nodo = destino
+        while nodo != origen:
+            arista = padres[nodo]
+            camino.append(arista)
+            a, b = self.extremos[arista]
+            nodo = int(a if b == nodo else b)
+        camino.reverse()
+        return camino, expandidos
+
+    def resolver(self, inicio: Tuple[int, int], meta: Tuple[int, int]) -> Tuple[np.ndarray, int]:
+        """
+        Busca el camino más corto entre dos celdas que sean nodos del grafo.
+
+        Args:
+            inicio: Celda (fila, columna) de partida.
+            meta: Celda (fila, columna) de llegada.
+
+        Returns:
+            Tupla (camino, expandidos) en el formato de generador.resolucion:
+            las celdas del camino en un array int32 de forma (L, 2), vacío si
+            no hay camino, y el número de nodos expandidos.
+
+        Raises:
+            ValueError: Si inicio o meta son camino pero no son nodos (el
+                        grafo debe construirse con ellos en extra).
+        """
+        origen, destino = self.nodo(*inicio), self.nodo(*meta)
+        for celda, nodo in ((inicio, origen), (meta, destino)):
+            if nodo < 0 and self.localizar(*celda)[0] >= 0:
+                raise ValueError(f"La celda {celda} no es un nodo del grafo")
+        if origen < 0 or destino < 0:
+            return np.empty((0, 2), dtype=np.int32), 0
+
+        aristas, expandidos = self.camino_mas_corto(origen, destino)
+        if origen != destino and not aristas:
+            return np.empty((0, 2), dtype=np.int32), expandidos
+
+        # Encadenar las celdas de cada arista en el sentido del recorrido
+        tramos = [np.array([self.nodos[origen]])]
+        nodo = origen
+        for arista in aristas:
+            a, b = (int(n) for n in self.extremos[arista])
+            intermedias = self.celdas[self.celdas_indptr[arista]:self.celdas_indptr[arista + 1]]
+            if a != nodo:
+                intermedias = intermedias[::-1]
+            nodo = b if a == nodo else a
+            tramos += [intermedias, [self.nodos[nodo]]]
+        return self._a_coordenadas(np.concatenate(tramos)), expandidos
+
+    def _a_coordenadas(self, planos: np.ndarray) -> np.ndarray:
+        """
+        Convierte índices planos de la matriz en coordenadas (fila, columna).
+
+        Returns:
+            Array int32 de forma (L, 2).
+        """
+        planos = np.asarray(planos, dtype=np.int64)
+        coordenadas = np.empty((planos.size, 2), dtype=np.int32)
+        coordenadas[:, 0] = planos // self.forma[1]
+        coordenadas[:, 1] = planos % self.forma[1]
+        return coordenadas
+
+
+def _recorrer(origenes: np.ndarray, primeras: np.ndarray, es_nodo: np.ndarray,
+              suma: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Recorre a la vez varios pasillos hasta el siguiente nodo de cada uno.
+
+    Args:
+        origenes: Índice plano (con borde) del nodo del que sale cada caminante.
+        primeras: Primera celda de cada caminante, vecina de su origen.
+        es_nodo: Máscara plana de nodos, con borde.
+        suma: Suma de los índices planos de los vecinos libres de cada celda.
+
+    Returns:
+        Tupla (origenes, primeras, finales, penultimas, longitudes, celdas,
+        caminantes): el nodo al que llega cada caminante, la celda anterior a
+        él, el número de pasos, y todas las celdas intermedias recorridas,
+        agrupadas por paso, con el caminante que pasó por cada una.
+    """
+    n = len(origenes)
+    finales = np.empty(n, dtype=origenes.dtype)
+    penultimas = np.empty(n, dtype=origenes.dtype)
+    longitudes = np.empty(n, dtype=np.int64)
+
+    caminantes = np.arange(n, dtype=np.int32)
+    previas, actuales = origenes, primeras
+    visitadas, de_caminante = [primeras[:0]], [caminantes[:0]]
+    pasos = 1
+    while caminantes.size:
+        llegados = es_nodo[actuales]
+        if llegados.any():
+            terminados = caminantes[llegados]
+            finales[terminados] = actuales[llegados]
+            penultimas[terminados] = previas[llegados]
+            longitudes[terminados] = pasos
+            siguen = ~llegados
+            caminantes, previas, actuales = caminantes[siguen], previas[siguen], actuales[siguen]
+        visitadas.append(actuales)
+        de_caminante.append(caminantes)
+        previas, actuales = actuales, suma[actuales] - previas
+        pasos += 1
+
+    return (origenes, primeras, finales, penultimas, longitudes,
+            np.concatenate(visitadas), np.concatenate(de_caminante))
@@ -0,0 +1,165 @@
+"""
+Módulo de inundación por bits sobre laberintos.
+
+Este módulo responde a dos preguntas sin calcular distancias: qué celdas son
+alcanzables desde un origen y si una celda concreta lo es. Cada fila del
+laberinto se guarda como un entero de Python con un bit por celda (columna 0
+en el bit más significativo, el orden de np.packbits), de modo que una sola
+operación de bits trabaja con toda la fila, 64 celdas por palabra de máquina.
+
+La inundación avanza fila a fila:
+
+- En horizontal, las semillas de una fila se extienden de una vez a todo su
+  tramo de celdas libres con un acarreo: al sumar la semilla a la máscara de
+  libres, el acarreo recorre el tramo hasta la siguiente pared. Para el otro
+  sentido se hace la misma suma sobre la fila con los bits invertidos.
+- En vertical, las celdas nuevas de una fila siembran las filas vecinas, que
+  se apilan para volver a procesarlas hasta que ninguna fila cambia.
+
+El coste depende del número de tramos horizontales del recorrido y no del de
+celdas, así que es mucho menor que el de un BFS celda a celda en laberintos
+con pasillos horizontales largos, y similar en los más retorcidos.
+"""
+
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from generador.almacenamiento import MatrizBits
+
+
+# Tabla que invierte el orden de los bits de un byte
+_INVERTIR_BITS = bytes(int(f"{byte:08b}"[::-1], 2) for byte in range(256))
+
+
+def _filas_libres(matriz: Union[np.ndarray, MatrizBits]) -> Tuple[np.ndarray, int]:
+    """
+    Empaqueta las celdas libres del laberinto a un bit por celda.
+
+    Args:
+        matriz: Matriz del laberinto (0 = camino, 1 = pared) o MatrizBits.
+
+    Returns:
+        Tupla (libres, columnas) con un array uint8 de forma
+        (filas, bytes_por_fila) en el que 1 = camino y los bits de relleno
+        del final de cada fila valen 0, y el número de columnas.
+    """
+    if isinstance(matriz, MatrizBits):
+        columnas = matriz.shape[1]
+        libres = ~matriz.bits
+        if columnas % 8:
+            libres[:, -1] &= (0xFF << (8 - columnas % 8)) & 0xFF
+        return libres, columnas
+    matriz = np.asarray(matriz)
+    return np.packbits(matriz == 0, axis=1), matriz.shape[1]
+
+
+def _inundar(matriz: Union[np.ndarray, MatrizBits], origen: Tuple[int, int],
+             destino: Optional[Tuple[int, int]] = None) -> Tuple[List[int], int, int, bool]:
+    """
+    Inunda el laberinto desde el origen.
+
+    Args:
+        matriz: Matriz del laberinto (0 = camino, 1 = pared) o MatrizBits.
+        origen: Celda (fila, columna) desde la que se inunda.
+        destino: Celda (fila, columna) en la que detenerse en cuanto se
+            alcance. Si es None se inunda toda la región del origen.
+
+    Returns:
+        Tupla (alcanzadas, bytes_por_fila, columnas, encontrado): alcanzadas
+        tiene un entero por fila más una fila de borde vacía arriba y abajo,
+        con las celdas alcanzadas como bits en el orden de np.packbits;
+        encontrado indica si se llegó al destino.
+    """
+    libres_empaquetadas, columnas = _filas_libres(matriz)
+    filas, bytes_por_fila = libres_empaquetadas.shape
+    bits = bytes_por_fila * 8
+
+    def invertir(x: int) -> int:
+        return int.from_bytes(x.to_bytes(bytes_por_fila, "big").translate(_INVERTIR_BITS), "little")
+
+    # Filas como enteros, con una fila de borde sin celdas libres arriba y abajo
+    libres = [0] + [int.from_bytes(fila, "big") for fila in map(bytes, libres_empaquetadas)] + [0]
+    invertidas = [invertir(fila) for fila in libres]
+    alcanzadas = [0] * (filas + 2)
+
+    # Las coordenadas pueden ser enteros de NumPy (por ejemplo de np.argwhere),
+    # que desbordan a 64 bits al construir las máscaras de fila
+    fila_destino, bit_destino = -1, 0
+    if destino is not None:
+        fila_destino, bit_destino = int(destino[0]) + 1, 1 << (bits - 1 - int(destino[1]))
+
+    i = int(origen[0]) + 1
+    semillas = (1 << (bits - 1 - int(origen[1]))) & libres[i]
+    pendientes = bytearray(filas + 2)
+    pila = []
+    sentido = 1
+
+    while semillas:
+        # Extender las semillas a sus tramos completos en ambos sentidos
+        libre, invertida = libres[i], invertidas[i]
+        nuevas = (((libre + semillas) ^ libre) & libre) | semillas
+        if (semillas >> 1) & libre & ~nuevas:
+            # Solo hace falta invertir la fila si alguna semilla tiene celdas libres a su derecha
+            semillas_invertidas = invertir(semillas)
+            nuevas |= invertir((((invertida + semillas_invertidas) ^ invertida) & invertida)
+                               | semillas_invertidas)
+        nuevas &= ~alcanzadas[i]
+        alcanzadas[i] |= nuevas
+
+        if i == fila_destino and alcanzadas[i] & bit_destino:
+            return alcanzadas, bytes_por_fila, columnas, True
+
+        # Apilar las filas vecinas que las celdas nuevas pueden sembrar; la del
+        # sentido en que avanza la inundación se apila la última para seguir por ella
+        for vecina in (i - sentido, i + sentido):
+            if not pendientes[vecina] and nuevas & libres[vecina] & ~alcanzadas[vecina]:
+                pendientes[vecina] = 1
+                pila.append(vecina)
+
+        semillas = 0
+        while pila and not semillas:
+            anterior, i = i, pila.pop()
+            sentido = 1 if i > anterior else -1
+            pendientes[i] = 0
+            semillas = (alcanzadas[i - 1] | alcanzadas[i + 1]) & libres[i] & ~alcanzadas[i]
+
+    return alcanzadas, bytes_por_fila, columnas, False
+
+
+def celdas_alcanzables(matriz: Union[np.ndarray, MatrizBits], origen: Tuple[int, int]) -> np.ndarray:
+    """
+    Calcula qué celdas son alcanzables desde el origen.
+
+    Args:
+        matriz: Matriz del laberinto (0 = camino, 1 = pared) o MatrizBits.
+        origen: Celda (fila, columna) desde la que se inunda.
+
+    Returns:
+        Matriz booleana con la misma forma que matriz, True en las celdas de
+        camino alcanzables desde el origen (el propio origen incluido si es
+        camino). Equivale a calcular_distancias(matriz, origen) >= 0.
+    """
+    alcanzadas, bytes_por_fila, columnas, _ = _inundar(matriz, origen)
+    empaquetadas = np.frombuffer(b"".join(fila.to_bytes(bytes_por_fila, "big")
+                                          for fila in alcanzadas[1:-1]), dtype=np.uint8)
+    empaquetadas = empaquetadas.reshape(len(alcanzadas) - 2, bytes_por_fila)
+    return np.unpackbits(empaquetadas, axis=1, count=columnas).astype(bool)
+
+
+def es_alcanzable(matriz: Union[np.ndarray, MatrizBits], origen: Tuple[int, int],
+                  destino: Tuple[int, int]) -> bool:
+    """
+    Comprueba si hay un camino entre dos celdas.
+
+    La inundación se detiene en cuanto alcanza el destino.
+
+    Args:
+        matriz: Matriz del laberinto (0 = camino, 1 = pared) o MatrizBits.
+        origen: Celda (fila, columna) de partida.
+        destino: Celda (fila, columna) de llegada.
+
+    Returns:
+        True si ambas celdas son camino y están conectadas.
+    """
+    return _inundar(matriz, origen, destino)[3]
@@ -2,16 +2,21 @@
 Módulo de generación de laberintos.
 
 Este módulo contiene la clase Laberinto y la lógica para generar
-laberintos aleatorios con diferentes niveles de dificultad.
+laberintos aleatorios con diferentes niveles de dificultad. No depende de
+pygame: el dibujo del laberinto está en renderizador.dibujo.
 """
 
-import random
 import numpy as np
 from typing import Tuple, List, Dict, Any, Optional
 
-import pygame
-from configuracion.config import TAMANO_CELDA, GROSOR_PARED, BLANCO, NEGRO, ROJO, VERDE
-from utilidades.helpers import calcular_centro_celda
+from configuracion.config import TAMANO_CELDA, BYTES_POR_BANDA
+from generador.motor_dfs import crear_mapa_visitadas, desplazamientos
+from generador.algoritmos import obtener_algoritmo, obtener_algoritmo_por_filas
+from generador.distancias import calcular_distancias
+from generador.resolucion import resolver as resolver_camino
+from generador.grafo import GrafoPasillos
+from generador.componentes import etiquetar_componentes, paredes_de_union
+from generador.almacenamiento import crear_almacenamiento, crear_matriz
 
 
 class Laberinto:
@@ -19,12 +24,15 @@ class Laberinto:
     Clase que representa un laberinto y contiene la lógica para generarlo.
     
     Esta clase implementa el algoritmo de generación de laberintos usando
-    el método de división recursiva, y proporciona métodos para dibujar
-    y comprobar colisiones en el laberinto.
+    el método de división recursiva, y proporciona métodos para comprobar
+    colisiones en el laberinto (para dibujarlo, ver renderizador.dibujo).
     """
     
     def __init__(self, filas: int, columnas: int, complejidad: float = 0.5, 
-                 densidad: float = 0.5):
+                 densidad: float = 0.5, meta_lejana: bool = False,
+                 algoritmo: str = "dfs", semilla: Optional[int] = None,
+                 generar: bool = True, almacenamiento: str = "uint8",
+                 ruta: Optional[str] = None):
         """
         Inicializa un nuevo laberinto.
         
@@ -33,162 +41,276 @@ class Laberinto:
             columnas: Número de columnas del laberinto.
             complejidad: Factor de complejidad del laberinto (0-1).
             densidad: Factor de densidad de paredes (0-1).
+            meta_lejana: Si es True, la meta se coloca en la celda más alejada
+                         del inicio recorriendo el laberinto.
+            algoritmo: Nombre del algoritmo de generación registrado en
+                       generador.algoritmos (dfs, kruskal, prim, wilson,
+                       sidewinder, arbol_binario, growing_tree o eller).
+            semilla: Semilla del generador aleatorio propio del laberinto. Con
+                     la misma semilla y los mismos parámetros se obtiene
+                     siempre la misma matriz. Si es None se elige una al azar
+                     (y queda guardada en self.semilla).
+            generar: Si es False, no se ejecuta la generación y la matriz se
+                     deja vacía para rellenarla desde fuera (ver desde_matriz).
+            almacenamiento: Formato de la matriz una vez generada: "int" (un
+                            entero de 64 bits por celda), "uint8" (un byte),
+                            "bits" (un bit) o "memmap" (un byte en el fichero
+                            ruta, ver generador.almacenamiento). Todos admiten
+                            el mismo acceso matriz[fila, columna].
+            ruta: Fichero donde se proyecta la matriz con almacenamiento
+                  "memmap". En ese modo la generación recorre la matriz por
+                  bandas de filas en orden, solo admite los algoritmos con
+                  versión fila a fila (sidewinder y eller) y no se calcula el
+                  campo de distancias (self.distancias es None). Con los
+                  demás formatos se calcula la primera vez que se consulta.
+            
+        Raises:
+            ValueError: Si el almacenamiento no existe o no admite las opciones
+                        pedidas.
         """
         self.filas = filas
         self.columnas = columnas
         self.complejidad = complejidad
         self.densidad = densidad
+        self.meta_lejana = meta_lejana
+        self.algoritmo = algoritmo
+        self.almacenamiento = almacenamiento
+        self.ruta = ruta
+        
+        if almacenamiento == "memmap":
+            if meta_lejana:
+                raise ValueError('meta_lejana no está disponible con almacenamiento "memmap"')
+            if generar:
+                obtener_algoritmo_por_filas(algoritmo)
+        
+        # Generador aleatorio propio: todos los sorteos de la generación salen de él
+        if semilla is None:
+            semilla = np.random.SeedSequence().entropy
+        self.semilla = semilla
+        self.rng = np.random.default_rng(semilla)
         self.ancho = columnas * TAMANO_CELDA
         self.alto = filas * TAMANO_CELDA
         
-        # Inicializar la matriz del laberinto (0 = camino, 1 = pared)
-        self.matriz = np.zeros((filas, columnas), dtype=int)
+        # Inicializar la matriz del laberinto (0 = camino, 1 = pared). Durante
+        # la generación es siempre un ndarray; el formato "bits" se aplica al final
+        self.matriz, self._compactar_al_final = crear_matriz(filas, columnas, almacenamiento, ruta)
+        
+        # Filas que se procesan a la vez en las pasadas sobre la matriz (par).
+        # En memoria toda la matriz cabe en una banda
+        if almacenamiento == "memmap":
+            self._filas_por_banda = max(2, BYTES_POR_BANDA // max(1, columnas) // 2 * 2)
+        else:
+            self._filas_por_banda = filas + filas % 2
         
         # Posiciones de inicio y meta
         self.inicio = (0, 0)
         self.meta = (filas - 1, columnas - 1)
         
+        # Campo de distancias a la meta, calculado al consultarlo (ver distancias)
+        self._distancias = None
+        
         # Generar el laberinto
-        self._generar()
+        if generar:
+            self._generar()
+            self._compactar()
     
-    def _generar(self) -> None:
+    @classmethod
+    def desde_nivel(cls, config_dificultad: Dict[str, Any],
+                    semilla: Optional[int] = None,
+                    almacenamiento: str = "uint8") -> "Laberinto":
+        """
+        Genera un laberinto con los parámetros de un nivel de NIVELES_DIFICULTAD.
+        
+        Args:
+            config_dificultad: Configuración del nivel (tamano, complejidad,
+                               densidad y, opcionalmente, algoritmo).
+            semilla: Semilla del generador aleatorio (None = aleatoria).
+            almacenamiento: Formato de la matriz ("int", "uint8" o "bits").
+            
+        Returns:
+            Nuevo laberinto generado.
         """
-        Genera un laberinto aleatorio usando una versión mejorada del algoritmo DFS
-        con modificaciones para crear laberintos más complejos y desafiantes.
+        filas, columnas = config_dificultad["tamano"]
+        return cls(filas, columnas, config_dificultad["complejidad"],
+                   config_dificultad["densidad"],
+                   algoritmo=config_dificultad.get("algoritmo", "dfs"),
+                   semilla=semilla, almacenamiento=almacenamiento)
+    
+    @classmethod
+    def desde_matriz(cls, matriz: np.ndarray, inicio: Tuple[int, int], meta: Tuple[int, int],
+                     complejidad: float = 0.5, densidad: float = 0.5,
+                     meta_lejana: bool = False, algoritmo: str = "dfs",
+                     semilla: Optional[int] = None,
+                     distancias: Optional[np.ndarray] = None,
+                     almacenamiento: str = "uint8",
+                     ruta: Optional[str] = None) -> "Laberinto":
         """
-        # Inicializar todas las celdas como paredes
-        self.matriz.fill(1)
+        Crea un laberinto a partir de una matriz ya generada, sin ejecutar _generar.
         
-        # Definir direcciones: arriba, derecha, abajo, izquierda
-        direcciones = [(-2, 0), (0, 2), (2, 0), (0, -2)]
+        Args:
+            matriz: Matriz del laberinto (0 = camino, 1 = pared).
+            inicio: Posición (fila, columna) de inicio.
+            meta: Posición (fila, columna) de la meta.
+            complejidad: Factor de complejidad con el que se generó.
+            densidad: Factor de densidad con el que se generó.
+            meta_lejana: Si la meta se colocó en la celda más alejada del inicio.
+            algoritmo: Algoritmo con el que se generó.
+            semilla: Semilla con la que se generó.
+            distancias: Campo de distancias a la meta ya calculado. Si es None
+                        se calcula la primera vez que se consulte (salvo con
+                        "memmap").
+            almacenamiento: Formato de la matriz ("int", "uint8", "bits" o "memmap").
+            ruta: Fichero donde se proyecta la matriz (solo para "memmap").
+            
+        Returns:
+            Nuevo laberinto con los datos indicados.
+        """
+        filas, columnas = matriz.shape
+        laberinto = cls(filas, columnas, complejidad, densidad, meta_lejana,
+                        algoritmo, semilla, generar=False,
+                        almacenamiento=almacenamiento, ruta=ruta)
+        laberinto.matriz[:] = matriz
+        laberinto.inicio = (int(inicio[0]), int(inicio[1]))
+        laberinto.meta = (int(meta[0]), int(meta[1]))
+        
+        if distancias is not None:
+            laberinto._distancias = np.array(distancias, dtype=np.int32)
+        laberinto._compactar()
+        
+        return laberinto
+    
+    def _compactar(self) -> None:
+        """
+        Convierte la matriz de trabajo al formato de almacenamiento final.
         
-        # Elegir una celda inicial aleatoria (debe ser impar para que las paredes queden en posiciones pares)
-        inicio_x = random.randrange(1, self.filas - 1, 2)
-        inicio_y = random.randrange(1, self.columnas - 1, 2)
+        Solo hace algo con el formato "bits": "int" y "uint8" ya se generan
+        directamente en su tipo definitivo.
+        """
+        if self._compactar_al_final:
+            self.matriz = crear_almacenamiento(self.matriz, self.almacenamiento)
+            self._compactar_al_final = False
+    
+    @property
+    def distancias(self) -> Optional[np.ndarray]:
+        """
+        Distancia de cada celda a la meta (-1 = pared o inalcanzable).
         
-        # Marcar la celda inicial como camino
-        self.matriz[inicio_x, inicio_y] = 0
+        Es una matriz int32, 4 bytes por celda, así que no se calcula al
+        generar sino con un BFS la primera vez que se consulta, y se guarda
+        para las siguientes. Así un laberinto "bits" o "uint8" que nadie
+        recorre solo ocupa su matriz. Es None con almacenamiento "memmap".
+        """
+        if self._distancias is None and self.almacenamiento != "memmap":
+            self._distancias = calcular_distancias(self.matriz, self.meta)
+        return self._distancias
+    
+    def _generar(self) -> None:
+        """
+        Genera un laberinto aleatorio con el algoritmo seleccionado (por defecto
+        una versión mejorada del DFS) y añade modificaciones para crear
+        laberintos más complejos y desafiantes.
+        """
+        if self.almacenamiento == "memmap":
+            self._generar_por_filas()
+            return
+        
+        # Excavar el laberinto perfecto con el algoritmo registrado
+        generar = obtener_algoritmo(self.algoritmo)
+        celdas, bifurcaciones = generar(self.filas, self.columnas, self.rng)
         
-        # Pila para el algoritmo DFS
-        pila = [(inicio_x, inicio_y)]
-        visitadas = set([(inicio_x, inicio_y)])
+        # Volcar el resultado en la matriz del laberinto de una sola vez
+        self.matriz[:] = celdas
         
-        # Lista para almacenar puntos de bifurcación potenciales
-        bifurcaciones = []
+        # Mapa de bits de celdas visitadas (las celdas impares ya excavadas)
+        visitadas = crear_mapa_visitadas(self.filas, self.columnas, celdas)
         
         # Factor de ramificación (probabilidad de crear caminos adicionales)
         factor_ramificacion = min(0.3, self.complejidad * 0.4)  # Ajustar según complejidad
         
-        # Mientras haya celdas en la pila
-        while pila:
-            # Obtener la celda actual
-            x, y = pila[-1]
-            
-            # Encontrar vecinos no visitados (a 2 celdas de distancia)
-            vecinos = []
-            random.shuffle(direcciones)  # Aleatorizar direcciones para variedad
-            
-            for dx, dy in direcciones:
-                nx, ny = x + dx, y + dy
-                
-                # Verificar que el vecino esté dentro de los límites
-                if 1 <= nx < self.filas - 1 and 1 <= ny < self.columnas - 1:
-                    # Si el vecino no ha sido visitado
-                    if (nx, ny) not in visitadas:
-                        vecinos.append((nx, ny, dx // 2, dy // 2))
-            
-            # Si hay vecinos no visitados
-            if vecinos:
-                # Si hay más de un vecino, este es un punto de bifurcación potencial
-                if len(vecinos) > 1:
-                    bifurcaciones.append((x, y, vecinos[1:]))
-                
-                # Elegir un vecino aleatorio
-                nx, ny, wx, wy = vecinos[0]
-                
-                # Derribar la pared entre la celda actual y el vecino
-                self.matriz[x + wx, y + wy] = 0
-                
-                # Marcar el vecino como camino
-                self.matriz[nx, ny] = 0
-                
-                # Agregar el vecino a la pila y marcarlo como visitado
-                pila.append((nx, ny))
-                visitadas.add((nx, ny))
-            else:
-                # Si no hay vecinos no visitados, retroceder
-                pila.pop()
-        
         # Crear callejones sin salida adicionales y caminos alternativos
         self._agregar_complejidad(visitadas, bifurcaciones, factor_ramificacion)
         
         # Crear algunos ciclos para hacer el laberinto más desafiante
         self._crear_ciclos(visitadas, self.densidad * 0.15)
     
+    def _generar_por_filas(self) -> None:
+        """
+        Genera el laberinto escribiendo la matriz fila a fila y en orden.
+        
+        Es el camino de generación del almacenamiento "memmap": el algoritmo
+        produce las filas en orden, así que las páginas del fichero se
+        escriben de forma secuencial, y las pasadas posteriores (ciclos,
+        inicio y meta) recorren la matriz por bandas de filas. Los algoritmos
+        fila a fila no devuelven bifurcaciones, por lo que no hay callejones
+        adicionales, igual que con sus versiones en memoria.
+        """
+        generar_filas = obtener_algoritmo_por_filas(self.algoritmo)
+        for i, fila in enumerate(generar_filas(self.filas, self.columnas, self.rng)):
+            self.matriz[i] = fila
+        
+        self._crear_ciclos(None, self.densidad * 0.15)
+        self.matriz.flush()
+    
     def _agregar_complejidad(self, visitadas, bifurcaciones, factor_ramificacion):
         """
         Agrega complejidad adicional al laberinto creando callejones sin salida
         y caminos alternativos.
         
         Args:
-            visitadas: Conjunto de celdas ya visitadas.
-            bifurcaciones: Lista de puntos de bifurcación potenciales.
+            visitadas: Mapa de bits de celdas ya visitadas (índices planos).
+            bifurcaciones: Lista plana de pares [celda, vecino, ...] con los
+                           puntos de bifurcación potenciales.
             factor_ramificacion: Probabilidad de crear caminos adicionales.
         """
-        # Procesar puntos de bifurcación para crear callejones sin salida
-        random.shuffle(bifurcaciones)  # Aleatorizar para variedad
+        num_pares = len(bifurcaciones) // 2
         
         # Limitar el número de bifurcaciones para no hacer el laberinto demasiado fácil
-        num_bifurcaciones = int(len(bifurcaciones) * factor_ramificacion)
+        num_bifurcaciones = int(num_pares * factor_ramificacion)
+        if num_bifurcaciones == 0:
+            return
         
-        for i in range(min(num_bifurcaciones, len(bifurcaciones))):
-            x, y, vecinos = bifurcaciones[i]
-            
-            # Elegir un vecino aleatorio para crear un callejon sin salida
-            if vecinos:
-                nx, ny, wx, wy = vecinos[0]
+        # Elegir bifurcaciones al azar (equivale a barajar y tomar las primeras)
+        pares = np.asarray(bifurcaciones, dtype=np.int64).reshape(-1, 2)
+        elegidas = pares[self.rng.choice(num_pares, num_bifurcaciones, replace=False)]
+        
+        celdas = self.matriz.reshape(-1)
+        for p, q in elegidas.tolist():
+            # Verificar si el vecino aún no ha sido visitado (podría haber cambiado)
+            if not visitadas[q]:
+                # Derribar la pared y marcar el vecino como camino
+                celdas[(p + q) // 2] = 0
+                celdas[q] = 0
                 
-                # Verificar si el vecino aún no ha sido visitado (podría haber cambiado)
-                if (nx, ny) not in visitadas:
-                    # Derribar la pared
-                    self.matriz[x + wx, y + wy] = 0
-                    
-                    # Marcar el vecino como camino
-                    self.matriz[nx, ny] = 0
-                    
-                    # Crear un callejon sin salida de longitud variable
-                    longitud = random.randint(1, 3)
-                    self._crear_callejon(nx, ny, longitud, visitadas)
+                # Crear un callejon sin salida de longitud variable
+                longitud = int(self.rng.integers(1, 4))
+                self._crear_callejon(q, longitud, visitadas)
     
-    def _crear_callejon(self, x, y, longitud, visitadas):
+    def _crear_callejon(self, p, longitud, visitadas):
         """
         Crea un callejon sin salida de longitud variable.
         
         Args:
-            x, y: Coordenadas iniciales.
+            p: Índice plano de la celda inicial.
             longitud: Longitud máxima del callejon.
-            visitadas: Conjunto de celdas ya visitadas.
+            visitadas: Mapa de bits de celdas ya visitadas (índices planos).
         """
         # Direcciones: arriba, derecha, abajo, izquierda
-        direcciones = [(-2, 0), (0, 2), (2, 0), (0, -2)]
-        random.shuffle(direcciones)
+        direcciones = [desplazamientos(self.columnas)[k] for k in self.rng.permutation(4)]
         
+        celdas = self.matriz.reshape(-1)
         for _ in range(longitud):
-            for dx, dy in direcciones:
-                nx, ny = x + dx, y + dy
+            for d, m in direcciones:
+                q = p + d
                 
-                # Verificar límites y que no haya sido visitada
-                if (1 <= nx < self.filas - 1 and 1 <= ny < self.columnas - 1 and 
-                    (nx, ny) not in visitadas):
-                    # Derribar la pared
-                    self.matriz[x + dx // 2, y + dy // 2] = 0
-                    
-                    # Marcar como camino
-                    self.matriz[nx, ny] = 0
-                    visitadas.add((nx, ny))
+                # Las celdas fuera de límites están marcadas como visitadas
+                if not visitadas[q]:
+                    # Derribar la pared y marcar como camino
+                    celdas[p + m] = 0
+                    celdas[q] = 0
+                    visitadas[q] = 1
                     
                     # Continuar desde la nueva posición
-                    x, y = nx, ny
+                    p = q
                     break
             else:
                 # No se encontró dirección válida, terminar
@@ -200,22 +322,30 @@ class Laberinto:
         el laberinto más desafiante con múltiples rutas.
         
         Args:
-            visitadas: Conjunto de celdas ya visitadas.
+            visitadas: Mapa de bits de celdas ya visitadas.
             probabilidad: Probabilidad de crear un ciclo.
         """
-        # Recorrer celdas interiores
-        for i in range(2, self.filas - 2, 2):
-            for j in range(2, self.columnas - 2, 2):
-                # Solo considerar paredes (no esquinas)
-                if self.matriz[i, j] == 1:
-                    # Verificar si es una pared horizontal o vertical
-                    es_horizontal = (self.matriz[i-1, j] == 0 and self.matriz[i+1, j] == 0)
-                    es_vertical = (self.matriz[i, j-1] == 0 and self.matriz[i, j+1] == 0)
-                    
-                    # Si es una pared válida y se cumple la probabilidad
-                    if (es_horizontal or es_vertical) and random.random() < probabilidad:
-                        # Derribar la pared para crear un ciclo
-                        self.matriz[i, j] = 0
+        f, c = self.filas, self.columnas
+        
+        # Recorrer las filas pares interiores por bandas (una sola en memoria).
+        # Sortear banda a banda consume los mismos números que un único sorteo
+        for a in range(2, f - 2, self._filas_por_banda):
+            b = min(a + self._filas_por_banda, f - 2)
+            
+            # Celdas interiores de coordenadas pares (vista sobre la matriz) y sus vecinas
+            interior = self.matriz[a:b:2, 2:c - 2:2]
+            arriba = self.matriz[a - 1:b - 1:2, 2:c - 2:2]
+            abajo = self.matriz[a + 1:b + 1:2, 2:c - 2:2]
+            izquierda = self.matriz[a:b:2, 1:c - 3:2]
+            derecha = self.matriz[a:b:2, 3:c - 1:2]
+            
+            # Verificar si es una pared horizontal o vertical
+            es_horizontal = (arriba == 0) & (abajo == 0)
+            es_vertical = (izquierda == 0) & (derecha == 0)
+            candidatas = (interior == 1) & (es_horizontal | es_vertical)
+            
+            # Derribar las paredes válidas que superen el sorteo para crear ciclos
+            interior[candidatas & (self.rng.random(interior.shape) < probabilidad)] = 0
         
         # Asegurar que inicio y meta sean caminos
         self._establecer_inicio_meta()
@@ -227,15 +357,35 @@ class Laberinto:
         """
         Establece las posiciones de inicio y meta, asegurando que estén en extremos opuestos
         del laberinto y que sean caminos válidos (no paredes).
+        
+        Si meta_lejana está activado, la meta se coloca en la celda de camino más
+        alejada del inicio recorriendo el laberinto (BFS).
         """
-        # Encontrar todas las celdas que son caminos
-        caminos = []
-        for i in range(1, self.filas - 1):
-            for j in range(1, self.columnas - 1):
-                if self.matriz[i, j] == 0:
-                    caminos.append((i, j))
+        mitad_fila = self.filas // 2
+        mitad_columna = self.columnas // 2
         
-        if not caminos:
+        # Buscar caminos en el cuadrante superior izquierdo para el inicio;
+        # si no hay, en la mitad izquierda, y si aún no hay, cualquiera disponible.
+        # De cada criterio se guarda el punto más cercano a la esquina superior
+        # izquierda como (suma, fila, columna)
+        candidatos_inicio = [None, None, None]
+        hay_caminos = False
+        for siguiente, filas_caminos, columnas_caminos in self._caminos_por_bandas(1):
+            hay_caminos = hay_caminos or filas_caminos.size > 0
+            mitad_izquierda = columnas_caminos < mitad_columna
+            mascaras = (mitad_izquierda & (filas_caminos < mitad_fila),
+                        mitad_izquierda,
+                        np.ones_like(mitad_izquierda))
+            suma = filas_caminos + columnas_caminos
+            for k, mascara in enumerate(mascaras):
+                candidatos_inicio[k] = self._mejor_candidato(
+                    candidatos_inicio[k], suma, filas_caminos, columnas_caminos, mascara, False)
+            
+            # Las bandas siguientes no pueden mejorar el candidato del cuadrante
+            if candidatos_inicio[0] is not None and candidatos_inicio[0][0] <= siguiente + 1:
+                break
+        
+        if not hay_caminos:
             # Si no hay caminos, crear al menos uno
             self.matriz[1, 1] = 0
             self.matriz[self.filas - 2, self.columnas - 2] = 0
@@ -243,102 +393,156 @@ class Laberinto:
             self.meta = (self.filas - 2, self.columnas - 2)
             return
         
-        # Dividir el laberinto en cuadrantes
-        mitad_fila = self.filas // 2
-        mitad_columna = self.columnas // 2
+        _, fila_inicio, columna_inicio = next(c for c in candidatos_inicio if c is not None)
+        self.inicio = (fila_inicio, columna_inicio)
         
-        # Buscar caminos en el cuadrante superior izquierdo para el inicio
-        caminos_inicio = []
-        for i, j in caminos:
-            if i < mitad_fila and j < mitad_columna:
-                caminos_inicio.append((i, j))
-        
-        # Si no hay caminos en ese cuadrante, buscar en la mitad izquierda
-        if not caminos_inicio:
-            for i, j in caminos:
-                if j < mitad_columna:
-                    caminos_inicio.append((i, j))
-        
-        # Si aún no hay caminos, usar cualquiera disponible
-        if not caminos_inicio:
-            caminos_inicio = caminos
-        
-        # Seleccionar el punto más cercano a la esquina superior izquierda
-        self.inicio = min(caminos_inicio, key=lambda pos: pos[0] + pos[1])
-        
-        # Buscar caminos en el cuadrante inferior derecho para la meta
-        caminos_meta = []
-        for i, j in caminos:
-            # Asegurar que esté lejos del inicio (al menos la mitad del tamaño del laberinto)
-            distancia_al_inicio = abs(i - self.inicio[0]) + abs(j - self.inicio[1])
-            if (i >= mitad_fila and j >= mitad_columna and 
-                distancia_al_inicio > max(self.filas, self.columnas) // 2):
-                caminos_meta.append((i, j))
-        
-        # Si no hay caminos en ese cuadrante, buscar en la mitad derecha
-        if not caminos_meta:
-            for i, j in caminos:
-                if j >= mitad_columna and (i, j) != self.inicio:
-                    caminos_meta.append((i, j))
-        
-        # Si aún no hay caminos, usar cualquiera disponible excepto el inicio
-        if not caminos_meta:
-            caminos_meta = [pos for pos in caminos if pos != self.inicio]
+        if self.meta_lejana:
+            # Colocar la meta en la celda más alejada del inicio recorriendo el laberinto
+            distancias = calcular_distancias(self.matriz, self.inicio)
+            indice_meta = np.unravel_index(np.argmax(distancias), distancias.shape)
+            self.meta = (int(indice_meta[0]), int(indice_meta[1]))
+            
+            if self.meta == self.inicio:
+                # Si el inicio está aislado, colocar la meta en la esquina opuesta
+                self.meta = (self.filas - 2, self.columnas - 2)
+            
+            self.matriz[self.inicio] = 0
+            self.matriz[self.meta] = 0
+            return
+        
+        # Buscar caminos en el cuadrante inferior derecho para la meta,
+        # asegurando que esté lejos del inicio (al menos la mitad del tamaño del laberinto);
+        # si no hay, en la mitad derecha, y si aún no hay, cualquiera excepto el inicio.
+        # De cada criterio se guarda el punto más cercano a la esquina inferior
+        # derecha (máxima distancia a esa esquina, igual que el criterio original)
+        candidatos_meta = [None, None, None]
+        umbral = max(self.filas, self.columnas) // 2
+        
+        # Primero se recorre solo desde la mitad inferior, donde está el
+        # cuadrante preferido; el resto solo hace falta si en él no hay caminos
+        for siguiente, filas_caminos, columnas_caminos in self._caminos_por_bandas(max(1, mitad_fila)):
+            distancia_al_inicio = (np.abs(filas_caminos - self.inicio[0]) +
+                                   np.abs(columnas_caminos - self.inicio[1]))
+            mascara = ((columnas_caminos >= mitad_columna) & (filas_caminos >= mitad_fila) &
+                       (distancia_al_inicio > umbral))
+            distancia_esquina = ((self.filas - filas_caminos - 1) +
+                                 (self.columnas - columnas_caminos - 1))
+            candidatos_meta[0] = self._mejor_candidato(
+                candidatos_meta[0], distancia_esquina, filas_caminos, columnas_caminos,
+                mascara, True)
+            
+            # Las bandas siguientes no pueden mejorar el candidato del cuadrante
+            cota = (self.filas - siguiente - 1) + (self.columnas - 2)
+            if candidatos_meta[0] is not None and candidatos_meta[0][0] >= cota:
+                break
+        
+        if candidatos_meta[0] is None:
+            for _, filas_caminos, columnas_caminos in self._caminos_por_bandas(1):
+                distancia_al_inicio = (np.abs(filas_caminos - self.inicio[0]) +
+                                       np.abs(columnas_caminos - self.inicio[1]))
+                no_inicio = distancia_al_inicio > 0
+                mascaras = ((columnas_caminos >= mitad_columna) & no_inicio, no_inicio)
+                distancia_esquina = ((self.filas - filas_caminos - 1) +
+                                     (self.columnas - columnas_caminos - 1))
+                for k, mascara in enumerate(mascaras, start=1):
+                    candidatos_meta[k] = self._mejor_candidato(
+                        candidatos_meta[k], distancia_esquina, filas_caminos, columnas_caminos,
+                        mascara, True)
+        
+        candidato_meta = next((c for c in candidatos_meta if c is not None), None)
         
         # Si por alguna razón no hay otros caminos, crear uno
-        if not caminos_meta:
+        if candidato_meta is None:
             nueva_meta = (self.filas - 2, self.columnas - 2)
             self.matriz[nueva_meta] = 0
             self.meta = nueva_meta
             return
         
-        # Seleccionar el punto más cercano a la esquina inferior derecha
-        self.meta = max(caminos_meta, 
-                        key=lambda pos: (self.filas - pos[0] - 1) + (self.columnas - pos[1] - 1))
+        self.meta = candidato_meta[1:]
         
         # Asegurar que inicio y meta sean caminos (no paredes)
         self.matriz[self.inicio] = 0
         self.matriz[self.meta] = 0
     
-    def _garantizar_solucion(self) -> None:
-        """
-        Garantiza que exista al menos un camino entre el inicio y la meta.
-        Utiliza un algoritmo de búsqueda en profundidad (DFS).
+    def _caminos_por_bandas(self, desde: int):
         """
-        # Crear una copia de la matriz para marcar celdas visitadas
-        visitado = np.zeros((self.filas, self.columnas), dtype=bool)
+        Recorre en orden por filas las celdas interiores que son caminos.
         
-        # Función recursiva para DFS
-        def dfs(x: int, y: int) -> bool:
-            if (x, y) == self.meta:
-                return True
-            
-            visitado[x, y] = True
-            
-            # Direcciones: arriba, derecha, abajo, izquierda
-            direcciones = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-            random.shuffle(direcciones)  # Aleatorizar para variedad
+        Args:
+            desde: Primera fila que se recorre.
             
-            for dx, dy in direcciones:
-                nx, ny = x + dx, y + dy
-                
-                # Verificar límites
-                if 0 <= nx < self.filas and 0 <= ny < self.columnas:
-                    # Si es un camino y no ha sido visitado
-                    if self.matriz[nx, ny] == 0 and not visitado[nx, ny]:
-                        if dfs(nx, ny):
-                            return True
+        Yields:
+            Tuplas (siguiente, filas_caminos, columnas_caminos) con la primera
+            fila de la banda siguiente y las coordenadas de los caminos de cada
+            banda de filas (una sola banda en memoria).
+        """
+        for a in range(desde, self.filas - 1, self._filas_por_banda):
+            b = min(a + self._filas_por_banda, self.filas - 1)
+            filas_caminos, columnas_caminos = np.nonzero(self.matriz[a:b, 1:self.columnas - 1] == 0)
+            yield b, filas_caminos + a, columnas_caminos + 1
+    
+    @staticmethod
+    def _mejor_candidato(actual, valores, filas_caminos, columnas_caminos, mascara, maximizar):
+        """
+        Compara el mejor candidato de una banda con el mejor encontrado hasta ahora.
+        
+        Args:
+            actual: Mejor candidato anterior (valor, fila, columna) o None.
+            valores: Valor de cada camino de la banda.
+            filas_caminos: Fila de cada camino de la banda.
+            columnas_caminos: Columna de cada camino de la banda.
+            mascara: Caminos de la banda que cumplen el criterio.
+            maximizar: Si es True gana el valor mayor; si es False, el menor.
             
-            return False
+        Returns:
+            El mejor candidato (valor, fila, columna), o None si no hay ninguno.
+            En caso de empate se conserva el primero en orden por filas.
+        """
+        if not mascara.any():
+            return actual
+        
+        if maximizar:
+            indice = np.argmax(np.where(mascara, valores, -1))
+        else:
+            indice = np.argmin(np.where(mascara, valores, np.iinfo(valores.dtype).max))
+        valor = int(valores[indice])
+        
+        if actual is None or (valor > actual[0] if maximizar else valor < actual[0]):
+            return valor, int(filas_caminos[indice]), int(columnas_caminos[indice])
+        return actual
+    
+    def _garantizar_solucion(self) -> None:
+        """
+        Garantiza que exista al menos un camino entre el inicio y la meta.
         
-        # Verificar si hay un camino
-        if not dfs(*self.inicio):
-            # Si no hay camino, crear uno
-            self._crear_camino()
+        La conexión se decide con el etiquetado de componentes conexas, que
+        también sirve para elegir las paredes que hay que abrir si el inicio y
+        la meta están en componentes distintas. El campo de distancias a la
+        meta no se calcula aquí, sino al consultarlo, con el laberinto ya
+        conectado.
+        """
+        if self.almacenamiento == "memmap":
+            # Los algoritmos fila a fila producen laberintos perfectos y los
+            # pasos posteriores solo abren paredes, así que inicio y meta ya
+            # están conectados
+            return
+        
+        etiquetas, _ = etiquetar_componentes(self.matriz)
+        if etiquetas[self.inicio] != etiquetas[self.meta]:
+            # Unir las componentes del inicio y de la meta abriendo el menor
+            # número de paredes sueltas entre ellas
+            paredes = paredes_de_union(self.matriz, self.inicio, self.meta, etiquetas)
+            if paredes is not None:
+                self.matriz[paredes[:, 0], paredes[:, 1]] = 0
+            else:
+                self._crear_camino()
     
     def _crear_camino(self) -> None:
         """
         Crea un camino directo entre el inicio y la meta.
+        
+        Solo se usa cuando el inicio y la meta no se pueden conectar abriendo
+        paredes sueltas (ver generador.componentes.paredes_de_union).
         """
         x, y = self.inicio
         meta_x, meta_y = self.meta
@@ -353,48 +557,6 @@ class Laberinto:
             x += 1 if x < meta_x else -1
             self.matriz[x, y] = 0
     
-    def dibujar(self, superficie: pygame.Surface) -> None:
-        """
-        Dibuja el laberinto en la superficie proporcionada.
-        
-        Args:
-            superficie: Superficie de pygame donde dibujar el laberinto.
-        """
-        # Asegurar que inicio y meta sean caminos antes de dibujar
-        self.matriz[self.inicio] = 0
-        self.matriz[self.meta] = 0
-        
-        # Dibujar celdas
-        for i in range(self.filas):
-            for j in range(self.columnas):
-                x = j * TAMANO_CELDA
-                y = i * TAMANO_CELDA
-                
-                # Dibujar paredes o caminos
-                if self.matriz[i, j] == 1:
-                    pygame.draw.rect(superficie, NEGRO, 
-                                    (x, y, TAMANO_CELDA, TAMANO_CELDA))
-                else:
-                    pygame.draw.rect(superficie, BLANCO, 
-                                    (x, y, TAMANO_CELDA, TAMANO_CELDA))
-                    
-                    # Dibujar borde de la celda
-                    pygame.draw.rect(superficie, NEGRO, 
-                                    (x, y, TAMANO_CELDA, TAMANO_CELDA), 
-                                    GROSOR_PARED)
-        
-        # Dibujar inicio y meta
-        inicio_x, inicio_y = calcular_centro_celda(*self.inicio, TAMANO_CELDA)
-        meta_x, meta_y = calcular_centro_celda(*self.meta, TAMANO_CELDA)
-        
-        # Dibujar inicio (círculo rojo)
-        pygame.draw.circle(superficie, ROJO, (inicio_y, inicio_x), 
-                          TAMANO_CELDA // 3)
-        
-        # Dibujar meta (círculo verde)
-        pygame.draw.circle(superficie, VERDE, (meta_y, meta_x), 
-                          TAMANO_CELDA // 3)
-    
     def es_pared(self, fila: int, columna: int) -> bool:
         """
         Verifica si una celda es una pared.
@@ -424,3 +586,47 @@ class Laberinto:
             True si la celda es la meta, False en caso contrario.
         """
         return (fila, columna) == self.meta
+    
+    def distancia_a_meta(self, fila: int, columna: int) -> int:
+        """
+        Obtiene la distancia recorriendo el laberinto desde una celda hasta la meta.
+        
+        Args:
+            fila: Número de fila de la celda.
+            columna: Número de columna de la celda.
+            
+        Returns:
+            Número de pasos hasta la meta, o -1 si la celda es una pared,
+            está fuera de los límites, no tiene camino hasta la meta o el
+            laberinto no tiene campo de distancias (almacenamiento "memmap").
+        """
+        # Verificar límites
+        if self.distancias is None or fila < 0 or fila >= self.filas or columna < 0 or columna >= self.columnas:
+            return -1
+        
+        return int(self.distancias[fila, columna])
+    
+    def resolver(self, metodo: str = "bfs") -> Tuple[np.ndarray, int]:
+        """
+        Busca el camino más corto desde el inicio hasta la meta.
+        
+        Args:
+            metodo: Nombre del resolutor de generador.resolucion (bfs,
+                    bfs_bidireccional, a_estrella, jps o grafo).
+            
+        Returns:
+            Tupla (camino, expandidos) con las celdas (fila, columna) del
+            camino en un array int32 de forma (L, 2) y el número de nodos
+            expandidos por el resolutor.
+        """
+        return resolver_camino(self.matriz, self.inicio, self.meta, metodo)
+    
+    def grafo_pasillos(self) -> GrafoPasillos:
+        """
+        Comprime el laberinto en un grafo de cruces, callejones y pasillos.
+        
+        Returns:
+            GrafoPasillos de la matriz actual, con el inicio y la meta como
+            nodos aunque estén en mitad de un pasillo.
+        """
+        return GrafoPasillos.desde_matriz(self.matriz, extra=(self.inicio, self.meta))
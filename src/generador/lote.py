@@ -0,0 +1,165 @@
+"""
+Generación de laberintos por lotes en varios procesos.
+
+Este módulo reparte la generación de muchos laberintos entre un grupo de
+procesos. Cada proceso escribe la matriz y el campo de distancias de sus
+laberintos directamente en bloques de memoria compartida
+(multiprocessing.shared_memory), de modo que al proceso principal solo vuelven
+las coordenadas de inicio y meta y nunca se serializa una matriz grande.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from configuracion.config import NIVELES_DIFICULTAD
+from generador.laberinto import Laberinto
+
+
+def _generar_tramo(nombre_matrices: str, nombre_distancias: str, primero: int,
+                   semillas: List[int], parametros: Dict) -> List[Tuple]:
+    """
+    Genera un tramo consecutivo de laberintos dentro de un proceso trabajador.
+
+    Args:
+        nombre_matrices: Nombre del bloque compartido de matrices (uint8).
+        nombre_distancias: Nombre del bloque compartido de distancias (int32).
+        primero: Índice en el lote del primer laberinto del tramo.
+        semillas: Semilla de cada laberinto del tramo.
+        parametros: Parámetros comunes (filas, columnas, complejidad, densidad,
+                    algoritmo).
+
+    Returns:
+        Lista de tuplas (indice, inicio, meta), una por laberinto.
+    """
+    filas, columnas = parametros["filas"], parametros["columnas"]
+    # Los bloques pertenecen al proceso principal, que es quien los libera
+    memoria_matrices = shared_memory.SharedMemory(name=nombre_matrices)
+    memoria_distancias = shared_memory.SharedMemory(name=nombre_distancias)
+
+    matrices = distancias = None
+    try:
+        matrices = np.ndarray((primero + len(semillas), filas, columnas), dtype=np.uint8,
+                              buffer=memoria_matrices.buf)
+        distancias = np.ndarray((primero + len(semillas), filas, columnas), dtype=np.int32,
+                                buffer=memoria_distancias.buf)
+
+        resultados = []
+        for desplazamiento, semilla in enumerate(semillas):
+            indice = primero + desplazamiento
+            laberinto = Laberinto(filas, columnas, parametros["complejidad"],
+                                  parametros["densidad"], algoritmo=parametros["algoritmo"],
+                                  semilla=semilla)
+            matrices[indice] = laberinto.matriz
+            distancias[indice] = laberinto.distancias
+            resultados.append((indice, laberinto.inicio, laberinto.meta))
+
+        return resultados
+    finally:
+        # Soltar las vistas antes de cerrar los bloques
+        matrices = distancias = None
+        memoria_matrices.close()
+        memoria_distancias.close()
+
+
+def iterar_lote(n: int, dificultad: str, workers: Optional[int] = None,
+                semilla: Optional[int] = None, ordenado: bool = True,
+                tamano_tramo: Optional[int] = None) -> Iterator[Tuple[int, Laberinto]]:
+    """
+    Genera un lote de laberintos en varios procesos y los devuelve como flujo.
+
+    Args:
+        n: Número de laberintos a generar.
+        dificultad: Nivel de NIVELES_DIFICULTAD cuyos parámetros se usan.
+        workers: Número de procesos (por defecto, el número de CPU).
+        semilla: Semilla del lote; de ella se derivan las de cada laberinto,
+                 por lo que el mismo valor reproduce el mismo lote.
+        ordenado: Si es True, los laberintos salen en el orden del lote; si es
+                  False, en cuanto termina cada tramo.
+        tamano_tramo: Laberintos por tarea enviada a un proceso. Por defecto
+                      se reparten unas cuatro tareas por proceso.
+
+    Yields:
+        Tuplas (indice, laberinto).
+    """
+    if n <= 0:
+        return
+
+    config = NIVELES_DIFICULTAD[dificultad]
+    filas, columnas = config["tamano"]
+    parametros = {
+        "filas": filas,
+        "columnas": columnas,
+        "complejidad": config["complejidad"],
+        "densidad": config["densidad"],
+        "algoritmo": config.get("algoritmo", "dfs"),
+    }
+
+    workers = workers or os.cpu_count() or 1
+    tamano_tramo = tamano_tramo or max(1, -(-n // (workers * 4)))
+
+    # Una semilla independiente por laberinto, derivada de la del lote
+    semillas = np.random.SeedSequence(semilla).generate_state(n, dtype=np.uint64).tolist()
+
+    celdas = n * filas * columnas
+    memoria_matrices = shared_memory.SharedMemory(create=True, size=max(1, celdas))
+    memoria_distancias = shared_memory.SharedMemory(create=True, size=max(1, 4 * celdas))
+
+    matrices = distancias = None
+    try:
+        matrices = np.ndarray((n, filas, columnas), dtype=np.uint8, buffer=memoria_matrices.buf)
+        distancias = np.ndarray((n, filas, columnas), dtype=np.int32, buffer=memoria_distancias.buf)
+
+        with ProcessPoolExecutor(max_workers=workers) as grupo:
+            tareas = [
+                grupo.submit(_generar_tramo, memoria_matrices.name, memoria_distancias.name,
+                             primero, semillas[primero:primero + tamano_tramo], parametros)
+                for primero in range(0, n, tamano_tramo)
+            ]
+
+            pendientes = {}
+            siguiente = 0
+            for tarea in as_completed(tareas):
+                for indice, inicio, meta in tarea.result():
+                    # Copiar desde la memoria compartida al laberinto definitivo
+                    laberinto = Laberinto.desde_matriz(
+                        matrices[indice], inicio, meta, parametros["complejidad"],
+                        parametros["densidad"], algoritmo=parametros["algoritmo"],
+                        semilla=semillas[indice], distancias=distancias[indice])
+
+                    if not ordenado:
+                        yield indice, laberinto
+                        continue
+
+                    # Retener los que llegan adelantados hasta que les toque
+                    pendientes[indice] = laberinto
+                    while siguiente in pendientes:
+                        yield siguiente, pendientes.pop(siguiente)
+                        siguiente += 1
+    finally:
+        # Soltar las vistas antes de cerrar y liberar los bloques
+        matrices = distancias = None
+        memoria_matrices.close()
+        memoria_matrices.unlink()
+        memoria_distancias.close()
+        memoria_distancias.unlink()
+
+
+def generar_lote(n: int, dificultad: str, workers: Optional[int] = None,
+                 semilla: Optional[int] = None) -> List[Laberinto]:
+    """
+    Genera un lote de laberintos en varios procesos.
+
+    Args:
+        n: Número de laberintos a generar.
+        dificultad: Nivel de NIVELES_DIFICULTAD cuyos parámetros se usan.
+        workers: Número de procesos (por defecto, el número de CPU).
+        semilla: Semilla del lote (el mismo valor reproduce el mismo lote).
+
+    Returns:
+        Lista de laberintos en el orden del lote.
+    """
+    return [laberinto for _, laberinto in iterar_lote(n, dificultad, workers, semilla)]
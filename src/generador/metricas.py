@@ -0,0 +1,141 @@
+"""
+Módulo de métricas de laberintos.
+
+Este módulo mide propiedades estructurales de uno o muchos laberintos con
+operaciones de NumPy sobre la matriz completa, sin recorrer celdas en Python,
+para poder puntuar decenas de miles de laberintos generados (por ejemplo al
+calibrar los niveles de NIVELES_DIFICULTAD). Un lote es una pila de matrices
+de la misma forma, (n, filas, columnas).
+
+Todas las métricas se calculan sobre la región de celdas de camino conectada
+con la meta:
+
+- callejones: celdas con un solo vecino libre.
+- proporcion_callejones: callejones por celda de camino de la región.
+- cruces: celdas con tres o cuatro vecinos libres.
+- ciclos: número ciclomático de la región (aristas - celdas + 1), es decir,
+  cuántos pasillos se pueden abrir de más respecto a un laberinto perfecto.
+- longitud_pasillo: longitud media, en pasos, de los pasillos entre cruces
+  y callejones (la media de GrafoPasillos.longitudes).
+- longitud_solucion: pasos del camino más corto del inicio a la meta (-1 si
+  no hay camino).
+- factor_rio: celdas fuera del camino de la solución por cada callejón. Un
+  factor alto indica pocos callejones pero largos (el laberinto "fluye");
+  uno bajo, muchos callejones cortos.
+"""
+
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from generador.distancias import calcular_distancias
+
+
+METRICAS = ("callejones", "proporcion_callejones", "cruces", "ciclos", "longitud_pasillo",
+            "longitud_solucion", "factor_rio")
+
+
+def calcular_metricas(matrices: np.ndarray, inicios: np.ndarray, metas: np.ndarray,
+                      distancias: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """
+    Calcula las métricas de un lote de laberintos.
+
+    Args:
+        matrices: Matrices de los laberintos (0 = camino, 1 = pared), de forma
+                  (n, filas, columnas) o (filas, columnas) para uno solo.
+        inicios: Celdas (fila, columna) de inicio, de forma (n, 2) o (2,).
+        metas: Celdas (fila, columna) de meta, de forma (n, 2) o (2,).
+        distancias: Campos de distancias a la meta con la misma forma que
+                    matrices (Laberinto.distancias). Si es None se calculan
+                    con un BFS por laberinto, que es la parte más costosa.
+
+    Returns:
+        Diccionario {métrica: array de n valores}, con las claves de METRICAS.
+        callejones, cruces, ciclos y longitud_solucion son enteros; el resto,
+        float64.
+    """
+    matrices = np.asarray(matrices)
+    if matrices.ndim == 2:
+        matrices = matrices[np.newaxis]
+    inicios = np.asarray(inicios, dtype=np.int64).reshape(-1, 2)
+    metas = np.asarray(metas, dtype=np.int64).reshape(-1, 2)
+    n = len(matrices)
+
+    if distancias is None:
+        distancias = np.stack([calcular_distancias(matriz, tuple(meta))
+                               for matriz, meta in zip(matrices, metas)])
+    else:
+        distancias = np.asarray(distancias).reshape(matrices.shape)
+
+    # Región conectada con la meta
+    region = distancias >= 0
+    celdas = region.sum(axis=(1, 2))
+
+    # Pares de celdas vecinas de la región y vecinos libres de cada celda
+    horizontales = region[:, :, :-1] & region[:, :, 1:]
+    verticales = region[:, :-1, :] & region[:, 1:, :]
+    aristas = horizontales.sum(axis=(1, 2)) + verticales.sum(axis=(1, 2))
+
+    grado = np.zeros(region.shape, dtype=np.uint8)
+    grado[:, :, :-1] += horizontales
+    grado[:, :, 1:] += horizontales
+    grado[:, :-1, :] += verticales
+    grado[:, 1:, :] += verticales
+
+    callejones = (region & (grado == 1)).sum(axis=(1, 2))
+    cruces = (region & (grado >= 3)).sum(axis=(1, 2))
+    ciclos = np.where(celdas > 0, aristas - celdas + 1, 0)
+
+    # Cada par de vecinas es un paso de exactamente un pasillo, y cada
+    # pasillo suma dos a los grados de los nodos (cruces y callejones) que une
+    extremos_pasillos = np.where(region & (grado != 2), grado, 0).sum(axis=(1, 2))
+    longitud_pasillo = np.divide(2 * aristas, extremos_pasillos, out=np.zeros(n),
+                                 where=extremos_pasillos > 0)
+
+    indices = np.arange(n)
+    longitud_solucion = distancias[indices, inicios[:, 0], inicios[:, 1]].astype(np.int64)
+
+    fuera_de_solucion = np.where(longitud_solucion >= 0, celdas - longitud_solucion - 1, 0)
+    factor_rio = np.divide(fuera_de_solucion, callejones, out=np.zeros(n), where=callejones > 0)
+
+    return {
+        "callejones": callejones,
+        "proporcion_callejones": np.divide(callejones, celdas, out=np.zeros(n), where=celdas > 0),
+        "cruces": cruces,
+        "ciclos": ciclos,
+        "longitud_pasillo": longitud_pasillo,
+        "longitud_solucion": longitud_solucion,
+        "factor_rio": factor_rio,
+    }
+
+
+def medir_laberintos(laberintos: Sequence) -> Dict[str, np.ndarray]:
+    """
+    Calcula las métricas de varios laberintos de la misma forma.
+
+    Args:
+        laberintos: Secuencia de instancias de Laberinto, por ejemplo el
+                    resultado de generador.lote.generar_lote.
+
+    Returns:
+        Diccionario {métrica: array con un valor por laberinto}.
+    """
+    distancias = None
+    if all(laberinto.distancias is not None for laberinto in laberintos):
+        distancias = np.stack([laberinto.distancias for laberinto in laberintos])
+    return calcular_metricas(np.stack([np.asarray(laberinto.matriz) for laberinto in laberintos]),
+                             [laberinto.inicio for laberinto in laberintos],
+                             [laberinto.meta for laberinto in laberintos], distancias)
+
+
+def medir_laberinto(laberinto) -> Dict[str, float]:
+    """
+    Calcula las métricas de un laberinto.
+
+    Args:
+        laberinto: Instancia de Laberinto.
+
+    Returns:
+        Diccionario {métrica: valor}.
+    """
+    return {nombre: valores[0].item() for nombre, valores in medir_laberintos([laberinto]).items()}
@@ -0,0 +1,143 @@
+"""
+Motor DFS de alto rendimiento para la generación de laberintos.
+
+Este módulo implementa el algoritmo de búsqueda en profundidad (DFS) usado por
+Laberinto sobre estructuras compactas: un mapa de bits de celdas visitadas
+(un byte por celda), una pila de índices planos y un bloque de números
+aleatorios generado de antemano. Evita así el coste de crear tuplas, calcular
+hashes y escribir celda a celda en una matriz de NumPy.
+"""
+
+from itertools import permutations
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+def crear_mapa_visitadas(filas: int, columnas: int,
+                         celdas: Optional[np.ndarray] = None) -> bytearray:
+    """
+    Crea el mapa de bits de celdas visitadas para un laberinto.
+
+    Solo las celdas de coordenadas impares del interior pueden visitarse; el
+    resto se marca de antemano como visitado. Se añaden dos filas de relleno
+    al final para que cualquier desplazamiento de dos celdas desde una celda
+    válida caiga dentro del búfer sin necesidad de comprobar límites.
+
+    Args:
+        filas: Número de filas del laberinto.
+        columnas: Número de columnas del laberinto.
+        celdas: Matriz ya excavada (0 = camino). Si se indica, sus celdas
+                impares que son camino se marcan como visitadas.
+
+    Returns:
+        Mapa de visitadas con filas * columnas + 2 * columnas bytes
+        (1 = visitada o no visitable, 0 = pendiente).
+    """
+    mapa = np.ones((filas + 2, columnas), dtype=np.uint8)
+    if celdas is None:
+        mapa[1:filas - 1:2, 1:columnas - 1:2] = 0
+    else:
+        mapa[1:filas - 1:2, 1:columnas - 1:2] = celdas[1:filas - 1:2, 1:columnas - 1:2] == 0
+    return bytearray(mapa.tobytes())
+
+
+def desplazamientos(columnas: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    Calcula los desplazamientos planos hacia las celdas vecinas.
+
+    Args:
+        columnas: Número de columnas del laberinto.
+
+    Returns:
+        Tupla de pares (desplazamiento al vecino, desplazamiento a la pared
+        intermedia) en el orden arriba, derecha, abajo, izquierda.
+    """
+    return ((-2 * columnas, -columnas), (2, 1), (2 * columnas, columnas), (-2, -1))
+
+
+def generar_dfs(filas: int, columnas: int, inicio: Tuple[int, int],
+                azar: bytes) -> Tuple[bytearray, bytearray, List[int]]:
+    """
+    Excava un laberinto perfecto mediante DFS iterativo sobre índices planos.
+
+    Args:
+        filas: Número de filas del laberinto.
+        columnas: Número de columnas del laberinto.
+        inicio: Celda inicial (fila, columna), con coordenadas impares.
+        azar: Bloque de bytes aleatorios en el rango [0, 24). Cada iteración
+              consume uno para elegir el orden de las direcciones, por lo que
+              debe contener al menos 2 * numero_celdas(filas, columnas) bytes.
+
+    Returns:
+        Tupla (celdas, visitadas, bifurcaciones) donde celdas es la matriz
+        plana del laberinto (0 = camino, 1 = pared), visitadas es el mapa de
+        bits final y bifurcaciones es una lista plana de pares
+        [celda, vecino, celda, vecino, ...] con los puntos donde había más
+        de un vecino sin visitar.
+    """
+    visitadas = crear_mapa_visitadas(filas, columnas)
+    celdas = bytearray(b"\x01") * (filas * columnas)
+
+    # Las 24 ordenaciones posibles de las cuatro direcciones
+    ordenes = tuple(permutations(desplazamientos(columnas)))
+
+    origen = inicio[0] * columnas + inicio[1]
+    visitadas[origen] = 1
+    celdas[origen] = 0
+
+    pila = [origen]
+    bifurcaciones: List[int] = []
+    apilar = pila.append
+    desapilar = pila.pop
+    anotar = bifurcaciones.append
+    k = 0
+
+    while pila:
+        p = pila[-1]
+
+        # Buscar el primer vecino sin visitar y anotar el segundo, si existe
+        elegido = 0
+        bifurca = False
+        for d, m in ordenes[azar[k]]:
+            if not visitadas[p + d]:
+                if elegido:
+                    anotar(p)
+                    anotar(p + d)
+                    bifurca = True
+                    break
+                elegido = d
+                medio = m
+        k += 1
+
+        if elegido:
+            # Derribar la pared intermedia y avanzar al vecino
+            q = p + elegido
+            visitadas[q] = 1
+            celdas[p + medio] = 0
+            celdas[q] = 0
+            if bifurca:
+                apilar(q)
+            else:
+                # La celda actual no tenía más salidas: al volver a ella no
+                # quedaría nada por explorar, así que se sustituye en la pila
+                pila[-1] = q
+        else:
+            # Sin vecinos disponibles: retroceder
+            desapilar()
+
+    return celdas, visitadas, bifurcaciones
+
+
+def numero_celdas(filas: int, columnas: int) -> int:
+    """
+    Calcula cuántas celdas visitables (coordenadas impares) tiene un laberinto.
+
+    Args:
+        filas: Número de filas del laberinto.
+        columnas: Número de columnas del laberinto.
+
+    Returns:
+        Número de celdas que el DFS llegará a visitar.
+    """
+    return len(range(1, filas - 1, 2)) * len(range(1, columnas - 1, 2))
@@ -0,0 +1,177 @@
+"""
+Módulo del mundo infinito por fragmentos (chunks).
+
+Este módulo contiene la clase MundoInfinito, que divide un laberinto sin
+límites en fragmentos cuadrados de tamaño fijo. Cada fragmento se genera bajo
+demanda a partir de una semilla derivada de sus coordenadas, de modo que
+siempre se obtiene el mismo fragmento para la misma posición, y se guarda en
+una caché LRU de capacidad fija para que la memoria no crezca con la distancia
+recorrida.
+"""
+
+from collections import OrderedDict
+from typing import Tuple
+
+import numpy as np
+
+from generador.motor_dfs import generar_dfs
+
+
+class MundoInfinito:
+    """
+    Laberinto infinito formado por fragmentos generados de forma perezosa.
+
+    Cada fragmento de tamano x tamano celdas es dueño de su fila superior y
+    de su columna izquierda, y abre en ellas algunas conexiones hacia los
+    fragmentos vecinos. Como solo un fragmento decide cada borde, las
+    costuras siempre encajan y el mundo completo queda conectado.
+
+    Ofrece la misma interfaz que usa Jugador sobre Laberinto (inicio,
+    es_pared y es_meta), por lo que el jugador puede moverse por él sin cambios.
+    """
+
+    def __init__(self, semilla: int, tamano: int = 16, capacidad: int = 64,
+                 aberturas: int = 2):
+        """
+        Inicializa un nuevo mundo infinito.
+
+        Args:
+            semilla: Semilla del mundo; el mismo valor genera el mismo mundo.
+            tamano: Lado de cada fragmento en celdas (debe ser par).
+            capacidad: Número máximo de fragmentos que se mantienen en memoria.
+            aberturas: Conexiones abiertas en cada borde hacia los fragmentos vecinos.
+        """
+        if tamano < 4 or tamano % 2:
+            raise ValueError(f"El tamaño de fragmento debe ser par y al menos 4: {tamano}")
+
+        self.semilla = semilla
+        self.tamano = tamano
+        self.capacidad = capacidad
+        self.aberturas = min(aberturas, tamano // 2)
+
+        # Fragmentos generados, del menos al más recientemente usado
+        self._fragmentos: "OrderedDict[Tuple[int, int], np.ndarray]" = OrderedDict()
+
+        # El jugador empieza en la primera celda del fragmento (0, 0)
+        self.inicio = (1, 1)
+
+    def obtener_fragmento(self, fila_fragmento: int, columna_fragmento: int) -> np.ndarray:
+        """
+        Obtiene un fragmento, generándolo si no está en la caché.
+
+        Args:
+            fila_fragmento: Fila del fragmento en la rejilla de fragmentos.
+            columna_fragmento: Columna del fragmento en la rejilla de fragmentos.
+
+        Returns:
+            Matriz uint8 de tamano x tamano (0 = camino, 1 = pared).
+        """
+        clave = (fila_fragmento, columna_fragmento)
+        fragmento = self._fragmentos.get(clave)
+
+        if fragmento is None:
+            fragmento = self._generar_fragmento(fila_fragmento, columna_fragmento)
+            self._fragmentos[clave] = fragmento
+
+            # Expulsar el fragmento usado hace más tiempo si se supera la capacidad
+            if len(self._fragmentos) > self.capacidad:
+                self._fragmentos.popitem(last=False)
+        else:
+            self._fragmentos.move_to_end(clave)
+
+        return fragmento
+
+    def precargar(self, fila_min: int, fila_max: int, columna_min: int, columna_max: int) -> None:
+        """
+        Genera por adelantado los fragmentos que cubren un rectángulo de celdas.
+
+        Args:
+            fila_min: Primera fila del rectángulo (en celdas).
+            fila_max: Última fila del rectángulo (en celdas, incluida).
+            columna_min: Primera columna del rectángulo (en celdas).
+            columna_max: Última columna del rectángulo (en celdas, incluida).
+        """
+        for fila_fragmento, columna_fragmento in self.fragmentos_en_rango(
+                fila_min, fila_max, columna_min, columna_max):
+            self.obtener_fragmento(fila_fragmento, columna_fragmento)
+
+    def fragmentos_en_rango(self, fila_min: int, fila_max: int, columna_min: int,
+                            columna_max: int) -> list:
+        """
+        Calcula las coordenadas de los fragmentos que cubren un rectángulo de celdas.
+
+        Args:
+            fila_min: Primera fila del rectángulo (en celdas).
+            fila_max: Última fila del rectángulo (en celdas, incluida).
+            columna_min: Primera columna del rectángulo (en celdas).
+            columna_max: Última columna del rectángulo (en celdas, incluida).
+
+        Returns:
+            Lista de pares (fila_fragmento, columna_fragmento).
+        """
+        return [(f, c)
+                for f in range(fila_min // self.tamano, fila_max // self.tamano + 1)
+                for c in range(columna_min // self.tamano, columna_max // self.tamano + 1)]
+
+    def es_pared(self, fila: int, columna: int) -> bool:
+        """
+        Verifica si una celda del mundo es una pared.
+
+        Args:
+            fila: Número de fila de la celda (puede ser negativo).
+            columna: Número de columna de la celda (puede ser negativo).
+
+        Returns:
+            True si la celda es una pared, False en caso contrario.
+        """
+        fila_fragmento, fila_local = divmod(fila, self.tamano)
+        columna_fragmento, columna_local = divmod(columna, self.tamano)
+        fragmento = self.obtener_fragmento(fila_fragmento, columna_fragmento)
+        return fragmento[fila_local, columna_local] == 1
+
+    def es_meta(self, fila: int, columna: int) -> bool:
+        """
+        Verifica si una celda es la meta. El mundo infinito no tiene meta.
+
+        Args:
+            fila: Número de fila de la celda.
+            columna: Número de columna de la celda.
+
+        Returns:
+            Siempre False.
+        """
+        return False
+
+    def _generar_fragmento(self, fila_fragmento: int, columna_fragmento: int) -> np.ndarray:
+        """
+        Genera un fragmento de forma determinista a partir de sus coordenadas.
+
+        Args:
+            fila_fragmento: Fila del fragmento en la rejilla de fragmentos.
+            columna_fragmento: Columna del fragmento en la rejilla de fragmentos.
+
+        Returns:
+            Matriz uint8 de tamano x tamano (0 = camino, 1 = pared).
+        """
+        # Semilla derivada de la semilla del mundo, completa, y de las
+        # coordenadas (que pueden ser negativas) como palabras de 32 bits
+        rng = np.random.default_rng(np.random.SeedSequence([self.semilla,
+                                                            fila_fragmento % 2 ** 32,
+                                                            columna_fragmento % 2 ** 32]))
+
+        # Excavar un laberinto perfecto de (tamano + 1) celdas de lado y
+        # descartar la última fila y columna, que pertenecen a los vecinos
+        lado = self.tamano + 1
+        celdas_lado = self.tamano // 2
+        inicio = (2 * int(rng.integers(celdas_lado)) + 1, 2 * int(rng.integers(celdas_lado)) + 1)
+        azar = rng.integers(0, 24, size=2 * celdas_lado * celdas_lado, dtype=np.uint8).tobytes()
+        celdas, _, _ = generar_dfs(lado, lado, inicio, azar)
+        fragmento = np.frombuffer(celdas, dtype=np.uint8).reshape(lado, lado)[:-1, :-1].copy()
+
+        # Abrir conexiones en el borde superior y en el izquierdo
+        arriba = 2 * rng.choice(celdas_lado, size=self.aberturas, replace=False) + 1
+        izquierda = 2 * rng.choice(celdas_lado, size=self.aberturas, replace=False) + 1
+        fragmento[0, arriba] = 0
+        fragmento[izquierda, 0] = 0
+
+        return fragmento
@@ -0,0 +1,114 @@
+"""
+Reserva de laberintos pregenerados en segundo plano.
+
+Este módulo contiene la clase ReservaLaberintos, que mantiene uno o varios
+laberintos ya generados por cada nivel de dificultad. Cuando el juego toma
+uno, la reserva encarga otro a un hilo en segundo plano, de modo que empezar
+o cambiar de nivel no bloquea el bucle principal mientras se genera.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, Any
+
+from configuracion.config import NIVELES_DIFICULTAD, LABERINTOS_EN_RESERVA
+from generador.laberinto import Laberinto
+
+
+def _generar_nivel(config: Dict[str, Any]) -> Laberinto:
+    """
+    Genera un laberinto del nivel con su campo de distancias ya calculado.
+
+    El juego consulta las distancias desde el primer frame; calcularlas aquí
+    evita que ese BFS ocurra en el bucle principal.
+    """
+    laberinto = Laberinto.desde_nivel(config)
+    laberinto.distancias
+    return laberinto
+
+
+class ReservaLaberintos:
+    """
+    Reserva de laberintos listos para jugar por nivel de dificultad.
+    
+    La generación se hace en un ThreadPoolExecutor pequeño. Los hilos son
+    suficientes porque los laberintos del juego son pequeños y así el trabajo
+    no sale del proceso de pygame; el intérprete alterna entre el hilo de
+    generación y el bucle principal, que sigue dibujando mientras tanto.
+    """
+    
+    def __init__(self, niveles: Dict[str, Dict[str, Any]] = NIVELES_DIFICULTAD,
+                 por_nivel: int = LABERINTOS_EN_RESERVA, hilos: int = 1):
+        """
+        Inicializa la reserva y encarga los primeros laberintos de cada nivel.
+        
+        Args:
+            niveles: Niveles de dificultad para los que se mantienen laberintos.
+            por_nivel: Número de laberintos listos que se mantienen por nivel.
+            hilos: Número de hilos de generación en segundo plano.
+        """
+        self.niveles = niveles
+        self.por_nivel = por_nivel
+        self._ejecutor = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="reserva")
+        self._pendientes: Dict[str, Deque[Future]] = {nivel: deque() for nivel in niveles}
+        
+        for nivel in niveles:
+            self._rellenar(nivel)
+    
+    def tomar(self, dificultad: str) -> Laberinto:
+        """
+        Toma un laberinto de la reserva y encarga otro para reponerlo.
+        
+        Si el laberinto más antiguo del nivel ya se está generando, se espera a
+        que termine. Si aún no ha empezado (con pocos hilos puede estar en
+        cola detrás de los de otros niveles), se cancela y se genera en el
+        acto, sin esperar a los que tiene delante.
+        
+        Args:
+            dificultad: Nivel de dificultad del laberinto.
+            
+        Returns:
+            Laberinto generado con los parámetros del nivel.
+        """
+        cola = self._pendientes[dificultad]
+        futuro = cola.popleft() if cola else None
+        
+        # cancel() solo tiene éxito si la generación aún no ha empezado
+        if futuro is not None and not futuro.cancel():
+            laberinto = futuro.result()
+        else:
+            # Reserva vacía (por ejemplo, con por_nivel = 0) o encargo sin
+            # empezar: generar ahora
+            laberinto = _generar_nivel(self.niveles[dificultad])
+        
+        self._rellenar(dificultad)
+        return laberinto
+    
+    def listos(self, dificultad: str) -> int:
+        """
+        Cuenta los laberintos del nivel que ya están terminados.
+        
+        Args:
+            dificultad: Nivel de dificultad.
+            
+        Returns:
+            Número de laberintos listos para tomar sin esperar.
+        """
+        return sum(1 for futuro in self._pendientes[dificultad] if futuro.done())
+    
+    def cerrar(self) -> None:
+        """
+        Detiene la reserva cancelando las generaciones que aún no han empezado.
+        """
+        self._ejecutor.shutdown(wait=False, cancel_futures=True)
+    
+    def _rellenar(self, dificultad: str) -> None:
+        """
+        Encarga laberintos del nivel hasta completar la reserva.
+        
+        Args:
+            dificultad: Nivel de dificultad a reponer.
+        """
+        cola = self._pendientes[dificultad]
+        while len(cola) < self.por_nivel:
+            cola.append(self._ejecutor.submit(_generar_nivel, self.niveles[dificultad]))
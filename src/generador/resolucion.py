@@ -0,0 +1,362 @@
+"""
+Módulo de resolución de laberintos.
+
+Este módulo contiene varios algoritmos que buscan el camino más corto entre
+dos celdas de Laberinto.matriz: BFS, BFS bidireccional, A* con heurística
+Manhattan y búsqueda por puntos de salto (JPS). Todos trabajan sobre el búfer
+plano de celdas libres de generador.distancias, sin recursión, y se pueden
+seleccionar por nombre igual que los algoritmos de generación. El resolutor
+"grafo" aplica Dijkstra sobre el grafo de pasillos de generador.grafo.
+
+Todos los resolutores reciben (matriz, inicio, meta) y devuelven una tupla
+(camino, expandidos), donde camino es un array int32 de forma (L, 2) con las
+celdas (fila, columna) del camino desde inicio hasta meta, ambos incluidos
+(vacío, de forma (0, 2), si no hay camino), y expandidos es el número de
+nodos que el algoritmo sacó de su frontera para explorar sus vecinos.
+"""
+
+import heapq
+from array import array
+from typing import Callable, Dict, List, Tuple, Union
+
+import numpy as np
+
+from generador.distancias import rejilla_libres
+from generador.grafo import GrafoPasillos
+
+
+ResultadoResolucion = Tuple[np.ndarray, int]
+
+# Registro de resolutores disponibles por nombre
+RESOLUTORES: Dict[str, Callable[[np.ndarray, Tuple[int, int], Tuple[int, int]],
+                                ResultadoResolucion]] = {}
+
+
+def registrar_resolutor(nombre: str) -> Callable:
+    """
+    Decorador que registra un resolutor con el nombre indicado.
+
+    Args:
+        nombre: Nombre con el que se seleccionará el resolutor.
+
+    Returns:
+        Decorador que añade la función al registro y la devuelve sin cambios.
+    """
+    def decorador(funcion: Callable) -> Callable:
+        RESOLUTORES[nombre] = funcion
+        return funcion
+    return decorador
+
+
+def resolver(matriz: np.ndarray, inicio: Tuple[int, int], meta: Tuple[int, int],
+             metodo: str = "bfs") -> ResultadoResolucion:
+    """
+    Busca el camino más corto entre dos celdas con el resolutor indicado.
+
+    Args:
+        matriz: Matriz del laberinto (0 = camino, 1 = pared).
+        inicio: Celda (fila, columna) de partida.
+        meta: Celda (fila, columna) de llegada.
+        metodo: Nombre del resolutor (bfs, bfs_bidireccional, a_estrella, jps o grafo).
+
+    Returns:
+        Tupla (camino, expandidos).
+
+    Raises:
+        ValueError: Si no existe ningún resolutor con ese nombre.
+    """
+    if metodo not in RESOLUTORES:
+        disponibles = ", ".join(sorted(RESOLUTORES))
+        raise ValueError(f"Resolutor desconocido: {metodo!r} (disponibles: {disponibles})")
+    return RESOLUTORES[metodo](matriz, inicio, meta)
+
+
+def _preparar(matriz: np.ndarray, inicio: Tuple[int, int],
+              meta: Tuple[int, int]) -> Tuple[bytearray, int, int, int]:
+    """
+    Prepara el búfer de celdas libres y los índices planos de inicio y meta.
+
+    Returns:
+        Tupla (libres, ancho, origen, destino).
+    """
+    libres, ancho = rejilla_libres(np.asarray(matriz))
+    origen = (inicio[0] + 1) * ancho + inicio[1] + 1
+    destino = (meta[0] + 1) * ancho + meta[1] + 1
+    return libres, ancho, origen, destino
+
+
+def _a_coordenadas(planos: List[int], ancho: int) -> np.ndarray:
+    """
+    Convierte índices planos del búfer con borde en coordenadas de la matriz.
+
+    Args:
+        planos: Índices planos del camino, en orden.
+        ancho: Ancho de cada fila del búfer.
+
+    Returns:
+        Array int32 de forma (L, 2) con las celdas (fila, columna).
+    """
+    planos = np.asarray(planos, dtype=np.int64)
+    camino = np.empty((planos.size, 2), dtype=np.int32)
+    camino[:, 0] = planos // ancho - 1
+    camino[:, 1] = planos % ancho - 1
+    return camino
+
+
+def _recorrer_padres(padres: Union[array, Dict[int, int]], p: int) -> List[int]:
+    """
+    Sigue los padres desde una celda hasta la raíz de la búsqueda.
+
+    Args:
+        padres: Padre de cada índice plano (la raíz es su propio padre), en
+                un array o en un diccionario.
+        p: Índice plano desde el que se empieza.
+
+    Returns:
+        Índices planos desde p hasta la raíz, ambos incluidos.
+    """
+    camino = [p]
+    while padres[p] != p:
+        p = padres[p]
+        camino.append(p)
+    return camino
+
+
+def _direccion(desde: int, hasta: int, ancho: int) -> int:
+    """
+    Calcula el paso unitario para ir en línea recta entre dos índices planos.
+
+    Returns:
+        ±1 si están en la misma fila y ±ancho si están en la misma columna.
+    """
+    diferencia = hasta - desde
+    unidad = 1 if abs(diferencia) < ancho else ancho
+    return unidad if diferencia > 0 else -unidad
+
+
+def _sin_camino() -> np.ndarray:
+    """Camino vacío, de forma (0, 2)."""
+    return np.empty((0, 2), dtype=np.int32)
+
+
+@registrar_resolutor("bfs")
+def resolver_bfs(matriz: np.ndarray, inicio: Tuple[int, int],
+                 meta: Tuple[int, int]) -> ResultadoResolucion:
+    """
+    Recorrido en anchura desde el inicio hasta encontrar la meta.
+    """
+    libres, ancho, origen, destino = _preparar(matriz, inicio, meta)
+    if not (libres[origen] and libres[destino]):
+        return _sin_camino(), 0
+
+    padres = array("i", [-1]) * len(libres)
+    padres[origen] = origen
+    libres[origen] = 0
+    expandidos = 0
+
+    frontera = [origen]
+    while frontera and padres[destino] < 0:
+        siguiente = []
+        agregar = siguiente.append
+        for p in frontera:
+            expandidos += 1
+            for q in (p - ancho, p + 1, p + ancho, p - 1):
+                if libres[q]:
+                    libres[q] = 0
+                    padres[q] = p
+                    agregar(q)
+            if padres[destino] >= 0:
+                break
+        frontera = siguiente
+
+    if padres[destino] < 0:
+        return _sin_camino(), expandidos
+    return _a_coordenadas(_recorrer_padres(padres, destino)[::-1], ancho), expandidos
+
+
+@registrar_resolutor("bfs_bidireccional")
+def resolver_bfs_bidireccional(matriz: np.ndarray, inicio: Tuple[int, int],
+                               meta: Tuple[int, int]) -> ResultadoResolucion:
+    """
+    Dos recorridos en anchura, desde el inicio y desde la meta, que avanzan
+    nivel a nivel por el lado con la frontera más pequeña hasta encontrarse.
+    """
+    libres, ancho, origen, destino = _preparar(matriz, inicio, meta)
+    if not (libres[origen] and libres[destino]):
+        return _sin_camino(), 0
+    if origen == destino:
+        return _a_coordenadas([origen], ancho), 0
+
+    n = len(libres)
+    distancias = (array("i", [-1]) * n, array("i", [-1]) * n)
+    padres = (array("i", [-1]) * n, array("i", [-1]) * n)
+    fronteras = [[origen], [destino]]
+    for lado, raiz in enumerate((origen, destino)):
+        distancias[lado][raiz] = 0
+        padres[lado][raiz] = raiz
+
+    expandidos = 0
+    encuentro = -1
+    while fronteras[0] and fronteras[1] and encuentro < 0:
+        # Avanzar un nivel completo por el lado con menos celdas en la frontera
+        lado = 0 if len(fronteras[0]) <= len(fronteras[1]) else 1
+        propias, ajenas = distancias[lado], distancias[1 - lado]
+        padres_propios = padres[lado]
+
+        mejor = -1
+        siguiente = []
+        agregar = siguiente.append
+        for p in fronteras[lado]:
+            expandidos += 1
+            d = propias[p] + 1
+            for q in (p - ancho, p + 1, p + ancho, p - 1):
+                if libres[q] and propias[q] < 0:
+                    propias[q] = d
+                    padres_propios[q] = p
+                    agregar(q)
+
+                    # El mejor encuentro del nivel da el camino más corto
+                    if ajenas[q] >= 0 and (mejor < 0 or d + ajenas[q] < mejor):
+                        mejor = d + ajenas[q]
+                        encuentro = q
+        fronteras[lado] = siguiente
+
+    if encuentro < 0:
+        return _sin_camino(), expandidos
+
+    camino = _recorrer_padres(padres[0], encuentro)[::-1] + _recorrer_padres(padres[1], encuentro)[1:]
+    return _a_coordenadas(camino, ancho), expandidos
+
+
+@registrar_resolutor("a_estrella")
+def resolver_a_estrella(matriz: np.ndarray, inicio: Tuple[int, int],
+                        meta: Tuple[int, int]) -> ResultadoResolucion:
+    """
+    A* con la distancia Manhattan a la meta como heurística.
+
+    Los empates en f se deshacen a favor de la celda con mayor coste
+    acumulado, que es la que está más cerca de la meta.
+    """
+    libres, ancho, origen, destino = _preparar(matriz, inicio, meta)
+    if not (libres[origen] and libres[destino]):
+        return _sin_camino(), 0
+
+    fila_meta, columna_meta = divmod(destino, ancho)
+    costes = array("i", [-1]) * len(libres)
+    padres = array("i", [-1]) * len(libres)
+    cerrados = bytearray(len(libres))
+    costes[origen] = 0
+    padres[origen] = origen
+
+    fila, columna = divmod(origen, ancho)
+    abiertos = [(abs(fila - fila_meta) + abs(columna - columna_meta), 0, origen)]
+    expandidos = 0
+    while abiertos:
+        _, g, p = heapq.heappop(abiertos)
+        if cerrados[p]:
+            continue
+        cerrados[p] = 1
+        expandidos += 1
+        if p == destino:
+            return _a_coordenadas(_recorrer_padres(padres, destino)[::-1], ancho), expandidos
+
+        g = -g + 1
+        for q in (p - ancho, p + 1, p + ancho, p - 1):
+            if libres[q] and not cerrados[q] and (costes[q] < 0 or g < costes[q]):
+                costes[q] = g
+                padres[q] = p
+                fila, columna = divmod(q, ancho)
+                heapq.heappush(abiertos, (g + abs(fila - fila_meta) + abs(columna - columna_meta),
+                                          -g, q))
+
+    return _sin_camino(), expandidos
+
+
+@registrar_resolutor("jps")
+def resolver_jps(matriz: np.ndarray, inicio: Tuple[int, int],
+                 meta: Tuple[int, int]) -> ResultadoResolucion:
+    """
+    Búsqueda por puntos de salto (JPS) para movimiento en cuatro direcciones.
+
+    Desde cada punto se avanza en línea recta sin detenerse mientras la celda
+    no tenga salidas laterales. Solo son nodos de la búsqueda A* los puntos
+    donde el pasillo se bifurca o gira y la meta; los tramos que terminan en
+    un callejón sin salida se descartan sin abrir ningún nodo. expandidos
+    cuenta los puntos de salto, no las celdas recorridas al saltar.
+    """
+    libres, ancho, origen, destino = _preparar(matriz, inicio, meta)
+    if not (libres[origen] and libres[destino]):
+        return _sin_camino(), 0
+
+    # Direcciones laterales de cada dirección de avance
+    laterales = {-ancho: (1, -1), ancho: (1, -1), 1: (-ancho, ancho), -1: (-ancho, ancho)}
+
+    def saltar(p: int, d: int) -> int:
+        """Avanza desde p en la dirección d hasta el siguiente punto de salto (-1 si no hay)."""
+        a, b = laterales[d]
+        q = p + d
+        while libres[q]:
+            if q == destino or libres[q + a] or libres[q + b]:
+                return q
+            q += d
+        return -1
+
+    fila_meta, columna_meta = divmod(destino, ancho)
+    costes = {origen: 0}
+    padres = {origen: origen}
+    cerrados = set()
+
+    fila, columna = divmod(origen, ancho)
+    abiertos = [(abs(fila - fila_meta) + abs(columna - columna_meta), 0, origen)]
+    expandidos = 0
+    while abiertos:
+        _, g, p = heapq.heappop(abiertos)
+        if p in cerrados:
+            continue
+        cerrados.add(p)
+        expandidos += 1
+        if p == destino:
+            break
+        g = -g
+
+        # No volver por la dirección de llegada
+        padre = padres[p]
+        vuelta = 0 if padre == p else _direccion(p, padre, ancho)
+
+        for d in (-ancho, 1, ancho, -1):
+            if d == vuelta:
+                continue
+            q = saltar(p, d)
+            if q < 0 or q in cerrados:
+                continue
+            gq = g + abs(q - p) // abs(d)
+            if gq < costes.get(q, gq + 1):
+                costes[q] = gq
+                padres[q] = p
+                fila, columna = divmod(q, ancho)
+                heapq.heappush(abiertos, (gq + abs(fila - fila_meta) + abs(columna - columna_meta),
+                                          -gq, q))
+    else:
+        return _sin_camino(), expandidos
+
+    # Reconstruir los puntos de salto y rellenar los tramos rectos entre ellos
+    puntos = _recorrer_padres(padres, destino)[::-1]
+    camino = [origen]
+    for a, b in zip(puntos, puntos[1:]):
+        paso = _direccion(a, b, ancho)
+        camino.extend(range(a + paso, b + paso, paso))
+    return _a_coordenadas(camino, ancho), expandidos
+
+
+@registrar_resolutor("grafo")
+def resolver_grafo(matriz: np.ndarray, inicio: Tuple[int, int],
+                   meta: Tuple[int, int]) -> ResultadoResolucion:
+    """
+    Dijkstra sobre el grafo de pasillos del laberinto.
+
+    Comprime la matriz en un GrafoPasillos con el inicio y la meta como nodos
+    y busca el camino entre ellos. expandidos cuenta nodos del grafo (cruces,
+    callejones, inicio y meta), no celdas. Si se van a hacer varias consultas
+    sobre el mismo laberinto conviene construir el grafo una sola vez.
+    """
+    return GrafoPasillos.desde_matriz(matriz, extra=(inicio, meta)).resolver(inicio, meta)
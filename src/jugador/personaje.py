@@ -26,7 +26,8 @@ class Jugador:
         Inicializa un nuevo jugador.
         
         Args:
-            laberinto: Instancia del laberinto donde se moverá el jugador.
+            laberinto: Instancia del laberinto (o del mundo infinito) donde
+                       se moverá el jugador.
         """
         self._laberinto = laberinto
         self._fila, self._columna = laberinto.inicio
@@ -70,6 +71,17 @@ class Jugador:
         """
         return (self._fila, self._columna)
     
+    @property
+    def tamano_animado(self) -> int:
+        """
+        Obtiene el radio con el que se dibuja el jugador en este momento.
+        
+        Returns:
+            Radio en píxeles, que varía al moverse (efecto de "respiración").
+        """
+        factor_animacion = abs(self._animacion_contador - self._animacion_max // 2) / (self._animacion_max // 2)
+        return int(self._tamano * (0.9 + 0.1 * factor_animacion))
+    
     def reiniciar(self) -> None:
         """
         Reinicia la posición del jugador al inicio del laberinto.
@@ -148,19 +160,23 @@ class Jugador:
         if self._moviendo_arriba or self._moviendo_abajo or self._moviendo_izquierda or self._moviendo_derecha:
             self._animacion_contador = (self._animacion_contador + 1) % self._animacion_max
     
-    def dibujar(self, superficie: pygame.Surface) -> None:
+    def dibujar(self, superficie: pygame.Surface, 
+                desplazamiento: Tuple[int, int] = (0, 0)) -> pygame.Rect:
         """
         Dibuja al jugador en la superficie proporcionada.
         
         Args:
             superficie: Superficie de pygame donde dibujar al jugador.
+            desplazamiento: Posición (x, y) de la superficie dentro del mundo,
+                            que se resta a la posición del jugador.
+            
+        Returns:
+            Rectángulo de la superficie que ocupa el jugador.
         """
-        # Calcular tamaño de animación (efecto de "respiración")
-        factor_animacion = abs(self._animacion_contador - self._animacion_max // 2) / (self._animacion_max // 2)
-        tamano_animado = int(self._tamano * (0.9 + 0.1 * factor_animacion))
-        
         # Dibujar jugador (círculo)
-        pygame.draw.circle(superficie, self._color, (self._x, self._y), tamano_animado)
+        return pygame.draw.circle(superficie, self._color, 
+                                 (self._x - desplazamiento[0], self._y - desplazamiento[1]), 
+                                 self.tamano_animado)
     
     def ha_llegado_meta(self) -> bool:
         """
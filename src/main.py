@@ -6,15 +6,18 @@ la inicialización, el bucle principal y la gestión de estados.
 """
 
 import sys
+import random
 import pygame
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from configuracion.config import (
-    ANCHO_VENTANA, ALTO_VENTANA, FPS, TITULO, NIVELES_DIFICULTAD
+    ANCHO_VENTANA, ALTO_VENTANA, FPS, TITULO, NIVELES_DIFICULTAD,
+    TAMANO_FRAGMENTO, FRAGMENTOS_EN_CACHE
 )
-from generador.laberinto import Laberinto
+from generador.mundo import MundoInfinito
+from generador.reserva import ReservaLaberintos
 from jugador.personaje import Jugador
-from renderizador.pantalla import MenuPrincipal, MenuDificultad, PantallaJuego
+from renderizador.pantalla import MenuPrincipal, MenuDificultad, PantallaJuego, PantallaInfinita
 from utilidades.helpers import Temporizador
 
 
@@ -30,8 +33,10 @@ class Juego:
         """
         Inicializa el juego.
         """
-        # Inicializar pygame
-        pygame.init()
+        # Inicializar solo los subsistemas que usa el juego (vídeo y fuentes);
+        # pygame.init() arrancaría también el audio y los mandos
+        pygame.display.init()
+        pygame.font.init()
         pygame.display.set_caption(TITULO)
         
         # Crear ventana
@@ -44,12 +49,38 @@ class Juego:
         # Dificultad actual
         self.dificultad_actual = "normal"
         
-        # Crear menús
+        # Pantalla que hay ahora mismo en la ventana (None si hay que volver
+        # a dibujar la ventana entera, por ejemplo al cambiar de estado)
+        self.pantalla_presentada = None
+        
+        # Crear el menú principal, que es lo primero que se muestra
         self.menu_principal = MenuPrincipal()
-        self.menu_dificultad = MenuDificultad()
         
-        # Inicializar componentes del juego
-        self._inicializar_juego()
+        # Pantallas que se crean la primera vez que se muestran
+        self.menu_dificultad = None
+        self.pantalla_juego = None
+        self.pantalla_infinita = None
+        
+        # Laberintos pregenerados en segundo plano para cada dificultad (se
+        # crea tras el primer fotograma para no retrasarlo)
+        self.reserva = None
+    
+    def _iniciar_reserva(self) -> None:
+        """
+        Crea la reserva de laberintos si aún no existe, lo que empieza a
+        pregenerarlos en segundo plano.
+        """
+        if self.reserva is None:
+            self.reserva = ReservaLaberintos()
+    
+    def _cerrar(self) -> None:
+        """
+        Detiene la reserva de laberintos, cierra pygame y sale del programa.
+        """
+        if self.reserva is not None:
+            self.reserva.cerrar()
+        pygame.quit()
+        sys.exit()
     
     def _inicializar_juego(self) -> None:
         """
@@ -58,12 +89,9 @@ class Juego:
         # Obtener configuración de dificultad
         config_dificultad = NIVELES_DIFICULTAD[self.dificultad_actual]
         
-        # Crear laberinto
-        filas, columnas = config_dificultad["tamano"]
-        complejidad = config_dificultad["complejidad"]
-        densidad = config_dificultad["densidad"]
-        
-        self.laberinto = Laberinto(filas, columnas, complejidad, densidad)
+        # Tomar un laberinto ya generado de la reserva (se repone en segundo plano)
+        self._iniciar_reserva()
+        self.laberinto = self.reserva.tomar(self.dificultad_actual)
         
         # Crear jugador
         self.jugador = Jugador(self.laberinto)
@@ -78,6 +106,13 @@ class Juego:
         # Actualizar dificultad en el menú principal
         self.menu_principal.dificultad_actual = self.dificultad_actual
     
+    def _inicializar_infinito(self) -> None:
+        """
+        Crea un mundo infinito nuevo con una semilla aleatoria y su pantalla.
+        """
+        mundo = MundoInfinito(random.getrandbits(128), TAMANO_FRAGMENTO, FRAGMENTOS_EN_CACHE)
+        self.pantalla_infinita = PantallaInfinita(mundo, Jugador(mundo))
+    
     def ejecutar(self) -> None:
         """
         Ejecuta el bucle principal del juego.
@@ -90,24 +125,29 @@ class Juego:
                 if evento.type == pygame.QUIT:
                     ejecutando = False
                 
+                # La ventana ha vuelto a mostrarse y hay que dibujarla entera
+                if evento.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self.pantalla_presentada = None
+                
                 # Pasar evento al estado actual
                 self._manejar_evento_estado(evento)
             
             # Actualizar estado actual
             self._actualizar_estado()
             
-            # Renderizar estado actual
-            self._renderizar_estado()
+            # Renderizar estado actual y actualizar solo lo que ha cambiado
+            cambiados = self._renderizar_estado()
+            if cambiados:
+                pygame.display.update(cambiados)
             
-            # Actualizar pantalla
-            pygame.display.flip()
+            # Con el primer fotograma ya presentado, empezar a pregenerar laberintos
+            self._iniciar_reserva()
             
             # Controlar FPS
             self.reloj.tick(FPS)
         
         # Salir de pygame
-        pygame.quit()
-        sys.exit()
+        self._cerrar()
     
     def _manejar_evento_estado(self, evento: pygame.event.Event) -> None:
         """
@@ -120,19 +160,29 @@ class Juego:
             accion = self.menu_principal.manejar_evento(evento)
             if accion:
                 if accion == "jugar":
+                    # Generar el nivel al empezar a jugar por primera vez o
+                    # si la partida anterior terminó
+                    if self.pantalla_juego is None or self.pantalla_juego.juego_terminado:
+                        self._inicializar_juego()
                     self.estado_actual = "jugando"
                 elif accion == "dificultad":
+                    if self.menu_dificultad is None:
+                        self.menu_dificultad = MenuDificultad()
                     self.estado_actual = "dificultad"
+                elif accion == "infinito":
+                    self._inicializar_infinito()
+                    self.estado_actual = "infinito"
                 elif accion == "salir":
-                    pygame.quit()
-                    sys.exit()
+                    self._cerrar()
         elif self.estado_actual == "dificultad":
             resultado = self.menu_dificultad.manejar_evento(evento)
             if resultado:
                 accion = resultado.get("accion")
                 if accion == "cambiar_dificultad":
+                    # El nivel de la nueva dificultad se genera al pulsar Jugar
                     self.dificultad_actual = resultado.get("dificultad")
-                    self._inicializar_juego()
+                    self.menu_principal.dificultad_actual = self.dificultad_actual
+                    self.pantalla_juego = None
                     self.estado_actual = "menu_principal"
                 elif accion == "menu_principal":
                     self.estado_actual = "menu_principal"
@@ -141,6 +191,10 @@ class Juego:
             if accion:
                 if accion == "menu_principal":
                     self.estado_actual = "menu_principal"
+        elif self.estado_actual == "infinito":
+            accion = self.pantalla_infinita.manejar_evento(evento)
+            if accion == "menu_principal":
+                self.estado_actual = "menu_principal"
     
     def _actualizar_estado(self) -> None:
         """
@@ -156,17 +210,37 @@ class Juego:
             accion = self.pantalla_juego.actualizar()
             if accion == "menu_principal":
                 self.estado_actual = "menu_principal"
+        
+        elif self.estado_actual == "infinito":
+            accion = self.pantalla_infinita.actualizar()
+            if accion == "menu_principal":
+                self.estado_actual = "menu_principal"
     
-    def _renderizar_estado(self) -> None:
+    def _renderizar_estado(self) -> List[pygame.Rect]:
         """
         Renderiza el estado actual del juego.
+        
+        Cada pantalla solo dibuja lo que ha cambiado desde el frame anterior;
+        si la ventana mostraba otra pantalla, se le pide que se dibuje entera.
+        
+        Returns:
+            Rectángulos de la ventana que han cambiado.
         """
         if self.estado_actual == "menu_principal":
-            self.menu_principal.dibujar(self.ventana)
+            pantalla = self.menu_principal
         elif self.estado_actual == "dificultad":
-            self.menu_dificultad.dibujar(self.ventana)
+            pantalla = self.menu_dificultad
         elif self.estado_actual == "jugando":
-            self.pantalla_juego.dibujar(self.ventana)
+            pantalla = self.pantalla_juego
+        elif self.estado_actual == "infinito":
+            pantalla = self.pantalla_infinita
+        else:
+            return []
+        
+        if pantalla is not self.pantalla_presentada:
+            pantalla.invalidar()
+            self.pantalla_presentada = pantalla
+        return pantalla.dibujar(self.ventana)
 
 
 if __name__ == "__main__":
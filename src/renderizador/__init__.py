@@ -5,4 +5,5 @@ Este paquete contiene los módulos relacionados con la visualización
 y la interfaz gráfica del juego.
 """
 
-from .pantalla import MenuPrincipal, MenuDificultad, PantallaJuego, Boton
+from .pantalla import MenuPrincipal, MenuDificultad, PantallaJuego, PantallaInfinita, Boton
+from .dibujo import dibujar_laberinto, dibujar_celdas, dibujar_marcas, rasterizar_celdas
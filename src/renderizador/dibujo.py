@@ -0,0 +1,145 @@
+"""
+Módulo de dibujo del laberinto.
+
+Este módulo contiene las funciones que dibujan un Laberinto con pygame. Están
+separadas del modelo (generador.laberinto) para que generar laberintos no
+requiera importar pygame.
+
+Las celdas no se dibujan una a una con pygame.draw: rasterizar_celdas
+escribe los píxeles de una región entera con NumPy a través de
+pygame.surfarray (cada celda escalada a TAMANO_CELDA x TAMANO_CELDA píxeles
+y los caminos recortados con la máscara de su borde).
+"""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+import pygame
+
+from configuracion.config import TAMANO_CELDA, GROSOR_PARED, BLANCO, NEGRO, ROJO, VERDE
+from generador.laberinto import Laberinto
+from utilidades.helpers import calcular_centro_celda
+
+
+def dibujar_laberinto(laberinto: Laberinto, superficie: pygame.Surface) -> None:
+    """
+    Dibuja el laberinto en la superficie proporcionada.
+
+    Args:
+        laberinto: Laberinto a dibujar.
+        superficie: Superficie de pygame donde dibujar el laberinto.
+    """
+    dibujar_celdas(laberinto, superficie)
+    dibujar_marcas(laberinto, superficie)
+
+
+@lru_cache(maxsize=None)
+def _mascara_camino() -> np.ndarray:
+    """
+    Calcula qué píxeles de una celda de camino son blancos.
+
+    Se dibuja una sola celda de camino con pygame.draw (fondo blanco y borde
+    negro de GROSOR_PARED), de modo que la máscara reproduce exactamente los
+    píxeles de pygame.draw.rect.
+
+    Returns:
+        Array bool de forma (TAMANO_CELDA, TAMANO_CELDA), indexado [x, y].
+    """
+    celda = pygame.Surface((TAMANO_CELDA, TAMANO_CELDA))
+    celda.fill(BLANCO)
+    pygame.draw.rect(celda, NEGRO, (0, 0, TAMANO_CELDA, TAMANO_CELDA), GROSOR_PARED)
+    return (pygame.surfarray.array3d(celda) == BLANCO).all(axis=2)
+
+
+def rasterizar_celdas(celdas: np.ndarray, superficie: pygame.Surface,
+                      posicion: Tuple[int, int] = (0, 0)) -> None:
+    """
+    Escribe los píxeles de una región de celdas directamente en la superficie.
+
+    Args:
+        celdas: Región de la matriz del laberinto (0 = camino, 1 = pared).
+        superficie: Superficie de pygame de 32 bits donde escribir los píxeles.
+        posicion: Posición (x, y) en píxeles de la esquina superior izquierda
+                  de la región, que debe caber entera en la superficie.
+    """
+    caminos = np.asarray(celdas).T == 0
+    columnas, filas = caminos.shape
+    if not caminos.size:
+        return
+
+    # Celda de camino con los colores ya en el formato de píxel de la superficie
+    negro = np.uint32(superficie.map_rgb(NEGRO))
+    celda = np.where(_mascara_camino(), np.uint32(superficie.map_rgb(BLANCO)), negro)
+
+    # Cada celda se amplía a un bloque de píxeles; separar los ejes x e y en
+    # (celda, píxel) da siempre una vista de la superficie, sin copias
+    x, y = posicion
+    pixeles = pygame.surfarray.pixels2d(superficie)[x:x + columnas * TAMANO_CELDA,
+                                                    y:y + filas * TAMANO_CELDA]
+    bloques = pixeles.reshape(columnas, TAMANO_CELDA, filas, TAMANO_CELDA)
+    bloques[...] = np.where(caminos[:, np.newaxis, :, np.newaxis],
+                            celda[np.newaxis, :, np.newaxis, :], negro)
+
+
+def dibujar_celdas(laberinto: Laberinto, superficie: pygame.Surface,
+                   filas: Optional[Tuple[int, int]] = None,
+                   columnas: Optional[Tuple[int, int]] = None,
+                   origen: Tuple[int, int] = (0, 0)) -> None:
+    """
+    Dibuja las paredes y los caminos del laberinto, sin el inicio ni la meta.
+
+    Solo depende de la matriz, así que el resultado se puede guardar y
+    reutilizar mientras la matriz no cambie. Cada celda pinta por completo su
+    propio cuadrado, de modo que dibujar una región da los mismos píxeles que
+    dibujar el laberinto entero.
+
+    Args:
+        laberinto: Laberinto a dibujar.
+        superficie: Superficie de pygame donde dibujar las celdas.
+        filas: Rango [primera, última) de filas a dibujar (por defecto todas).
+        columnas: Rango [primera, última) de columnas a dibujar (por defecto todas).
+        origen: Celda (fila, columna) que corresponde a la esquina superior
+                izquierda de la superficie.
+    """
+    # Asegurar que inicio y meta sean caminos antes de dibujar
+    laberinto.matriz[laberinto.inicio] = 0
+    laberinto.matriz[laberinto.meta] = 0
+
+    primera_fila, ultima_fila = filas or (0, laberinto.filas)
+    primera_columna, ultima_columna = columnas or (0, laberinto.columnas)
+    celdas = laberinto.matriz[primera_fila:ultima_fila, primera_columna:ultima_columna]
+    region = pygame.Rect((primera_columna - origen[1]) * TAMANO_CELDA, (primera_fila - origen[0]) * TAMANO_CELDA,
+                         celdas.shape[1] * TAMANO_CELDA, celdas.shape[0] * TAMANO_CELDA)
+
+    # Si la región se sale de la superficie, o esta no es de 32 bits (por
+    # ejemplo una ventana de 24), se rasteriza aparte y se compone con blit,
+    # que recorta y convierte el formato de píxel
+    if superficie.get_bitsize() == 32 and superficie.get_rect().contains(region):
+        rasterizar_celdas(celdas, superficie, region.topleft)
+    elif region.colliderect(superficie.get_rect()):
+        intermedia = pygame.Surface(region.size, depth=32)
+        rasterizar_celdas(celdas, intermedia)
+        superficie.blit(intermedia, region)
+
+
+def dibujar_marcas(laberinto: Laberinto, superficie: pygame.Surface,
+                   desplazamiento: Tuple[int, int] = (0, 0),
+                   vista: Optional[pygame.Rect] = None) -> None:
+    """
+    Dibuja las marcas del inicio (círculo rojo) y de la meta (círculo verde).
+
+    Args:
+        laberinto: Laberinto cuyas marcas se dibujan.
+        superficie: Superficie de pygame donde dibujar las marcas.
+        desplazamiento: Posición (x, y) de la superficie dentro del
+                        laberinto, que se resta a la de las marcas.
+        vista: Rectángulo del laberinto, en píxeles, fuera del cual no se
+               dibujan las marcas (por defecto se dibujan siempre).
+    """
+    for celda, color in ((laberinto.inicio, ROJO), (laberinto.meta, VERDE)):
+        centro_x, centro_y = calcular_centro_celda(*celda, TAMANO_CELDA)
+        if vista is not None and not vista.collidepoint(centro_y, centro_x):
+            continue
+        pygame.draw.circle(superficie, color, (centro_y - desplazamiento[0], centro_x - desplazamiento[1]),
+                          TAMANO_CELDA // 3)
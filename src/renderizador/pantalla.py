@@ -6,15 +6,18 @@ incluyendo la pantalla principal, menús y efectos visuales.
 """
 
 import pygame
+from collections import OrderedDict
 from typing import Tuple, List, Dict, Any, Optional, Callable
 
 from configuracion.config import (
     ANCHO_VENTANA, ALTO_VENTANA, FPS, NEGRO, BLANCO, GRIS, 
     ROJO, VERDE, AZUL, AMARILLO, CELESTE, NARANJA, MORADO,
     TAMANO_FUENTE_PEQUENA, TAMANO_FUENTE_MEDIANA, TAMANO_FUENTE_GRANDE,
-    NIVELES_DIFICULTAD, TITULO, TAMANO_CELDA
+    NIVELES_DIFICULTAD, TITULO, TAMANO_CELDA,
+    SUPERFICIES_EN_CACHE, MARGEN_PRECARGA, MARGEN_CAPA
 )
 from utilidades.helpers import dibujar_texto, formatear_tiempo, Temporizador, calcular_centro_celda
+from renderizador.dibujo import dibujar_celdas, dibujar_marcas, rasterizar_celdas
 
 
 class Boton:
@@ -81,6 +84,11 @@ class Boton:
 class Menu:
     """
     Clase base para los diferentes menús del juego.
+    
+    Los menús son estáticos salvo por el resaltado de los botones, así que
+    solo se dibujan enteros la primera vez (o tras invalidar); en los frames
+    siguientes se vuelven a dibujar únicamente los botones cuyo resaltado ha
+    cambiado, y dibujar devuelve sus rectángulos para pygame.display.update.
     """
     
     def __init__(self):
@@ -88,6 +96,16 @@ class Menu:
         Inicializa un nuevo menú.
         """
         self.botones = []
+        
+        # Estado con el que se dibujó el menú por última vez (None si hay
+        # que dibujarlo entero)
+        self._estado_dibujado = None
+    
+    def invalidar(self) -> None:
+        """
+        Fuerza a dibujar el menú entero en el siguiente frame.
+        """
+        self._estado_dibujado = None
     
     def manejar_evento(self, evento: pygame.event.Event) -> Optional[str]:
         """
@@ -110,14 +128,62 @@ class Menu:
         """
         return None
     
-    def dibujar(self, superficie: pygame.Surface) -> None:
+    def dibujar(self, superficie: pygame.Surface) -> List[pygame.Rect]:
         """
-        Dibuja el menú en la superficie proporcionada.
+        Dibuja en la superficie proporcionada lo que ha cambiado del menú.
         
         Args:
             superficie: Superficie de pygame donde dibujar el menú.
+            
+        Returns:
+            Rectángulos de la superficie que han cambiado.
         """
-        pass
+        botones = self._todos_los_botones()
+        estado = (self._estado_fondo(), [boton.hover for boton in botones])
+        anterior, self._estado_dibujado = self._estado_dibujado, estado
+        
+        # Mismo fondo: volver a dibujar solo los botones que han cambiado
+        if anterior is not None and anterior[0] == estado[0]:
+            cambiados = []
+            for boton, antes in zip(botones, anterior[1]):
+                if boton.hover != antes:
+                    superficie.fill(BLANCO, boton.rect)
+                    boton.dibujar(superficie)
+                    cambiados.append(boton.rect)
+            return cambiados
+        
+        self._dibujar_fondo(superficie)
+        for boton in botones:
+            boton.dibujar(superficie)
+        return [superficie.get_rect()]
+    
+    def _todos_los_botones(self) -> List[Boton]:
+        """
+        Obtiene los botones del menú.
+        
+        Returns:
+            Lista de botones.
+        """
+        return self.botones
+    
+    def _estado_fondo(self) -> Tuple:
+        """
+        Resume lo que se dibuja en el fondo del menú; si cambia, el menú se
+        dibuja entero.
+        
+        Returns:
+            Tupla comparable entre frames.
+        """
+        return ()
+    
+    def _dibujar_fondo(self, superficie: pygame.Surface) -> None:
+        """
+        Dibuja todo el menú salvo los botones.
+        
+        Args:
+            superficie: Superficie de pygame donde dibujar el fondo.
+        """
+        superficie.fill(BLANCO)
 
 
 class MenuPrincipal(Menu):
@@ -135,9 +201,10 @@ class MenuPrincipal(Menu):
         centro_x = ANCHO_VENTANA // 2
         
         self.botones = [
-            Boton(centro_x, 200, 300, 60, "Jugar", VERDE),
-            Boton(centro_x, 300, 300, 60, "Seleccionar dificultad", AZUL),
-            Boton(centro_x, 400, 300, 60, "Salir", ROJO)
+            Boton(centro_x, 180, 300, 60, "Jugar", VERDE),
+            Boton(centro_x, 260, 300, 60, "Seleccionar dificultad", AZUL),
+            Boton(centro_x, 340, 300, 60, "Modo infinito", MORADO),
+            Boton(centro_x, 420, 300, 60, "Salir", ROJO)
         ]
         
         # Dificultad actual
@@ -171,6 +238,8 @@ class MenuPrincipal(Menu):
             elif self.botones[1].actualizar(pos_mouse):
                 return "dificultad"
             elif self.botones[2].actualizar(pos_mouse):
+                return "infinito"
+            elif self.botones[3].actualizar(pos_mouse):
                 return "salir"
                 
         return None
@@ -190,9 +259,18 @@ class MenuPrincipal(Menu):
         
         return None
     
-    def dibujar(self, superficie: pygame.Surface) -> None:
+    def _estado_fondo(self) -> Tuple:
+        """
+        Resume lo que se dibuja en el fondo del menú principal.
+        
+        Returns:
+            Tupla con la dificultad actual.
         """
-        Dibuja el menú principal en la superficie proporcionada.
+        return (self.dificultad_actual,)
+    
+    def _dibujar_fondo(self, superficie: pygame.Surface) -> None:
+        """
+        Dibuja el menú principal salvo los botones.
         
         Args:
             superficie: Superficie de pygame donde dibujar el menú.
@@ -204,10 +282,6 @@ class MenuPrincipal(Menu):
         dibujar_texto(superficie, "Generador de laberintos", TAMANO_FUENTE_GRANDE, 
                      ANCHO_VENTANA // 2, 100, NEGRO)
         
-        # Dibujar botones
-        for boton in self.botones:
-            boton.dibujar(superficie)
-        
         # Dibujar dificultad actual
         dibujar_texto(superficie, f"Dificultad: {self.dificultad_actual}", 
                      TAMANO_FUENTE_PEQUENA, ANCHO_VENTANA // 2, 500, NEGRO)
@@ -289,9 +363,18 @@ class MenuDificultad(Menu):
         
         return None
     
-    def dibujar(self, superficie: pygame.Surface) -> None:
+    def _todos_los_botones(self) -> List[Boton]:
         """
-        Dibuja el menú de dificultad en la superficie proporcionada.
+        Obtiene los botones de dificultad y el botón de volver.
+        
+        Returns:
+            Lista de botones.
+        """
+        return self.botones + [self.boton_volver]
+    
+    def _dibujar_fondo(self, superficie: pygame.Surface) -> None:
+        """
+        Dibuja el menú de dificultad salvo los botones.
         
         Args:
             superficie: Superficie de pygame donde dibujar el menú.
@@ -302,13 +385,6 @@ class MenuDificultad(Menu):
         # Dibujar título
         dibujar_texto(superficie, "Seleccionar dificultad", TAMANO_FUENTE_GRANDE, 
                      ANCHO_VENTANA // 2, 80, NEGRO)
-        
-        # Dibujar botones de dificultad
-        for boton in self.botones:
-            boton.dibujar(superficie)
-        
-        # Dibujar botón volver
-        self.boton_volver.dibujar(superficie)
 
 
 class PantallaCarga:
@@ -337,12 +413,15 @@ class PantallaCarga:
         self.rect_version = self.texto_version.get_rect(bottomleft=(10, ALTO_VENTANA - 30))
         self.rect_creador = self.texto_creador.get_rect(bottomleft=(10, ALTO_VENTANA - 10))
     
-    def dibujar(self, superficie: pygame.Surface) -> None:
+    def dibujar(self, superficie: pygame.Surface) -> List[pygame.Rect]:
         """
         Dibuja la pantalla de carga.
         
         Args:
             superficie: Superficie de pygame donde dibujar la pantalla.
+            
+        Returns:
+            Rectángulos de la superficie que han cambiado (toda la pantalla).
         """
         # Fondo
         superficie.fill(NEGRO)
@@ -353,11 +432,29 @@ class PantallaCarga:
         # Información de versión y creador
         superficie.blit(self.texto_version, self.rect_version)
         superficie.blit(self.texto_creador, self.rect_creador)
+        
+        return [superficie.get_rect()]
 
 
 class PantallaJuego:
     """
     Pantalla principal del juego donde se muestra el laberinto.
+    
+    Las paredes y los caminos se rasterizan en una capa que solo cubre las
+    celdas de la cámara más MARGEN_CAPA celdas por cada lado, así que su
+    tamaño y el coste de cada frame dependen de la ventana y no del
+    laberinto. La capa se guarda entre frames: cuando la cámara se acerca a
+    su borde se desplaza y solo se dibujan las celdas que entran. La capa no
+    vuelve a comparar la matriz, así que el código que modifique la matriz
+    en el propio laberinto debe llamar a invalidar_capa() para que se dibuje
+    entera de nuevo. En cada frame se copia la parte visible de la capa y se
+    dibujan encima las marcas de inicio y meta y el jugador si están cerca
+    de la cámara.
+    
+    Si nada de lo que se ve ha cambiado desde el frame anterior no se dibuja
+    nada. Si la cámara está quieta, dibujar solo devuelve los rectángulos del
+    jugador, de la interfaz o del botón que han cambiado, para que la
+    ventana se actualice únicamente ahí.
     """
     
     def __init__(self, laberinto, jugador):
@@ -374,11 +471,28 @@ class PantallaJuego:
         # Temporizador
         self.temporizador = Temporizador()
         
-        # Superficie para dibujar el laberinto (puede ser más grande que la ventana)
+        # Tamaño del laberinto en píxeles
+        self.ancho_laberinto = laberinto.columnas * TAMANO_CELDA
+        self.alto_laberinto = laberinto.filas * TAMANO_CELDA
+        
+        # Capa con las celdas ya dibujadas alrededor de la cámara, celda
+        # (fila, columna) de su esquina superior izquierda y si sigue
+        # correspondiendo a la matriz
+        self.filas_capa = min(laberinto.filas, ALTO_VENTANA // TAMANO_CELDA + 2 + 2 * MARGEN_CAPA)
+        self.columnas_capa = min(laberinto.columnas, ANCHO_VENTANA // TAMANO_CELDA + 2 + 2 * MARGEN_CAPA)
+        # Siempre de 32 bits para que rasterizar_celdas pueda escribir sus píxeles
         self.superficie_laberinto = pygame.Surface((
-            laberinto.columnas * TAMANO_CELDA,
-            laberinto.filas * TAMANO_CELDA
-        ))
+            self.columnas_capa * TAMANO_CELDA,
+            self.filas_capa * TAMANO_CELDA
+        ), depth=32)
+        self.origen_capa = (0, 0)
+        self._capa_valida = False
+        
+        # Lo que se veía en el último frame dibujado (None si hay que dibujar
+        # la pantalla entera) y rectángulos que ocupaban el jugador y el
+        # indicador de la meta
+        self._estado_dibujado = None
+        self._rects_jugador = []
         
         # Desplazamiento de la cámara
         self.camara_x = 0
@@ -407,6 +521,9 @@ class PantallaJuego:
         self.texto_creador = self.fuente_info.render(self.creador, True, GRIS)
         self.rect_version = self.texto_version.get_rect(bottomleft=(10, ALTO_VENTANA - 30))
         self.rect_creador = self.texto_creador.get_rect(bottomleft=(10, ALTO_VENTANA - 10))
+        
+        # Zona del panel superior y del recuadro de la distancia a la meta
+        self.rect_panel_superior = pygame.Rect(0, 0, ANCHO_VENTANA, 55)
     
     def reiniciar(self, tiempo_limite: Optional[int] = None) -> None:
         """
@@ -417,6 +534,7 @@ class PantallaJuego:
         """
         self.jugador.reiniciar()
         self.temporizador.reiniciar(tiempo_limite)
+        self.invalidar_capa()
         self.juego_terminado = False
         self.victoria = False
     
@@ -492,8 +610,8 @@ class PantallaJuego:
         camara_deseada_y = y - ALTO_VENTANA // 2
         
         # Limitar la cámara a los bordes del laberinto
-        max_camara_x = max(0, self.superficie_laberinto.get_width() - ANCHO_VENTANA)
-        max_camara_y = max(0, self.superficie_laberinto.get_height() - ALTO_VENTANA)
+        max_camara_x = max(0, self.ancho_laberinto - ANCHO_VENTANA)
+        max_camara_y = max(0, self.alto_laberinto - ALTO_VENTANA)
         
         # Suavizar el movimiento de la cámara (interpolación lineal)
         factor_suavizado = 0.1
@@ -504,27 +622,138 @@ class PantallaJuego:
         self.camara_x = int(self.camara_x)
         self.camara_y = int(self.camara_y)
     
-    def dibujar(self, superficie: pygame.Surface) -> None:
+    def invalidar(self) -> None:
+        """
+        Fuerza a dibujar la pantalla entera en el siguiente frame.
+        """
+        self._estado_dibujado = None
+    
+    def invalidar_capa(self) -> None:
+        """
+        Fuerza a volver a dibujar la capa del laberinto en el siguiente frame.
+        
+        Hay que llamarlo siempre que cambie la matriz del laberinto, porque la
+        capa no la vuelve a comparar en cada frame.
+        """
+        self._capa_valida = False
+    
+    def _actualizar_capa(self) -> bool:
+        """
+        Mantiene la capa del laberinto alrededor de la cámara.
+        
+        Si la capa es válida y ya cubre todas las celdas visibles no se hace
+        nada. Si la cámara ha salido de la capa, se recoloca con la cámara en
+        el centro: la parte que se conserva se desplaza con Surface.scroll y
+        solo se dibujan las celdas nuevas. Si se ha invalidado con
+        invalidar_capa(), se dibuja entera.
+        
+        Returns:
+            True si se ha dibujado alguna parte de la capa.
         """
-        Dibuja la pantalla de juego en la superficie proporcionada.
+        # Celdas visibles [primera, última) en filas y columnas
+        visibles_filas = (self.camara_y // TAMANO_CELDA,
+                          min(self.laberinto.filas, (self.camara_y + ALTO_VENTANA - 1) // TAMANO_CELDA + 1))
+        visibles_columnas = (self.camara_x // TAMANO_CELDA,
+                             min(self.laberinto.columnas, (self.camara_x + ANCHO_VENTANA - 1) // TAMANO_CELDA + 1))
+        
+        fila, columna = self.origen_capa
+        valida = self._capa_valida
+        cubre = (fila <= visibles_filas[0] and visibles_filas[1] <= fila + self.filas_capa and
+                 columna <= visibles_columnas[0] and visibles_columnas[1] <= columna + self.columnas_capa)
+        if valida and cubre:
+            return False
+        
+        # Nuevo origen con la cámara centrada en la capa
+        nueva_fila, nueva_columna = self.origen_capa
+        if not cubre:
+            nueva_fila = max(0, min(visibles_filas[0] - MARGEN_CAPA, self.laberinto.filas - self.filas_capa))
+            nueva_columna = max(0, min(visibles_columnas[0] - MARGEN_CAPA,
+                                       self.laberinto.columnas - self.columnas_capa))
+        filas = (nueva_fila, nueva_fila + self.filas_capa)
+        columnas = (nueva_columna, nueva_columna + self.columnas_capa)
+        
+        # Región que se conserva de la capa anterior
+        comunes_filas = (max(fila, filas[0]), min(fila + self.filas_capa, filas[1]))
+        comunes_columnas = (max(columna, columnas[0]), min(columna + self.columnas_capa, columnas[1]))
+        
+        if valida and comunes_filas[0] < comunes_filas[1] and comunes_columnas[0] < comunes_columnas[1]:
+            self.superficie_laberinto.scroll((columna - nueva_columna) * TAMANO_CELDA,
+                                             (fila - nueva_fila) * TAMANO_CELDA)
+            # Bandas de filas nuevas y, entre ellas, bandas de columnas nuevas
+            regiones = [((filas[0], comunes_filas[0]), columnas),
+                        ((comunes_filas[1], filas[1]), columnas),
+                        (comunes_filas, (columnas[0], comunes_columnas[0])),
+                        (comunes_filas, (comunes_columnas[1], columnas[1]))]
+        else:
+            regiones = [(filas, columnas)]
+        
+        for filas_region, columnas_region in regiones:
+            if filas_region[0] < filas_region[1] and columnas_region[0] < columnas_region[1]:
+                dibujar_celdas(self.laberinto, self.superficie_laberinto, filas_region, columnas_region,
+                               (nueva_fila, nueva_columna))
+        
+        self.origen_capa = (nueva_fila, nueva_columna)
+        self._capa_valida = True
+        return True
+    
+    def _estado_visible(self) -> Dict[str, Any]:
+        """
+        Resume por zonas lo que se ve en pantalla, para saber qué ha cambiado
+        desde el último frame dibujado.
+        
+        Returns:
+            Diccionario {zona: valor comparable entre frames}.
+        """
+        return {
+            "camara": (self.camara_x, self.camara_y),
+            "jugador": (self.jugador.posicion, self.jugador.tamano_animado),
+            "interfaz": self._textos_interfaz(),
+            "boton": self.boton_volver_menu.hover,
+            "fin": (self.juego_terminado, self.victoria,
+                    self.boton_reiniciar.hover, self.boton_menu.hover),
+        }
+    
+    def dibujar(self, superficie: pygame.Surface) -> List[pygame.Rect]:
+        """
+        Dibuja la pantalla de juego en la superficie proporcionada si ha
+        cambiado algo desde el último frame.
         
         Args:
             superficie: Superficie de pygame donde dibujar la pantalla.
+            
+        Returns:
+            Rectángulos de la superficie que han cambiado (vacío si no ha
+            cambiado nada).
         """
+        capa_redibujada = self._actualizar_capa()
+        estado = self._estado_visible()
+        anterior = self._estado_dibujado
+        if estado == anterior and not capa_redibujada:
+            return []
+        
         # Limpiar superficie
         superficie.fill(BLANCO)
         
-        # Dibujar laberinto en la superficie del laberinto
-        self.superficie_laberinto.fill(BLANCO)
-        self.laberinto.dibujar(self.superficie_laberinto)
-        self.jugador.dibujar(self.superficie_laberinto)
-        
-        # Dibujar parte visible del laberinto en la superficie principal
+        # Copiar la parte visible de la capa del laberinto en la superficie principal
+        fila, columna = self.origen_capa
         superficie.blit(self.superficie_laberinto, (0, 0), 
-                       (self.camara_x, self.camara_y, ANCHO_VENTANA, ALTO_VENTANA))
+                       (self.camara_x - columna * TAMANO_CELDA, self.camara_y - fila * TAMANO_CELDA,
+                        ANCHO_VENTANA, ALTO_VENTANA))
+        
+        # Dibujar inicio, meta y jugador en coordenadas de pantalla, solo si
+        # están a menos de una celda de la cámara
+        camara = (self.camara_x, self.camara_y)
+        vista = pygame.Rect(self.camara_x, self.camara_y, ANCHO_VENTANA, ALTO_VENTANA).inflate(
+            2 * TAMANO_CELDA, 2 * TAMANO_CELDA)
+        dibujar_marcas(self.laberinto, superficie, camara, vista)
+        rects_jugador = []
+        if vista.collidepoint(self.jugador.posicion):
+            rects_jugador.append(self.jugador.dibujar(superficie, camara))
         
         # Dibujar indicador de dirección hacia la meta si no está visible
-        self._dibujar_indicador_meta(superficie)
+        rect_indicador = self._dibujar_indicador_meta(superficie)
+        if rect_indicador is not None:
+            rects_jugador.append(rect_indicador)
         
         # Dibujar interfaz
         self._dibujar_interfaz(superficie)
@@ -532,6 +761,48 @@ class PantallaJuego:
         # Si el juego ha terminado, mostrar mensaje
         if self.juego_terminado:
             self._dibujar_fin_juego(superficie)
+        
+        # Con la cámara quieta solo cambian el jugador, la interfaz y el botón
+        if (anterior is None or capa_redibujada or self.juego_terminado or
+                estado["camara"] != anterior["camara"] or estado["fin"] != anterior["fin"]):
+            cambiados = [superficie.get_rect()]
+        else:
+            cambiados = []
+            if estado["jugador"] != anterior["jugador"]:
+                cambiados += self._rects_jugador + rects_jugador
+            if estado["interfaz"] != anterior["interfaz"]:
+                cambiados.append(self.rect_panel_superior)
+            if estado["boton"] != anterior["boton"]:
+                cambiados.append(self.boton_volver_menu.rect)
+        
+        self._estado_dibujado = estado
+        self._rects_jugador = rects_jugador
+        return cambiados
+    
+    def _textos_interfaz(self) -> Tuple:
+        """
+        Calcula los textos del panel superior.
+        
+        Returns:
+            Tupla (texto del tiempo, texto y color del tiempo restante o None
+            si no hay límite, texto de la distancia a la meta).
+        """
+        tiempo_transcurrido = self.temporizador.obtener_tiempo_transcurrido()
+        texto_tiempo = f"Tiempo: {formatear_tiempo(tiempo_transcurrido)}"
+        
+        # Tiempo restante si hay límite
+        restante = None
+        tiempo_restante = self.temporizador.obtener_tiempo_restante()
+        if tiempo_restante is not None:
+            texto_restante = f"Restante: {formatear_tiempo(tiempo_restante)}"
+            color = VERDE if tiempo_restante > 30 else AMARILLO if tiempo_restante > 10 else ROJO
+            restante = (texto_restante, color)
+        
+        # Distancia real a la meta recorriendo el laberinto
+        distancia = self.laberinto.distancia_a_meta(*self.jugador.celda)
+        texto_distancia = f"Distancia a meta: {distancia} celdas"
+        
+        return texto_tiempo, restante, texto_distancia
     
     def _dibujar_interfaz(self, superficie: pygame.Surface) -> None:
         """
@@ -540,29 +811,22 @@ class PantallaJuego:
         Args:
             superficie: Superficie de pygame donde dibujar la interfaz.
         """
+        texto_tiempo, restante, texto_distancia = self._textos_interfaz()
+        
         # Dibujar panel superior con tiempo
         pygame.draw.rect(superficie, GRIS, (0, 0, ANCHO_VENTANA, 40))
         
         # Dibujar tiempo transcurrido
-        tiempo_transcurrido = self.temporizador.obtener_tiempo_transcurrido()
-        texto_tiempo = f"Tiempo: {formatear_tiempo(tiempo_transcurrido)}"
         dibujar_texto(superficie, texto_tiempo, TAMANO_FUENTE_PEQUENA, 
                      ANCHO_VENTANA // 4, 20, BLANCO)
         
         # Dibujar tiempo restante si hay límite
-        tiempo_restante = self.temporizador.obtener_tiempo_restante()
-        if tiempo_restante is not None:
-            texto_restante = f"Restante: {formatear_tiempo(tiempo_restante)}"
-            color = VERDE if tiempo_restante > 30 else AMARILLO if tiempo_restante > 10 else ROJO
+        if restante is not None:
+            texto_restante, color = restante
             dibujar_texto(superficie, texto_restante, TAMANO_FUENTE_PEQUENA, 
                          3 * ANCHO_VENTANA // 4, 20, color)
         
-        # Dibujar información sobre la meta
-        meta_x, meta_y = calcular_centro_celda(*self.laberinto.meta, TAMANO_CELDA)
-        jugador_x, jugador_y = self.jugador.posicion
-        distancia = int(((meta_x - jugador_x) ** 2 + (meta_y - jugador_y) ** 2) ** 0.5 / TAMANO_CELDA)
-        
-        texto_distancia = f"Distancia a meta: {distancia} celdas"
+        # Dibujar información sobre la meta (distancia real recorriendo el laberinto)
         # Usar un fondo negro para el texto para que se vea mejor
         pygame.draw.rect(superficie, NEGRO, (ANCHO_VENTANA // 2 - 120, 35, 240, 20))
         dibujar_texto(superficie, texto_distancia, TAMANO_FUENTE_PEQUENA, 
@@ -578,12 +842,15 @@ class PantallaJuego:
         superficie.blit(self.texto_version, self.rect_version)
         superficie.blit(self.texto_creador, self.rect_creador)
     
-    def _dibujar_indicador_meta(self, superficie: pygame.Surface) -> None:
+    def _dibujar_indicador_meta(self, superficie: pygame.Surface) -> Optional[pygame.Rect]:
         """
         Dibuja un indicador de dirección hacia la meta cuando no está visible en la pantalla.
         
         Args:
             superficie: Superficie de pygame donde dibujar el indicador.
+            
+        Returns:
+            Rectángulo que ocupa el indicador, o None si no se ha dibujado.
         """
         # Obtener posición de la meta en coordenadas del mundo
         meta_x, meta_y = calcular_centro_celda(*self.laberinto.meta, TAMANO_CELDA)
@@ -665,14 +932,18 @@ class PantallaJuego:
             base2_y = indicador_y + int(perpendicular_y * tamano_flecha * 0.5)
             
             # Dibujar triángulo de la flecha
-            pygame.draw.polygon(superficie, color_flecha, [
+            rect_flecha = pygame.draw.polygon(superficie, color_flecha, [
                 (punta_x, punta_y),
                 (base1_x, base1_y),
                 (base2_x, base2_y)
             ])
             
             # Dibujar círculo en la base de la flecha
-            pygame.draw.circle(superficie, color_flecha, (indicador_x, indicador_y), tamano_flecha // 2)
+            rect_circulo = pygame.draw.circle(superficie, color_flecha, (indicador_x, indicador_y),
+                                              tamano_flecha // 2)
+            return rect_flecha.union(rect_circulo)
+        
+        return None
     
     def _dibujar_fin_juego(self, superficie: pygame.Surface) -> None:
         """
@@ -706,3 +977,283 @@ class PantallaJuego:
         # Dibujar botones
         self.boton_reiniciar.dibujar(superficie)
         self.boton_menu.dibujar(superficie)
+
+
+class PantallaInfinita:
+    """
+    Pantalla del modo infinito, donde el laberinto no tiene límites.
+    
+    El mundo se dibuja por fragmentos: cada fragmento se rasteriza una sola vez
+    en su propia superficie, que se guarda en una caché LRU, y en cada frame
+    solo se componen los fragmentos que cubren la cámara. Igual que en
+    PantallaJuego, si nada ha cambiado no se dibuja nada y, con la cámara
+    quieta, solo se devuelven los rectángulos que han cambiado.
+    """
+    
+    def __init__(self, mundo, jugador):
+        """
+        Inicializa la pantalla del modo infinito.
+        
+        Args:
+            mundo: Instancia del mundo infinito a mostrar.
+            jugador: Instancia del jugador.
+        """
+        self.mundo = mundo
+        self.jugador = jugador
+        
+        # Temporizador sin límite de tiempo
+        self.temporizador = Temporizador()
+        
+        # Superficies ya dibujadas de cada fragmento, de la menos a la más usada
+        self.superficies = OrderedDict()
+        self.lado_fragmento = mundo.tamano * TAMANO_CELDA
+        
+        # Desplazamiento de la cámara (sin límites)
+        x, y = jugador.posicion
+        self.camara_x = x - ANCHO_VENTANA // 2
+        self.camara_y = y - ALTO_VENTANA // 2
+        
+        # Botón para volver al menú (en la esquina inferior izquierda)
+        self.boton_volver_menu = Boton(70, ALTO_VENTANA - 20, 
+                                      100, 30, "Menú", ROJO)
+        
+        # Información de versión y creador
+        self.version = "Versión: 0.2 - Abril 2025"
+        self.creador = "Creador: github.com/686f6c61"
+        self.fuente_info = pygame.font.Font(None, TAMANO_FUENTE_PEQUENA)
+        self.texto_version = self.fuente_info.render(self.version, True, GRIS)
+        self.texto_creador = self.fuente_info.render(self.creador, True, GRIS)
+        self.rect_version = self.texto_version.get_rect(bottomleft=(10, ALTO_VENTANA - 30))
+        self.rect_creador = self.texto_creador.get_rect(bottomleft=(10, ALTO_VENTANA - 10))
+        self.rect_panel_superior = pygame.Rect(0, 0, ANCHO_VENTANA, 40)
+        
+        # Lo que se veía en el último frame dibujado (None si hay que dibujar
+        # la pantalla entera) y rectángulo que ocupaba el jugador
+        self._estado_dibujado = None
+        self._rect_jugador = None
+        
+        self._precargar()
+    
+    def invalidar(self) -> None:
+        """
+        Fuerza a dibujar la pantalla entera en el siguiente frame.
+        """
+        self._estado_dibujado = None
+    
+    def manejar_evento(self, evento: pygame.event.Event) -> Optional[str]:
+        """
+        Maneja los eventos de la pantalla del modo infinito.
+        
+        Args:
+            evento: Evento de pygame a manejar.
+            
+        Returns:
+            Acción a realizar o None si no hay acción.
+        """
+        if evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1:  # Clic izquierdo
+            pos_mouse = pygame.mouse.get_pos()
+            if self.boton_volver_menu.actualizar(pos_mouse):
+                return "menu_principal"
+        
+        self.jugador.manejar_evento(evento)
+        return None
+    
+    def actualizar(self) -> Optional[str]:
+        """
+        Actualiza el estado de la pantalla del modo infinito.
+        
+        Returns:
+            Acción a realizar o None si no hay acción.
+        """
+        self.boton_volver_menu.actualizar(pygame.mouse.get_pos())
+        self.jugador.actualizar()
+        self._actualizar_camara()
+        return None
+    
+    def _actualizar_camara(self) -> None:
+        """
+        Actualiza la posición de la cámara para seguir al jugador y precarga
+        los fragmentos que la rodean.
+        """
+        x, y = self.jugador.posicion
+        
+        # Suavizar el movimiento de la cámara (interpolación lineal)
+        factor_suavizado = 0.1
+        self.camara_x += (x - ANCHO_VENTANA // 2 - self.camara_x) * factor_suavizado
+        self.camara_y += (y - ALTO_VENTANA // 2 - self.camara_y) * factor_suavizado
+        
+        # Asegurar que los valores sean enteros para evitar problemas de renderizado
+        self.camara_x = int(self.camara_x)
+        self.camara_y = int(self.camara_y)
+        
+        self._precargar()
+    
+    def _fragmentos_visibles(self, margen: int = 0) -> List[Tuple[int, int]]:
+        """
+        Calcula los fragmentos que cubren la cámara más un margen.
+        
+        Args:
+            margen: Número de fragmentos extra alrededor de la cámara.
+            
+        Returns:
+            Lista de pares (fila_fragmento, columna_fragmento).
+        """
+        extra = margen * self.mundo.tamano
+        return self.mundo.fragmentos_en_rango(
+            self.camara_y // TAMANO_CELDA - extra,
+            (self.camara_y + ALTO_VENTANA) // TAMANO_CELDA + extra,
+            self.camara_x // TAMANO_CELDA - extra,
+            (self.camara_x + ANCHO_VENTANA) // TAMANO_CELDA + extra
+        )
+    
+    def _precargar(self) -> None:
+        """
+        Genera y dibuja por adelantado los fragmentos alrededor de la cámara.
+        """
+        for clave in self._fragmentos_visibles(MARGEN_PRECARGA):
+            self._obtener_superficie(*clave)
+    
+    def _obtener_superficie(self, fila_fragmento: int, columna_fragmento: int) -> pygame.Surface:
+        """
+        Obtiene la superficie dibujada de un fragmento, creándola si no está en caché.
+        
+        Args:
+            fila_fragmento: Fila del fragmento en la rejilla de fragmentos.
+            columna_fragmento: Columna del fragmento en la rejilla de fragmentos.
+            
+        Returns:
+            Superficie con el fragmento dibujado.
+        """
+        clave = (fila_fragmento, columna_fragmento)
+        superficie = self.superficies.get(clave)
+        
+        if superficie is None:
+            fragmento = self.mundo.obtener_fragmento(fila_fragmento, columna_fragmento)
+            superficie = self._dibujar_fragmento(fragmento)
+            self.superficies[clave] = superficie
+            
+            # Expulsar la superficie usada hace más tiempo si se supera la capacidad
+            if len(self.superficies) > SUPERFICIES_EN_CACHE:
+                self.superficies.popitem(last=False)
+        else:
+            self.superficies.move_to_end(clave)
+        
+        return superficie
+    
+    def _dibujar_fragmento(self, fragmento) -> pygame.Surface:
+        """
+        Dibuja las celdas de un fragmento en una superficie nueva.
+        
+        Args:
+            fragmento: Matriz del fragmento (0 = camino, 1 = pared).
+            
+        Returns:
+            Superficie con el fragmento dibujado.
+        """
+        superficie = pygame.Surface((self.lado_fragmento, self.lado_fragmento), depth=32)
+        rasterizar_celdas(fragmento, superficie)
+        return superficie
+    
+    def _estado_visible(self) -> Dict[str, Any]:
+        """
+        Resume por zonas lo que se ve en pantalla, para saber qué ha cambiado
+        desde el último frame dibujado.
+        
+        Returns:
+            Diccionario {zona: valor comparable entre frames}.
+        """
+        return {
+            "camara": (self.camara_x, self.camara_y),
+            "jugador": (self.jugador.posicion, self.jugador.tamano_animado),
+            "interfaz": self._textos_interfaz(),
+            "boton": self.boton_volver_menu.hover,
+        }
+    
+    def dibujar(self, superficie: pygame.Surface) -> List[pygame.Rect]:
+        """
+        Dibuja la pantalla del modo infinito en la superficie proporcionada si
+        ha cambiado algo desde el último frame.
+        
+        Args:
+            superficie: Superficie de pygame donde dibujar la pantalla.
+            
+        Returns:
+            Rectángulos de la superficie que han cambiado (vacío si no ha
+            cambiado nada).
+        """
+        estado = self._estado_visible()
+        anterior = self._estado_dibujado
+        if estado == anterior:
+            return []
+        
+        superficie.fill(BLANCO)
+        
+        # Componer solo los fragmentos que cubren la cámara
+        for fila_fragmento, columna_fragmento in self._fragmentos_visibles():
+            superficie.blit(self._obtener_superficie(fila_fragmento, columna_fragmento),
+                            (columna_fragmento * self.lado_fragmento - self.camara_x,
+                             fila_fragmento * self.lado_fragmento - self.camara_y))
+        
+        # Dibujar al jugador en coordenadas de pantalla
+        rect_jugador = self.jugador.dibujar(superficie, (self.camara_x, self.camara_y))
+        
+        self._dibujar_interfaz(superficie)
+        
+        # Con la cámara quieta solo cambian el jugador, la interfaz y el botón
+        if anterior is None or estado["camara"] != anterior["camara"]:
+            cambiados = [superficie.get_rect()]
+        else:
+            cambiados = []
+            if estado["jugador"] != anterior["jugador"]:
+                cambiados += [self._rect_jugador, rect_jugador]
+            if estado["interfaz"] != anterior["interfaz"]:
+                cambiados.append(self.rect_panel_superior)
+            if estado["boton"] != anterior["boton"]:
+                cambiados.append(self.boton_volver_menu.rect)
+        
+        self._estado_dibujado = estado
+        self._rect_jugador = rect_jugador
+        return cambiados
+    
+    def _textos_interfaz(self) -> Tuple[str, str]:
+        """
+        Calcula los textos del panel superior.
+        
+        Returns:
+            Tupla (texto del tiempo, texto de la distancia al inicio).
+        """
+        tiempo_transcurrido = self.temporizador.obtener_tiempo_transcurrido()
+        texto_tiempo = f"Tiempo: {formatear_tiempo(tiempo_transcurrido)}"
+        
+        fila, columna = self.jugador.celda
+        inicio_fila, inicio_columna = self.mundo.inicio
+        distancia = abs(fila - inicio_fila) + abs(columna - inicio_columna)
+        texto_distancia = f"Distancia al inicio: {distancia} celdas"
+        
+        return texto_tiempo, texto_distancia
+    
+    def _dibujar_interfaz(self, superficie: pygame.Surface) -> None:
+        """
+        Dibuja la interfaz del modo infinito (tiempo, posición y botones).
+        
+        Args:
+            superficie: Superficie de pygame donde dibujar la interfaz.
+        """
+        texto_tiempo, texto_distancia = self._textos_interfaz()
+        
+        # Dibujar panel superior con tiempo y distancia recorrida
+        pygame.draw.rect(superficie, GRIS, (0, 0, ANCHO_VENTANA, 40))
+        
+        dibujar_texto(superficie, texto_tiempo, TAMANO_FUENTE_PEQUENA, 
+                     ANCHO_VENTANA // 4, 20, BLANCO)
+        
+        dibujar_texto(superficie, texto_distancia, TAMANO_FUENTE_PEQUENA, 
+                     3 * ANCHO_VENTANA // 4, 20, AMARILLO)
+        
+        # Dibujar panel inferior para botones
+        pygame.draw.rect(superficie, GRIS, (0, ALTO_VENTANA - 40, ANCHO_VENTANA, 40))
+        self.boton_volver_menu.dibujar(superficie)
+        
+        # Dibujar información de versión y creador
+        superficie.blit(self.texto_version, self.rect_version)
+        superficie.blit(self.texto_creador, self.rect_creador)